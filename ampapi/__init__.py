@@ -28,24 +28,156 @@ __license__ = "GNU"
 __version__ = "1.3.1"
 __credits__ = "AMP by CubeCoders and associates."
 
-from typing import Literal, NamedTuple
-
-from . import dataclass as dataclass
-from . import enums as enums
-from . import modules as modules
-from . import types_ as types
-from . import util as util
-from .adsmodule import *
-from .analytics import *
-from .base import *
-from .bridge import *
-from .controller import *
-from .core import *
-from .emailsender import *
-from .filebackup import *
-from .filemanager import *
-from .instance import *
-from .minecraft import *
+import importlib
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+if TYPE_CHECKING:
+    from . import (
+        adsmodule as adsmodule,
+        analytics as analytics,
+        base as base,
+        bridge as bridge,
+        capability as capability,
+        codec as codec,
+        controller as controller,
+        core as core,
+        dataclass as dataclass,
+        decoder as decoder,
+        emailsender as emailsender,
+        enums as enums,
+        filebackup as filebackup,
+        filemanager as filemanager,
+        instance as instance,
+        minecraft as minecraft,
+        modules as modules,
+        session as session,
+        timestamp as timestamp,
+        transport as transport,
+        types_ as types,
+        types_ as types_,
+        util as util,
+    )
+    from .adsmodule import *
+    from .analytics import *
+    from .base import *
+    from .bridge import *
+    from .capability import *
+    from .codec import *
+    from .controller import *
+    from .core import *
+    from .decoder import *
+    from .emailsender import *
+    from .filebackup import *
+    from .filemanager import *
+    from .instance import *
+    from .minecraft import *
+    from .session import *
+    from .timestamp import *
+    from .transport import *
+
+# The submodules and public names and the module they live in; they are imported on first access (see `__getattr__`)
+# so `import ampapi` doesn't pay for `aiohttp`, `dataclass_wizard` and our 3000 line `dataclass` module up front.
+# Keep this in sync with the `__all__` of each module.
+_lazy_modules: dict[str, str] = {
+    "adsmodule": ".adsmodule",
+    "analytics": ".analytics",
+    "base": ".base",
+    "bridge": ".bridge",
+    "capability": ".capability",
+    "codec": ".codec",
+    "controller": ".controller",
+    "core": ".core",
+    "dataclass": ".dataclass",
+    "decoder": ".decoder",
+    "emailsender": ".emailsender",
+    "enums": ".enums",
+    "filebackup": ".filebackup",
+    "filemanager": ".filemanager",
+    "instance": ".instance",
+    "minecraft": ".minecraft",
+    "modules": ".modules",
+    "session": ".session",
+    "timestamp": ".timestamp",
+    "transport": ".transport",
+    "types": ".types_",
+    "types_": ".types_",
+    "util": ".util",
+}
+_lazy_imports: dict[str, str] = {
+    # .adsmodule
+    "ADSModule": ".adsmodule",
+    # .analytics
+    "AnalyticsPlugin": ".analytics",
+    # .base
+    "Base": ".base",
+    # .bridge
+    "Bridge": ".bridge",
+    # .capability
+    "CapabilityRegistry": ".capability",
+    "FileSpecCache": ".capability",
+    "SpecCache": ".capability",
+    # .codec
+    "JSONCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "StdlibJSONCodec": ".codec",
+    "get_default_codec": ".codec",
+    # .controller
+    "AMPControllerInstance": ".controller",
+    "InstanceIndex": ".controller",
+    # .core
+    "Core": ".core",
+    # .decoder
+    "DecoderRegistry": ".decoder",
+    "decoders": ".decoder",
+    # .emailsender
+    "EmailSenderPlugin": ".emailsender",
+    # .filebackup
+    "LocalFileBackupPlugin": ".filebackup",
+    # .filemanager
+    "FileManagerPlugin": ".filemanager",
+    # .instance
+    "AMPADSInstance": ".instance",
+    "AMPInstance": ".instance",
+    "AMPMinecraftInstance": ".instance",
+    # .minecraft
+    "MinecraftModule": ".minecraft",
+    # .session
+    "FileSessionStore": ".session",
+    "MemorySessionStore": ".session",
+    "SessionManager": ".session",
+    "SessionStore": ".session",
+    # .timestamp
+    "TimestampArray": ".timestamp",
+    "TimestampDecoder": ".timestamp",
+    "timestamps": ".timestamp",
+    # .transport
+    "CircuitBreaker": ".transport",
+    "ConfigBatcher": ".transport",
+    "Deadline": ".transport",
+    "RequestCoalescer": ".transport",
+    "RequestHedger": ".transport",
+    "RequestScheduler": ".transport",
+    "ResponseCache": ".transport",
+}
+
+# `from ampapi import *` still gives you every submodule and public name, like the eager imports used to.
+__all__ = (*_lazy_modules, *_lazy_imports, "version_info")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_modules:
+        value: Any = importlib.import_module(_lazy_modules[name], __name__)
+    elif name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so the next lookup doesn't go through `__getattr__` again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_imports))
 
 
 class VersionInfo(NamedTuple):
@@ -57,4 +189,4 @@ class VersionInfo(NamedTuple):
 
 version_info: VersionInfo = VersionInfo(Major=1, Minor=3, Revision=1, releaseLevel="release")
 
-del NamedTuple, Literal, VersionInfo
+del NamedTuple, Literal, VersionInfo, TYPE_CHECKING
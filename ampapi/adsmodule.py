@@ -699,7 +699,7 @@ class ADSModule(Base):
         return result
 
     # @Base.ADSonly
-    async def get_instance(self, instance_id: str, format_data: Union[bool, None] = None) -> Instance:
+    async def get_instance(self, instance_id: str, format_data: Union[bool, None] = None, lazy: bool = False) -> Instance:
         """|coro|
 
         Returns the Instance information for the provided Instance ID.\n
@@ -710,6 +710,8 @@ class ADSModule(Base):
             The Instance ID.
         format_data: Union[:class:`bool`, None], optional
             Format the JSON response data, by default None.
+        lazy: :class:`bool`, optional
+            Only decode the fields of the :class:`Instance` when they are first read, by default False.
 
         Returns
         --------
@@ -720,20 +722,22 @@ class ADSModule(Base):
         await self._connect()
         parameters: dict[str, str] = {"InstanceId": instance_id}
         result: Any = await self._call_api(
-            api="ADSModule/GetInstance", parameters=parameters, format_data=format_data, format_=Instance
+            api="ADSModule/GetInstance", parameters=parameters, format_data=format_data, format_=Instance, lazy=lazy
         )
         return result
 
     @Base.ads_only
     async def get_instances(
-        self, include_self: bool = True, format_data: Union[bool, None] = None
+        self, include_self: bool = True, format_data: Union[bool, None] = None, lazy: bool = False
     ) -> list[Union[Controller, Instance]]:
         """|coro|
 
         Returns a list of all Instances the Target ADS or Controller and AMP User has permission to access.\n
 
         .. note::
-            If ``include_self`` is False; we force ``format_data = False``
+            If ``include_self`` is False; we force ``format_data = False``\n
+            Most callers only read a few fields like ``instance_id``, ``running`` or ``app_state``;
+            ``lazy=True`` skips decoding the rest (eg :class:`PlatformInfo` or :class:`Metric`) until they are read.
 
 
         Parameters
@@ -742,6 +746,8 @@ class ADSModule(Base):
             Force include the Controller or Target ADS Instance in the results, by default True.
         format_data: Union[:class:`bool`, None], optional
             Format the JSON response data, by default None.
+        lazy: :class:`bool`, optional
+            Return lazy :class:`Controller` and :class:`Instance` views that decode a field the first time it is read, by default False.
 
         Returns
         --------
@@ -756,7 +762,7 @@ class ADSModule(Base):
             format_data = False
 
         result: Any = await self._call_api(
-            api="ADSModule/GetInstances", parameters=parameters, format_data=format_data, format_=Controller
+            api="ADSModule/GetInstances", parameters=parameters, format_data=format_data, format_=Controller, lazy=lazy
         )
         return result
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import functools
-import json
 import logging
 import re
+import reprlib
 from dataclasses import fields, is_dataclass
 from datetime import datetime
 from pprint import pformat
@@ -12,22 +13,26 @@ from typing import TYPE_CHECKING, Any, ClassVar, Union, overload
 
 import aiohttp
 from aiohttp import ClientResponse
-from dataclass_wizard import fromdict
-from pyotp import TOTP
 
 from .bridge import Bridge
-from .dataclass import APISession, Diagnostics, LoginResults, VersionInfo
+from .dataclass import APISession, Diagnostics, LoginResults, RawResponse, VersionInfo
+from .decoder import decoders
+from .enums import RequestPriority
+from .transport import Deadline
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine, Iterable
-    from datetime import timedelta
     from typing import Concatenate
 
     from _typeshed import DataclassInstance
+    from pyotp import TOTP
     from typing_extensions import ParamSpec, Self, TypeVar
 
-    from .dataclass import Controller, Instance, InstanceStatus, Updates
+    from .capability import CapabilityRegistry
+    from .dataclass import Controller, Instance, InstanceStatus, RetryPolicy, TimeoutSettings, Updates
     from .modules import APIResponseDataTableAlias
+    from .session import SessionManager
+    from .transport import CircuitBreaker, RequestCoalescer, RequestHedger, RequestScheduler, ResponseCache
 
     D = TypeVar("D", bound="Base")
     T = ParamSpec("T")
@@ -38,6 +43,54 @@ __all__ = ("Base",)
 
 FORMAT_DATA: bool = True
 
+_CAMEL_WORD_RE: re.Pattern[str] = re.compile(pattern="(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE: re.Pattern[str] = re.compile(pattern="([a-z0-9])([A-Z])")
+# Parameter keys that are never written to the logs.
+_REDACTED_KEYS: frozenset[str] = frozenset({"password", "sessionid", "token", "twofactorcode"})
+# Summarises payloads for the debug log without walking all of a large response; see `_LogPayload`.
+_PAYLOAD_REPR: reprlib.Repr = reprlib.Repr()
+_PAYLOAD_REPR.maxlevel = 4
+_PAYLOAD_REPR.maxdict = _PAYLOAD_REPR.maxlist = 25
+_PAYLOAD_REPR.maxstring = _PAYLOAD_REPR.maxother = 120
+
+
+class _LogPayload:
+    """
+    Formats a request or response payload for the debug log; only when the log record is actually emitted.
+
+    .. note::
+        Pass it as a logging argument (``logger.debug("%s", _LogPayload(data, limit))``) and the formatting is skipped
+        for records that are filtered out. With a ``limit`` the payload is summarised by :mod:`reprlib` and cut off,
+        otherwise it is :func:`pformat` in full. See :attr:`Base.log_payload_size`.
+
+
+    """
+
+    __slots__ = ("data", "limit")
+
+    def __init__(self, data: Any, limit: Union[int, None]) -> None:
+        self.data: Any = data
+        self.limit: Union[int, None] = limit
+
+    def __str__(self) -> str:
+        data: Any = self.data
+        size: int = len(data) if isinstance(data, (bytes, str, dict, list)) else 0
+        if self.limit == 0:
+            return f"<{type(data).__name__} len={size}>"
+        if isinstance(data, bytes):
+            data = data.decode(errors="replace")
+        elif isinstance(data, dict):
+            data = {key: "<redacted>" if str(key).lower() in _REDACTED_KEYS else value for key, value in data.items()}
+        if isinstance(data, str):
+            text: str = data
+        elif self.limit is None:
+            text = pformat(data)
+        else:
+            text = _PAYLOAD_REPR.repr(data)
+        if self.limit is not None and len(text) > self.limit:
+            return f"{text[: self.limit]}... <{type(self.data).__name__} len={size}, {len(text)} chars>"
+        return text
+
 
 class Base:
     """
@@ -65,7 +118,7 @@ class Base:
     """
 
     # Private Attributes
-    logger: logging.Logger = logging.getLogger()
+    logger: logging.Logger = logging.getLogger(__name__)
     _bridge: Bridge
 
     # Public Attributes
@@ -84,6 +137,174 @@ class Base:
     _unauthorized_access: str = "The user does not have the required permissions to interact with this instance."
     _instance_offline: str = "The requested Instance is not available at this time. | URL: %s"
     _version_unavailable: str = "The API call %s is no longer available at this version of AMP %s"
+    _circuit_open: str = "The requested Instance %s failed too many times; calls are paused for up to %ss."
+    _deadline_exceeded: str = "The API call %s did not finish before the deadline."
+
+    # Read-only endpoints that are safe to send more than once; identical concurrent calls share a single request
+    # and failed calls are retried. See :class:`RequestCoalescer` and :class:`RetryPolicy`.
+    # Never add an endpoint that changes state on AMP.
+    idempotent_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/GetApplicationEndpoints",
+            "ADSModule/GetDatastore",
+            "ADSModule/GetDatastoreInstances",
+            "ADSModule/GetDatastores",
+            "ADSModule/GetDeploymentTemplates",
+            "ADSModule/GetInstance",
+            "ADSModule/GetInstanceNetworkInfo",
+            "ADSModule/GetInstanceStatuses",
+            "ADSModule/GetInstances",
+            "ADSModule/GetLocalInstances",
+            "ADSModule/GetProvisionFitness",
+            "ADSModule/GetSupportedApplications",
+            "ADSModule/GetTargetInfo",
+            "Core/GetAPISpec",
+            "Core/GetConfig",
+            "Core/GetConfigs",
+            "Core/GetDiagnosticsInfo",
+            "Core/GetModuleInfo",
+            "Core/GetPermissionsSpec",
+            "Core/GetPortSummaries",
+            "Core/GetRoleData",
+            "Core/GetScheduleData",
+            "Core/GetSettingsSpec",
+            "Core/GetStatus",
+            "Core/GetTasks",
+            "Core/GetUpdateInfo",
+            "Core/GetUserList",
+            "FileManagerPlugin/GetDirectoryListing",
+            "LocalFileBackupPlugin/GetBackups",
+        }
+    )
+
+    # Endpoints our pollers hit; their requests wait in the background lane of the :class:`RequestScheduler`
+    # so interactive calls are not stuck behind them.
+    background_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/GetInstanceStatuses",
+            "AnalyticsPlugin/GetAnalyticsSummary",
+            "Core/GetAuditLogEntries",
+            "Core/GetUpdates",
+        }
+    )
+
+    # Read-mostly endpoints kept in the :class:`ResponseCache` of the :class:`Bridge` and for how many seconds they are fresh.
+    cache_ttls: ClassVar[dict[str, float]] = {
+        "ADSModule/GetDeploymentTemplates": 120.0,
+        "ADSModule/GetSupportedApplications": 600.0,
+        "Core/GetAPISpec": 3600.0,
+        "Core/GetDiagnosticsInfo": 300.0,
+        "Core/GetModuleInfo": 300.0,
+        "Core/GetPermissionsSpec": 3600.0,
+        "Core/GetRoleData": 60.0,
+        "Core/GetSettingsSpec": 60.0,
+    }
+
+    # Mutating endpoints and the cached endpoints of the same Instance they make stale, see :attr:`cache_ttls`.
+    cache_invalidations: ClassVar[dict[str, frozenset[str]]] = {
+        **dict.fromkeys(
+            (
+                "ADSModule/CloneTemplate",
+                "ADSModule/CreateDeploymentTemplate",
+                "ADSModule/DeleteDeploymentTemplate",
+                "ADSModule/UpdateDeploymentTemplate",
+            ),
+            frozenset({"ADSModule/GetDeploymentTemplates"}),
+        ),
+        **dict.fromkeys(
+            ("ADSModule/RefreshAppCache", "ADSModule/RefreshRemoteConfigStores"),
+            frozenset({"ADSModule/GetSupportedApplications"}),
+        ),
+        **dict.fromkeys(
+            (
+                "Core/CreateRole",
+                "Core/DeleteRole",
+                "Core/RenameRole",
+                "Core/SetAMPRolePermission",
+                "Core/SetAMPUserRoleMembership",
+            ),
+            frozenset({"Core/GetRoleData"}),
+        ),
+        **dict.fromkeys(
+            ("Core/RefreshSettingValueList", "Core/RefreshSettingsSourceCache", "Core/SetConfig", "Core/SetConfigs"),
+            frozenset({"Core/GetSettingsSpec"}),
+        ),
+        # A new AMP or application version can change all of them.
+        **dict.fromkeys(
+            ("Core/UpdateAMPInstance", "Core/UpdateApplication", "Core/UpgradeAMP"),
+            frozenset(
+                {
+                    "Core/GetAPISpec",
+                    "Core/GetDiagnosticsInfo",
+                    "Core/GetModuleInfo",
+                    "Core/GetPermissionsSpec",
+                    "Core/GetSettingsSpec",
+                }
+            ),
+        ),
+    }
+
+    # Endpoints that upgrade AMP; we forget the versions in the :class:`CapabilityRegistry` of the :class:`Bridge` after calling them.
+    version_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/UpgradeAllInstances",
+            "ADSModule/UpgradeInstance",
+            "Core/UpdateAMPInstance",
+            "Core/UpgradeAMP",
+        }
+    )
+
+    # Endpoints that need at least this version of AMP, see :meth:`version_validation` and :meth:`CapabilityRegistry.supports`.
+    endpoint_versions: ClassVar[dict[str, VersionInfo]] = {
+        "Core/UpdateAccountInfo": VersionInfo(2, 6, 0, 0),
+    }
+
+    # Latency critical reads that may be hedged, see :class:`RequestHedger`; must also be in `idempotent_endpoints`.
+    hedge_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/GetInstance",
+            "ADSModule/GetInstanceStatuses",
+            "Core/GetStatus",
+        }
+    )
+
+    # Endpoint classes for our request timeouts, anything not listed uses :attr:`TimeoutSettings.default`.
+    # See :class:`TimeoutSettings`.
+    fast_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/GetInstanceStatuses",
+            "Core/GetNewGuid",
+            "Core/GetStatus",
+            "Core/GetUpdates",
+        }
+    )
+    heavy_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/GetInstances",
+            "ADSModule/GetLocalInstances",
+            "ADSModule/GetSupportedApplications",
+            "Core/GetAPISpec",
+            "Core/GetAuditLogEntries",
+            "Core/GetPermissionsSpec",
+            "Core/GetSettingsSpec",
+            "FileManagerPlugin/GetDirectoryListing",
+        }
+    )
+    long_running_endpoints: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ADSModule/CreateInstance",
+            "ADSModule/DeployTemplate",
+            "ADSModule/UpgradeAllInstances",
+            "ADSModule/UpgradeInstance",
+            "Core/UpdateApplication",
+            "Core/UpgradeAMP",
+            "FileManagerPlugin/CreateArchive",
+            "FileManagerPlugin/DownloadFileFromURL",
+            "FileManagerPlugin/ExtractArchive",
+            "LocalFileBackupPlugin/RestoreBackup",
+            "LocalFileBackupPlugin/TakeBackup",
+        }
+    )
 
     # These are used to handle JSON keys that cannot be parsed properly via regex.
     # See :func:`camel_to_snake_re`
@@ -94,12 +315,22 @@ class Base:
         "AvailableIPs": "available_ips",
         "SecurityandPrivacy": "security_and_privacy",
     }
+    # Memoised raw JSON key -> snake_case key translations used by :meth:`sanitize_json`, seeded from `json_key_mapping`.
+    # Cleared once it holds `key_cache_size` keys; call :meth:`clear_key_cache` after changing `json_key_mapping`.
+    key_cache_size: ClassVar[int] = 4096
+    _key_cache: ClassVar[dict[str, str]] = {}
+    # AMP's error replies are tiny JSON objects, eg `{"Title": "Unauthorized Access", ...}` or `{"result": false}`;
+    # raw responses larger than this (in bytes) are real data and never decoded. See :meth:`_sniff_raw`.
+    raw_sniff_size: ClassVar[int] = 1024
+    # Request and response payloads are only formatted for the debug log when it is enabled for `ampapi.base`;
+    # and are cut off after this many characters. `None` logs them in full and `0` only logs their type and size.
+    log_payload_size: ClassVar[Union[int, None]] = 2048
 
     def __init__(self) -> None:
         bridge: Bridge = Bridge._get_bridge()
         # Validate the bridge object is at the same memory address.
         self.logger.debug("DEBUG %s __init__ %s", type(self).__name__, id(self))
-        self.logger.debug("bridge object -> %s", pformat(bridge))
+        self.logger.debug("bridge object -> %s", _LogPayload(data=bridge, limit=self.log_payload_size))
 
         if isinstance(bridge, Bridge):
             self.parse_bridge(bridge=bridge)
@@ -128,6 +359,18 @@ class Base:
         global FORMAT_DATA
         FORMAT_DATA = value
 
+    @property
+    def circuit_open(self) -> bool:
+        """
+        If calls to our Instance are currently failing fast, see :class:`CircuitBreaker`.
+
+        Returns
+        --------
+        :class:`bool`
+            True if the Instance failed too many times and calls are paused.
+        """
+        return self._bridge.circuit_breaker.is_open(instance_id=self.instance_id)
+
     @staticmethod
     def ads_only(
         func: Callable[Concatenate[D, T], Coroutine[None, None, F]],
@@ -170,12 +413,17 @@ class Base:
         format_data: Union[bool, None] = None,
         format_: Union[type[X], type[APIResponseDataTableAlias], None] = None,
         sanitize_json: bool = True,
+        lazy: bool = False,
+        raw: bool = False,
+        sniff: bool = True,
         _use_from_dict: bool = True,
         _auto_unpack: bool = True,
         _no_data: bool = False,
+        _retry_auth: bool = True,
+        _cached: bool = True,
     ) -> Any:
         """|coro|
-        Uses :class:`aiohttp.ClientSession` post request to access the AMP API endpoints. \n
+        Uses the shared :class:`aiohttp.ClientSession` of the :class:`Bridge` to post requests to the AMP API endpoints. \n
 
         .. note::
             Will populate the ``SESSIONID`` key for :param:`parameters` if it is not provided. This is the default behavior.
@@ -193,18 +441,29 @@ class Base:
             The dataclass the JSON response will formatted to, by default None.
         sanitize_json: :class:`bool`, optional
             Replaces invalid characters in our JSON responses, by default True.
+        lazy: :class:`bool`, optional
+            Return lazy views of ``format_`` that decode a field the first time it is read, see :meth:`DecoderRegistry.view`, by default False.
+        raw: :class:`bool`, optional
+            Return the undecoded response as a :class:`RawResponse`; ``format_data``, ``format_`` and ``sanitize_json`` are ignored, by default False.
+        sniff: :class:`bool`, optional
+            When ``raw`` is True; check small responses for AMP's ``title``/``result`` errors, see :attr:`raw_sniff_size`, by default True.
         _use_from_dict: :class:`bool`, optional
             Controls whether the data will use :meth:`fromdict` of dataclass wizard to unpack the data. Typical usage case is to handle nested :class:`DataclassInstance`, by default True.
         _auto_unpack: :class:`bool`, optional
             Controls whether the data will be unpacked automatically via ``(**data)``, by default True.
         _no_data: :class:`bool`, optional
             Informs the connection that the API does not have a JSON response, by default False.
+        _retry_auth: :class:`bool`, optional
+            Log in again and retry the call once if AMP replies with ``Unauthorized Access``, by default True.
+        _cached: :class:`bool`, optional
+            Allow a response from the :class:`ResponseCache` for the endpoints in :attr:`cache_ttls`, by default True.
 
         Returns
         --------
         Any
             Typical returns are of the same type that is passed in to ``format_``, either in an :class:`Iterable` or not depending on the data,
             otherwise returns an unformatted JSON response if :attr:`format_data` or ``FORMAT_DATA`` is False.
+            A :class:`RawResponse` if ``raw`` is True.
 
         Raises
         ------
@@ -220,38 +479,86 @@ class Base:
 
         global FORMAT_DATA
 
-        header: dict = {"Accept": "text/javascript"}
-        post_req: ClientResponse | None
-        self.logger.debug("_call_api -> %s was called with %s", api, parameters)
+        debug: bool = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "_call_api -> %s was called with %s",
+                api,
+                _LogPayload(data=parameters, limit=self.log_payload_size),
+                extra={"api": api, "instance_id": self.instance_id},
+            )
 
         # This should save us some boiler plate code throughout our API calls.
         if parameters is None:
             parameters = {}
 
-        api_session: APISession = self._bridge._sessions.get(self.instance_id, APISession(id="0", ttl=datetime.now()))
-        if isinstance(api_session, APISession):
-            parameters["SESSIONID"] = api_session.id
+        # Read-mostly endpoints are answered from the cache while fresh; stale responses are refreshed in the background.
+        cache: ResponseCache = self._bridge.response_cache
+        cache_ttl: Union[float, None] = self.cache_ttls.get(api) if cache.enabled is True and raw is False else None
+        if cache_ttl is not None:
+            cache_key: tuple[str, str, str, bool] = cache.make_key(
+                url=self.url, api=api, parameters=parameters, sanitize_json=sanitize_json
+            )
+            cached: Union[tuple[Any, bool], None] = cache.get(key=cache_key) if _cached is True else None
+            if cached is not None:
+                if cached[1] is True:
+                    cache.refresh(
+                        key=cache_key,
+                        request=functools.partial(
+                            self._call_api,
+                            api=api,
+                            parameters={key: value for key, value in parameters.items() if key != "SESSIONID"},
+                            format_data=False,
+                            sanitize_json=sanitize_json,
+                            _cached=False,
+                        ),
+                    )
+                return self._format_response(
+                    data=cached[0],
+                    format_data=format_data,
+                    format_=format_,
+                    lazy=lazy,
+                    _use_from_dict=_use_from_dict,
+                    _auto_unpack=_auto_unpack,
+                )
+            cache_generation: int = cache.generation(url=self.url)
+
+        api_session: Union[APISession, None] = self._bridge._session_manager.get(self.instance_id)
+        parameters["SESSIONID"] = api_session.id if isinstance(api_session, APISession) else "0"
+        session_id: str = parameters["SESSIONID"]
 
-        json_data: str = json.dumps(obj=parameters)
+        json_data: bytes = self._bridge.json_codec.dumps(obj=parameters)
 
         _url: str = self.url + "/API/" + api
-        self.logger.debug("DEBUG %s | %s | %s | %s", self.instance_id, api, _url, pformat(json_data))
-        async with aiohttp.ClientSession() as session:
+        if debug:
+            # The encoded parameters hold the session id (and password for logins); so we only log their size.
+            self.logger.debug(
+                "DEBUG %s | %s | %s | %s bytes",
+                self.instance_id,
+                api,
+                _url,
+                len(json_data),
+                extra={"api": api, "instance_id": self.instance_id},
+            )
+        # Identical read-only calls that are in flight at the same time share one request.
+        coalescer: RequestCoalescer = self._bridge._coalescer
+        if coalescer.enabled is True and api in self.idempotent_endpoints:
+            post_req_json: Any = await coalescer.run(
+                key=coalescer.make_key(url=self.url, api=api, parameters=parameters, raw=raw),
+                request=functools.partial(self._send, api=api, url=_url, data=json_data, raw=raw),
+            )
+        else:
             try:
-                post_req = await session.post(url=_url, headers=header, data=json_data)
-            # TODO - Need to not catch all Excepts..
-            # So I can handle each exception properly.
-            except Exception as e:
-                self.logger.error("DEBUG _call_api exception type: %s", type(e))
-                raise ValueError(e)
+                post_req_json = await self._send(api=api, url=_url, data=json_data, raw=raw)
+            finally:
+                # A mutating call may have changed what we cached for this Instance; even if it failed half way.
+                if api in self.cache_invalidations:
+                    cache.invalidate(url=self.url, apis=self.cache_invalidations[api])
+                if api in self.version_endpoints:
+                    self._bridge.capabilities.invalidate()
 
-            if post_req.content_length == 0:
-                raise ValueError(self._no_data)
-
-            if post_req.status != 200:
-                raise ConnectionError(self._no_data)
-
-            post_req_json: Any = await post_req.json()
+        # Tracks our session activity for the keep-alive; AMP expires sessions after inactivity.
+        self._bridge._session_manager.touch(instance_id=self.instance_id, owner=self)
 
         if post_req_json is None and _no_data is False:
             raise ConnectionError(self._no_data)
@@ -259,9 +566,23 @@ class Base:
         # They removed "result" from all replies thus breaking most if not all future code.
         # This was an old example from pre 2.3 AMP API that could have the following return:
         # `{'resultReason': 'Internal Auth - No reason given', 'success': False, 'result': 0}`
-        self.logger.debug("DEBUG API CALL----> %s | %s | %s", api, type(post_req_json), parameters)
-        self.logger.debug("DEBUG %s", pformat(post_req_json))
-        if sanitize_json is True:
+        if debug:
+            self.logger.debug(
+                "DEBUG API CALL----> %s | %s | %s",
+                api,
+                type(post_req_json),
+                _LogPayload(data=post_req_json, limit=self.log_payload_size),
+                extra={"api": api, "instance_id": self.instance_id},
+            )
+        raw_response: Union[RawResponse, None] = None
+        if raw is True:
+            # Relays pay for a decode only when the body could be one of AMP's error replies; which are then checked below.
+            raw_response = post_req_json
+            post_req_json = self._sniff_raw(body=raw_response.body) if sniff is True else None
+            if post_req_json is None:
+                return raw_response
+            post_req_json = self.sanitize_json(post_req_json)
+        elif sanitize_json is True:
             post_req_json = self.sanitize_json(post_req_json)
         if isinstance(post_req_json, dict):
             if "title" in post_req_json:
@@ -270,14 +591,30 @@ class Base:
                     post_req_json == "Unauthorized Access" or post_req_json == "Instance Unavailable"
                 ):
                     self.logger.error("%s failed because of %s", api, post_req_json)
-                    api_session = APISession(id="0", ttl=datetime.now())
-                    self._bridge._sessions.update({self.instance_id: api_session})
+                    self._bridge._session_manager.invalidate(instance_id=self.instance_id, session_id=session_id)
                     if post_req_json == "Unauthorized Access":
+                        # Our session most likely expired on AMP's side; log in again (shared with any other callers) and retry once.
+                        if _retry_auth is True and api != "Core/Login":
+                            await self._connect()
+                            return await self._call_api(
+                                api=api,
+                                parameters=parameters,
+                                format_data=format_data,
+                                format_=format_,
+                                sanitize_json=sanitize_json,
+                                lazy=lazy,
+                                raw=raw,
+                                sniff=sniff,
+                                _use_from_dict=_use_from_dict,
+                                _auto_unpack=_auto_unpack,
+                                _no_data=_no_data,
+                                _retry_auth=False,
+                            )
                         raise PermissionError(self._unauthorized_access)
                     elif post_req_json == "Instance Unavailable":
                         raise ConnectionError(self._instance_offline, self.url)
 
-            elif api == "Core/Login":
+            elif api == "Core/Login" and raw_response is None:
                 return LoginResults(**post_req_json)
 
             elif "result" in post_req_json:
@@ -291,86 +628,387 @@ class Base:
                 self.logger.error("%s failed because of Status: %s", api, post_req_json)
                 return ValueError(self._failed_api)
 
+        if raw_response is not None:
+            return raw_response
+        if cache_ttl is not None:
+            cache.set(key=cache_key, value=post_req_json, ttl=cache_ttl, generation=cache_generation)
+        return self._format_response(
+            data=post_req_json,
+            format_data=format_data,
+            format_=format_,
+            lazy=lazy,
+            _use_from_dict=_use_from_dict,
+            _auto_unpack=_auto_unpack,
+        )
+
+    def _format_response(
+        self,
+        data: Any,
+        format_data: Union[bool, None] = None,
+        format_: Union[type[X], type[APIResponseDataTableAlias], None] = None,
+        lazy: bool = False,
+        _use_from_dict: bool = True,
+        _auto_unpack: bool = True,
+    ) -> Any:
+        """
+        Formats the (already sanitized) JSON response data into ``format_`` if formatting is enabled.
+
+        .. note::
+            Used by :meth:`_call_api` and by anything that receives JSON response data another way, eg :class:`ConfigBatcher`.
+
+
+        Parameters
+        -----------
+        data: Any
+            The JSON response data.
+        format_data: Union[:class:`bool`, None], optional
+            Format the JSON response data. (Uses ``FORMAT_DATA`` global constant if None), by default None.
+        format_: :py:class:`DataclassInstance`, optional
+            The dataclass the JSON response will formatted to, by default None.
+        lazy: :class:`bool`, optional
+            See :meth:`json_to_dataclass`, by default False.
+        _use_from_dict: :class:`bool`, optional
+            See :meth:`json_to_dataclass`, by default True.
+        _auto_unpack: :class:`bool`, optional
+            See :meth:`json_to_dataclass`, by default True.
+
+        Returns
+        --------
+        Any
+            The formatted data, otherwise the JSON response data if formatting is disabled.
+        """
+        global FORMAT_DATA
+
         self.logger.debug(
             "DEBUG _call_api | format_data = %s | FORMAT_DATA = %s | FORMAT-> %s", format_data, FORMAT_DATA, format_
         )
         if (format_ is None or format_data is False) or (format_data is None and FORMAT_DATA is False):
-            return post_req_json
+            return data
 
-        elif isinstance(post_req_json, (dict, list)) and (
-            (format_data is True) or (format_data is None and FORMAT_DATA is True)
-        ):
+        elif isinstance(data, (dict, list)) and ((format_data is True) or (format_data is None and FORMAT_DATA is True)):
             return self.json_to_dataclass(
-                json=post_req_json, format_=format_, _use_from_dict=_use_from_dict, _auto_unpack=_auto_unpack
+                json=data, format_=format_, _use_from_dict=_use_from_dict, _auto_unpack=_auto_unpack, _lazy=lazy
             )
 
+    def _get_timeout(self, api: str) -> float:
+        """
+        Retrieves the request timeout for an API endpoint from the :class:`TimeoutSettings` of the :class:`Bridge`.
+
+        Parameters
+        -----------
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetStatus``.
+
+        Returns
+        --------
+        :class:`float`
+            The timeout in seconds.
+        """
+        settings: TimeoutSettings = self._bridge.timeout_settings
+        if api in settings.endpoints:
+            return settings.endpoints[api]
+        if api in self.fast_endpoints:
+            return settings.fast
+        if api in self.heavy_endpoints:
+            return settings.heavy
+        if api in self.long_running_endpoints:
+            return settings.long_running
+        return settings.default
+
+    async def _post(self, url: str, data: bytes, timeout: Union[float, None] = None, raw: bool = False) -> tuple[int, Any]:
+        """|coro|
+        Sends the post request through the shared connection pool of the :class:`Bridge` and decodes the JSON response
+        with the :class:`JSONCodec` of the :class:`Bridge`.
+
+        Parameters
+        -----------
+        url: :class:`str`
+            The full url of the API endpoint.
+        data: :class:`bytes`
+            The JSON encoded parameters.
+        timeout: Union[:class:`float`, None], optional
+            How long in seconds the request may take, by default None which uses the :class:`aiohttp.ClientSession` default.
+        raw: :class:`bool`, optional
+            Return the body undecoded as a :class:`RawResponse`, by default False.
+
+        Returns
+        --------
+        tuple[:class:`int`, Any]
+            The response status code and the decoded JSON response (or :class:`RawResponse`), which is None if the status code is not 200.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            When a status 200 JSON response :attr:`ClientSession.content_length` == 0 or the response is not valid JSON.
+        :exc:`aiohttp.ClientError`
+            When :class:`aiohttp.ClientSession` fails to send the request, see :meth:`_send`.
+        """
+        # We send the encoded bytes; so keep the content type aiohttp used for our old `str` payloads.
+        header: dict = {"Accept": "text/javascript", "Content-Type": "text/plain; charset=utf-8"}
+        post_req: ClientResponse | None
+        # The Bridge owns a single connection pool that every API class shares;
+        # this keeps our TCP/TLS connections alive between calls.
+        session: aiohttp.ClientSession = self._bridge._get_client_session()
+        kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        post_req = await session.post(url=url, headers=header, data=data, **kwargs)
+
+        # Releasing the response hands the connection back to the pool.
+        async with post_req:
+            # Checked first; empty 502/503/504 replies from a proxy must go through `retry_statuses` and the circuit breaker.
+            if post_req.status != 200:
+                return post_req.status, None
+
+            if post_req.content_length == 0:
+                raise ValueError(self._no_data)
+
+            # Read the raw body once and decode it ourselves so an accelerated codec can be used.
+            body: bytes = await post_req.read()
+            if raw is True:
+                return post_req.status, RawResponse(status=post_req.status, headers=post_req.headers, body=body)
+            if not body.strip():
+                return post_req.status, None
+            return post_req.status, self._bridge.json_codec.loads(body)
+
+    async def _scheduled_post(
+        self, url: str, data: bytes, priority: RequestPriority, timeout: float, raw: bool = False
+    ) -> tuple[int, Any]:
+        """|coro|
+        Waits for a slot from the :class:`RequestScheduler` of the :class:`Bridge` and sends the request via :meth:`_post`.
+        """
+        async with self._bridge.scheduler.slot(key=self.instance_id, priority=priority):
+            return await self._post(url=url, data=data, timeout=timeout, raw=raw)
+
+    def _sniff_raw(self, body: bytes) -> Union[dict[str, Any], None]:
+        """
+        Decodes a raw response body only if it could be one of AMP's error replies, eg ``{"Title": "Unauthorized Access"}``
+        or ``{"result": false}``.
+
+        Parameters
+        -----------
+        body: :class:`bytes`
+            The raw JSON response body.
+
+        Returns
+        --------
+        Union[dict[:class:`str`, Any], None]
+            The decoded JSON response, None if the body is larger than :attr:`raw_sniff_size` or can't be an error reply.
+        """
+        if len(body) > self.raw_sniff_size or (
+            b'"Title"' not in body and b'"title"' not in body and b'"result"' not in body
+        ):
+            return None
+        try:
+            data: Any = self._bridge.json_codec.loads(body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _deadline_passed(after: float = 0.0) -> bool:
+        # If the active Deadline (if any) will have passed `after` seconds from now.
+        remaining: Union[float, None] = Deadline.remaining()
+        return remaining is not None and remaining <= after
+
+    async def _send(self, api: str, url: str, data: bytes, raw: bool = False) -> Any:
+        """|coro|
+        Sends the request via :meth:`_post` once the :class:`RequestScheduler` grants a slot, retrying idempotent endpoints
+        per the :class:`RetryPolicy` and tracking the health of our Instance with the :class:`CircuitBreaker` of the :class:`Bridge`.\n
+        Endpoints in :attr:`hedge_endpoints` are hedged by the :class:`RequestHedger` when it is enabled.
+
+        Parameters
+        -----------
+        api: :class:`str`
+            The API endpoint to call, eg ``Core/GetModuleInfo``.
+        url: :class:`str`
+            The full url of the API endpoint.
+        data: :class:`bytes`
+            The JSON encoded parameters.
+        raw: :class:`bool`, optional
+            Return the undecoded response as a :class:`RawResponse`, by default False.
+
+        Returns
+        --------
+        Any
+            The decoded JSON response or the :class:`RawResponse`.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            When a JSON response :attr:`ClientSession.content_length` == 0 or :class:`aiohttp.ClientSession` raises an Exception.
+        :exc:`ConnectionError`
+            When an JSON response status code is not 200.\n
+            When the circuit breaker for our Instance is open.
+        :exc:`asyncio.TimeoutError`
+            When the active :class:`Deadline` passed before the call finished.
+        """
+        breaker: CircuitBreaker = self._bridge.circuit_breaker
+        if breaker.allow(instance_id=self.instance_id) is False:
+            raise ConnectionError(self._circuit_open % (self.instance_id, breaker.recovery_time))
+
+        scheduler: RequestScheduler = self._bridge.scheduler
+        priority: RequestPriority = scheduler.current_priority(
+            default=RequestPriority.background if api in self.background_endpoints else RequestPriority.normal
+        )
+        hedger: RequestHedger = self._bridge.hedger
+        policy: RetryPolicy = self._bridge.retry_policy
+        retries: int = policy.max_retries if api in self.idempotent_endpoints else 0
+        timeout: float = self._get_timeout(api=api)
+        attempt: int = 0
+        while True:
+            remaining: Union[float, None] = Deadline.remaining()
+            if remaining is not None and remaining <= 0:
+                raise asyncio.TimeoutError(self._deadline_exceeded % api)
+            try:
+                # Every attempt waits for a slot so a large `gather` can't flood the ADS webserver;
+                # the deadline covers the time spent waiting on the slot as well.
+                send: Callable[[], Coroutine[None, None, tuple[int, Any]]] = functools.partial(
+                    self._scheduled_post,
+                    url=url,
+                    data=data,
+                    priority=priority,
+                    timeout=timeout if remaining is None else min(timeout, remaining),
+                    raw=raw,
+                )
+                request: Coroutine[None, None, tuple[int, Any]]
+                if hedger.enabled and api in self.hedge_endpoints and api in self.idempotent_endpoints:
+                    request = hedger.run(api=api, request=send)
+                else:
+                    request = send()
+                if remaining is None:
+                    status, post_req_json = await request
+                else:
+                    status, post_req_json = await asyncio.wait_for(request, timeout=remaining)
+            except (aiohttp.ClientResponseError, ValueError):
+                # Raised while decoding a response; AMP is reachable but retrying will not help.
+                breaker.record_success(instance_id=self.instance_id)
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                if isinstance(e, asyncio.TimeoutError) and self._deadline_passed():
+                    raise asyncio.TimeoutError(self._deadline_exceeded % api) from e
+                delay: float = policy.get_delay(attempt=attempt + 1)
+                if attempt < retries and self._deadline_passed(after=delay) is False:
+                    attempt += 1
+                    self.logger.warning(
+                        "%s failed with %s, retry %s/%s in %.2fs", api, type(e).__name__, attempt, retries, delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                breaker.record_failure(instance_id=self.instance_id)
+                self.logger.error("DEBUG _call_api exception type: %s", type(e))
+                raise ValueError(e) from e
+
+            if status != 200:
+                delay = policy.get_delay(attempt=attempt + 1)
+                if attempt < retries and status in policy.retry_statuses and self._deadline_passed(after=delay) is False:
+                    attempt += 1
+                    self.logger.warning(
+                        "%s failed with status %s, retry %s/%s in %.2fs", api, status, attempt, retries, delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if status >= 500:
+                    breaker.record_failure(instance_id=self.instance_id)
+                else:
+                    breaker.record_success(instance_id=self.instance_id)
+                raise ConnectionError(self._no_data)
+
+            # AMP replies with a 200 when the ADS cannot reach an Instance.
+            if raw is True:
+                body: bytes = post_req_json.body
+                unavailable: bool = len(body) <= self.raw_sniff_size and b"Instance Unavailable" in body
+            else:
+                unavailable = (
+                    isinstance(post_req_json, dict)
+                    and post_req_json.get("Title", post_req_json.get("title")) == "Instance Unavailable"
+                )
+            if unavailable is True:
+                breaker.record_failure(instance_id=self.instance_id)
+            else:
+                breaker.record_success(instance_id=self.instance_id)
+            return post_req_json
+
     async def _connect(self) -> LoginResults | None:
         """|coro|
         Logs into AMP via "API/Core/Login" endpoint using your :class:`Bridge` object.
 
         .. note::
             If Applicable handles your 2FA using :class:`TOTP` \n
-            Stores the ``SESSIONID`` via :class:`APISession` dataclass for future usage inside the :class:`Bridge` object.
+            Stores the ``SESSIONID`` via :class:`APISession` dataclass for future usage inside the :class:`Bridge` object.\n
+            Concurrent calls for the same Instance share a single login, see :class:`SessionManager`.
 
 
         Returns
         --------
         :class:`LoginResults` | None
-            The results from ``API/Core/Login`` as a dataclass.
+            The results from ``API/Core/Login`` as a dataclass, None if our current session is still valid.
 
         Raises
         -------
         :exc:`ValueError`
             If the 2 Factor Authentication code is not a formatted properly aka the :attr:`~Bridge.token` when making the :py:class:`Bridge` object.
         """
-        code: Union[str, TOTP] = ""
-
         # get our InstanceID and use it to key for session_id
-        session: APISession = self._bridge._sessions.get(self.instance_id, APISession(id="0", ttl=datetime.now()))
-        if isinstance(session, APISession):
-            ttl: timedelta = datetime.now() - session.ttl
-            if ttl.seconds > self.session_ttl:
-                sessionID = "0"
-            else:
-                sessionID: str = session.id
+        manager: SessionManager = self._bridge._session_manager
+        if manager.is_valid(session=manager.get(self.instance_id), session_ttl=self.session_ttl):
+            return None
+        return await manager.login(instance_id=self.instance_id, login=self._login)
 
-        if sessionID == "0":
-            if self._bridge.use_2fa is True:
-                try:
-                    # Handles time based 2Factory Auth Key/Code
-                    code = TOTP(self._bridge.token).now()
+    async def _login(self) -> LoginResults | None:
+        """|coro|
+        Performs the actual "API/Core/Login" request for :meth:`_connect` and stores the new :class:`APISession`.
+
+        Returns
+        --------
+        :class:`LoginResults` | None
+            The results from ``API/Core/Login`` as a dataclass.
+
+        Raises
+        -------
+        :exc:`ValueError`
+            If the 2 Factor Authentication code is not a formatted properly aka the :attr:`~Bridge.token` when making the :py:class:`Bridge` object.
+        """
+        code: Union[str, TOTP] = ""
+        if self._bridge.use_2fa is True:
+            # Only needed for 2FA; so we don't import it up front.
+            from pyotp import TOTP
 
-                except AttributeError:
-                    raise ValueError(
-                        "Please check your 2 Factor Code, should not contain spaces, escape characters and it must be enclosed in quotes!"
-                    )
             try:
-                parameters: dict[str, Any] = {
-                    "username": self._bridge.user,
-                    "password": self._bridge.password,
-                    "token": code,
-                    "rememberMe": True,
-                }
+                # Handles time based 2Factory Auth Key/Code
+                code = TOTP(self._bridge.token).now()
 
-                result: Any = await self._call_api(
-                    api="Core/Login", parameters=parameters, format_data=True, format_=LoginResults
+            except AttributeError:
+                raise ValueError(
+                    "Please check your 2 Factor Code, should not contain spaces, escape characters and it must be enclosed in quotes!"
                 )
-                if isinstance(result, LoginResults):
-                    # This is our new sessions table to correlate InstanceID to a sessionID.
-                    api_session = APISession(id=result.session_id, ttl=datetime.now())
-                    self._bridge._sessions.update({self.instance_id: api_session})
-                    return result
+        try:
+            parameters: dict[str, Any] = {
+                "username": self._bridge.user,
+                "password": self._bridge.password,
+                "token": code,
+                "rememberMe": True,
+            }
+
+            result: Any = await self._call_api(
+                api="Core/Login", parameters=parameters, format_data=True, format_=LoginResults
+            )
+            if isinstance(result, LoginResults):
+                # This is our new sessions table to correlate InstanceID to a sessionID.
+                api_session = APISession(id=result.session_id, ttl=datetime.now())
+                self._bridge._session_manager.set(instance_id=self.instance_id, session=api_session)
+                return result
 
-                else:
-                    self.logger.warning(msg="Failed response from 'API/Core/Login' in <Base>._connect()")
-                    return result
+            else:
+                self.logger.warning(msg="Failed response from 'API/Core/Login' in <Base>._connect()")
+                return result
 
-            except Exception as e:
-                self.logger.warning("Core/Login Exception:", exc_info=e)
-        else:
-            return
+        except Exception as e:
+            self.logger.warning("Core/Login Exception:", exc_info=e)
 
-    async def call_end_point(self, api: str, parameters: None | dict[str, Any] = None) -> dict[str, Any]:
+    async def call_end_point(
+        self, api: str, parameters: None | dict[str, Any] = None, raw: bool = False, sniff: bool = True
+    ) -> dict[str, Any] | RawResponse:
         """|coro|
 
         Universal API function for calling any API endpoint. Some API endpoints require the Instance module type to be ADS. \n
@@ -392,15 +1030,21 @@ class Base:
             The AMP API endpoint to call. eg "Core/GetModuleInfo"
         parameters : None | dict[:class:`str`, Any], optional
             The parameters to pass to the API endpoint, by default is None
+        raw: :class:`bool`, optional
+            Return the response body undecoded (with the status and headers) as a :class:`RawResponse`;
+            eg for relays that forward AMP responses unchanged, by default False.
+        sniff: :class:`bool`, optional
+            When ``raw`` is True; still raise for AMP's ``title``/``result`` errors by decoding responses that are small enough
+            to be one, see :attr:`raw_sniff_size`, by default True.
 
         Returns
         --------
-        dict[:class:`str`, Any] :
-           The JSON response from the API endpoint.
+        dict[:class:`str`, Any] | :class:`RawResponse` :
+           The JSON response from the API endpoint, or the :class:`RawResponse` if ``raw`` is True.
 
         """
         await self._connect()
-        result: Any = await self._call_api(api=api, parameters=parameters)
+        result: Any = await self._call_api(api=api, parameters=parameters, raw=raw, sniff=sniff)
         return result
 
     @staticmethod
@@ -424,8 +1068,8 @@ class Base:
             The converted string from CamelCase to snake_case.
         """
 
-        data = re.sub(pattern="(.)([A-Z][a-z]+)", repl=r"\1_\2", string=data)
-        return re.sub(pattern="([a-z0-9])([A-Z])", repl=r"\1_\2", string=data).lower()
+        data = _CAMEL_WORD_RE.sub(repl=r"\1_\2", string=data)
+        return _CAMEL_BOUNDARY_RE.sub(repl=r"\1_\2", string=data).lower()
 
     @staticmethod
     def camel_case_data(data: dict[str, Any]) -> dict[str, Any]:
@@ -486,6 +1130,7 @@ class Base:
         format_: Union[type[X], type[APIResponseDataTableAlias]],
         _use_from_dict: bool,
         _auto_unpack: bool,
+        _lazy: bool = False,
     ) -> X | list[APIResponseDataTableAlias | X] | APIResponseDataTableAlias | None:
         """
         Format the JSON response data to a dataclass.
@@ -501,10 +1146,13 @@ class Base:
         format: Union[:class:`DataclassInstance`, class:`DeploymentTemplate`]
             Must be of type :class:`DataclassInstance` or similar to unpack the JSON response data.
         _use_from_dict: :class:`bool`
-            Use :meth:`fromdict` from dataclass_wizard to unpack the JSON response data.
+            Use the compiled decoders of :class:`DecoderRegistry` (or :meth:`fromdict` from dataclass_wizard) to unpack the JSON response data.
             - Typically this is used to handle nested :class:`DataclassInstance`.
         _auto_unpack: :class:`bool`
             Use ``**data`` to unpack the JSON response data.
+        _lazy: :class:`bool`, optional
+            Together with ``_use_from_dict``; return lazy views that decode a field the first time it is read, by default False.
+            - See :meth:`DecoderRegistry.view`.
 
         Returns
         --------
@@ -515,7 +1163,9 @@ class Base:
         if isinstance(json, list):
             # _use_from_dict is to handle nested Dataclasses.
             if _use_from_dict is True:
-                return [fromdict(format_, data) for data in json]
+                if _lazy is True:
+                    return [decoders.view(cls=format_, data=data) for data in json]
+                return [decoders.decode(cls=format_, data=data) for data in json]
 
             # Self explanatory; uses the `**` annotation to unpack our data.
             elif _auto_unpack is True:
@@ -527,7 +1177,9 @@ class Base:
         if isinstance(json, dict):
             # _use_from_dict is to handle nested Dataclasses.
             if _use_from_dict is True:
-                return fromdict(format_, json)
+                if _lazy is True:
+                    return decoders.view(cls=format_, data=json)
+                return decoders.decode(cls=format_, data=json)
 
             elif _auto_unpack is True:
                 return format_(**json)
@@ -616,35 +1268,34 @@ class Base:
         Iterable[Any]
             The JSON response data cleaned up.
         """
-        if isinstance(json, list):
-            # print("JSON is a list")
-            _new_data = copy.copy(x=json)
-            for i in range(0, len(json), 1):
-                # If any of our entries are a dictionary; let's go through them.
-                if isinstance(json[i], dict):
-                    # print("List New Data", json[i])
-                    _new_data[i] = cls.sanitize_json(json=json[i])
-                    # print("Sanitized New Data", _new_data[i])
-                    # _new_data[entry] = cls.sanitize_json(json=entry)
-            return _new_data
-
-        if isinstance(json, dict):
-            # print("JSON is a dict")
-            _new_data = copy.copy(x=json)
-            for key, value in json.items():
-                # print("DICT Not cleaned up", key, value)
-                _new_data.pop(key)
-                # To handle keys with spaces and to remove underscores that exist already.
-                key: str = key.replace(" ", "")
-                key: str = key.replace("_", "")
-                if key in cls.json_key_mapping:
-                    # print("KEY MAPPING OVERWRITE", key, cls.json_key_mapping[key])
-                    key = cls.json_key_mapping[key]
-                key = cls.camel_to_snake_re(data=key)
-                if isinstance(value, (list, dict)):
-                    value = cls.sanitize_json(json=value)
-                _new_data[key] = value
-            return _new_data
+        if isinstance(json, (list, dict)):
+            # A single iterative pass; every container is built once and filled in as we walk the source data.
+            translate: Callable[[str], str] = cls._sanitize_key
+            root: Union[list[Any], dict[str, Any]] = [] if isinstance(json, list) else {}
+            stack: list[tuple[Union[list[Any], dict[str, Any]], Union[list[Any], dict[str, Any]]]] = [(json, root)]
+            while stack:
+                source, target = stack.pop()
+                if isinstance(source, dict):
+                    for key, value in source.items():
+                        if isinstance(value, dict):
+                            new_value: Any = {}
+                            stack.append((value, new_value))
+                        elif isinstance(value, list):
+                            new_value = []
+                            stack.append((value, new_value))
+                        else:
+                            new_value = value
+                        target[translate(key)] = new_value  # type: ignore
+                else:
+                    # Only dictionaries inside of a list are sanitized; nested lists are kept as is.
+                    for entry in source:
+                        if isinstance(entry, dict):
+                            new_entry: dict[str, Any] = {}
+                            stack.append((entry, new_entry))
+                            target.append(new_entry)  # type: ignore
+                        else:
+                            target.append(entry)  # type: ignore
+            return root
 
         if isinstance(json, str):
             # Typical use is to make attributes PEP8 compliant for a class.
@@ -657,6 +1308,33 @@ class Base:
             return _new_data.lower()
         return json
 
+    @classmethod
+    def _sanitize_key(cls, key: str) -> str:
+        # The memoised version of the JSON key clean up in `sanitize_json`.
+        cache: dict[str, str] = Base._key_cache
+        sanitized: Union[str, None] = cache.get(key)
+        if sanitized is not None:
+            return sanitized
+
+        if not cache or len(cache) >= cls.key_cache_size:
+            cls.clear_key_cache()
+        # To handle keys with spaces and to remove underscores that exist already.
+        sanitized = key.replace(" ", "").replace("_", "")
+        sanitized = cls.camel_to_snake_re(data=cls.json_key_mapping.get(sanitized, sanitized))
+        cache[key] = sanitized
+        return sanitized
+
+    @classmethod
+    def clear_key_cache(cls) -> None:
+        """|classmethod|
+
+        Clears the memoised JSON key translations used by :meth:`sanitize_json` and re-seeds them from :attr:`json_key_mapping`.
+        """
+        cache: dict[str, str] = Base._key_cache
+        cache.clear()
+        for key, value in cls.json_key_mapping.items():
+            cache[key] = cls.camel_to_snake_re(data=value)
+
     @staticmethod
     def sanitize_path(path: str) -> str:
         """
@@ -722,34 +1400,41 @@ class Base:
             fmt.append(character)
         return "".join(fmt)
 
-    async def version_validation(self, version: VersionInfo) -> None:
+    async def version_validation(self, version: VersionInfo, api: Union[str, None] = None) -> None:
         """
         Compares the Version of the application/Instance against the version that is passed in.
 
+        .. note::
+            The version is looked up once per Instance and kept in the :class:`CapabilityRegistry` of the :class:`Bridge`.
+
 
         Parameters
         -----------
         version: :class:`VersionInfo`
             The version to compare against the application.
+        api: Union[:class:`str`, None], optional
+            The API call that needs ``version``; used in the error, by default None.
         Raises
         -------
         :exc:`RuntimeError`
             The application version no longer supports this API call..
         """
+        capabilities: CapabilityRegistry = self._bridge.capabilities
+        _version: Union[VersionInfo, None] = capabilities.get_version(instance_id=self.instance_id)
+        if _version is None:
+            result: Any = await self._call_api(
+                api="Core/GetDiagnosticsInfo",
+                format_data=True,
+                format_=Diagnostics,
+                _use_from_dict=False,
+                _auto_unpack=True,
+            )
+            if isinstance(result, Diagnostics):
+                _version = capabilities.set_version(instance_id=self.instance_id, version=result.application_version)
 
-        result: Any = await self._call_api(
-            api="Core/GetDiagnosticsInfo",
-            format_data=True,
-            format_=Diagnostics,
-            _use_from_dict=False,
-            _auto_unpack=True,
-        )
-
-        if isinstance(result, Diagnostics) and isinstance(result.application_version, VersionInfo):
-            _version: VersionInfo = result.application_version
-            if result.application_version < version:
-                raise RuntimeError(self._version_unavailable, "`Core/GetWebserverMetrics`", _version)
-        else:
+        if _version is None:
             self.logger.warning(
                 "Unable to validate version Info, the API call %s may raise an error", "`Core/GetDiagnosticsInfo`"
             )
+        elif _version < version:
+            raise RuntimeError(self._version_unavailable, f"`{api}`" if api is not None else "", _version)
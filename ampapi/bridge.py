@@ -1,8 +1,17 @@
+import asyncio
 import logging
+from collections.abc import Awaitable
 from dataclasses import fields
+from types import TracebackType
 from typing import Any, Union
 
-from .dataclass import APIParams
+import aiohttp
+
+from .capability import CapabilityRegistry, SpecCache
+from .codec import JSONCodec, get_default_codec
+from .dataclass import APIParams, ConnectionSettings, RetryPolicy, TimeoutSettings
+from .session import MemorySessionStore, SessionManager, SessionStore
+from .transport import CircuitBreaker, ConfigBatcher, RequestCoalescer, RequestHedger, RequestScheduler, ResponseCache
 
 __all__ = ("Bridge",)
 
@@ -14,6 +23,11 @@ class Bridge(APIParams):
     Simply create the class similar to the example below and then access any other API class you wish.\n
     Then when creating any API class,  this will pull login details from the :py:class:`Bridge`.
 
+    .. note::
+        The :class:`Bridge` also owns the shared :class:`aiohttp.ClientSession` connection pool used by every API class.
+        Call :meth:`close` when you are done or use the :class:`Bridge` as an async context manager.
+
+
     .. code-block:: python
         :linenos:
 
@@ -23,25 +37,169 @@ class Bridge(APIParams):
         _bridge: Bridge = Bridge(ap_params=_params)
         del _params
 
+        # Persist sessions so a restarted worker does not need to log in again.
+        _bridge = Bridge(api_params=_params, session_store=FileSessionStore(path="./amp_sessions.json"))
+
+        # Retry idempotent calls more patiently and pause calls to an Instance sooner when it keeps failing.
+        _bridge = Bridge(api_params=_params, retry_policy=RetryPolicy(max_retries=5, base_delay=0.5))
+        _bridge.circuit_breaker.failure_threshold = 3
+
+        # Limit the load we put on the ADS webserver; at most 16 requests in flight and 20 requests per second.
+        _bridge.scheduler.max_in_flight = 16
+        _bridge.scheduler.rate = 20.0
+
+        # Send a second `Core/GetStatus` when the first one is slower than 95% of the recent ones.
+        _bridge.hedger.enabled = True
+
+        # Keep the API and permission specs on disk; Instances on the same AMP version share one copy.
+        _bridge = Bridge(api_params=_params, spec_cache=FileSpecCache(path="./amp_specs"))
+
+        # Settings were changed in the AMP web panel; don't wait for the cached settings spec to expire.
+        _bridge.response_cache.invalidate(apis={"Core/GetSettingsSpec"})
+
+        # Give directory listings more time than the other heavy endpoints.
+        _bridge = Bridge(
+            api_params=_params,
+            timeout_settings=TimeoutSettings(endpoints={"FileManagerPlugin/GetDirectoryListing": 300.0}),
+        )
+
+        # Or let the Bridge clean up the connection pool for you.
+        async with Bridge(api_params=_params, connection_settings=ConnectionSettings(limit_per_host=20)):
+            ...
 
 
     """
 
     api_params: APIParams
-    _logger: logging.Logger = logging.getLogger()
+    connection_settings: ConnectionSettings
+    retry_policy: RetryPolicy
+    timeout_settings: TimeoutSettings
+    json_codec: JSONCodec
+    circuit_breaker: CircuitBreaker
+    scheduler: RequestScheduler
+    hedger: RequestHedger
+    response_cache: ResponseCache
+    capabilities: CapabilityRegistry
+    spec_cache: SpecCache
+    _session_manager: SessionManager
+    _coalescer: RequestCoalescer
+    _config_batcher: ConfigBatcher
+    _logger: logging.Logger = logging.getLogger(__name__)
+    _client_session: Union[aiohttp.ClientSession, None]
+    _client_loop: Union[asyncio.AbstractEventLoop, None]
+    _client_settings: Union[ConnectionSettings, None]
+    _closing: set[asyncio.Task[None]]
 
     def __new__(cls, api_params: Union[APIParams, None] = None, *args: Any, **kwargs: Any) -> Union["Bridge", None]:
         if not hasattr(cls, "_instance"):
-            cls._instance: Bridge = super().__new__(cls, *args, **kwargs)
+            cls._instance: Bridge = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, api_params: APIParams, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        api_params: APIParams,
+        connection_settings: Union[ConnectionSettings, None] = None,
+        session_store: Union[SessionStore, None] = None,
+        retry_policy: Union[RetryPolicy, None] = None,
+        timeout_settings: Union[TimeoutSettings, None] = None,
+        json_codec: Union[JSONCodec, None] = None,
+        spec_cache: Union[SpecCache, None] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
         self._logger.debug("DEBUG %s __init__ %s", type(self).__name__, id(self))
         self.api_params: APIParams = api_params
         # We parse the api params for easier usage.
         for field in fields(class_or_instance=api_params):
             setattr(self, field.name, getattr(self.api_params, field.name))
 
+        # Like the components below; a re-init only replaces the settings that are passed in.
+        # New connection settings replace the connection pool on the next API call, see `_get_client_session`.
+        if connection_settings is not None:
+            self.connection_settings = connection_settings
+        elif not hasattr(self, "connection_settings"):
+            self.connection_settings = ConnectionSettings()
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        elif not hasattr(self, "retry_policy"):
+            self.retry_policy = RetryPolicy()
+        if timeout_settings is not None:
+            self.timeout_settings = timeout_settings
+        elif not hasattr(self, "timeout_settings"):
+            self.timeout_settings = TimeoutSettings()
+        # Uses `orjson` when it is installed, see `get_default_codec`.
+        if json_codec is not None:
+            self.json_codec = json_codec
+        elif not hasattr(self, "json_codec"):
+            self.json_codec = get_default_codec()
+        # Sessions are kept in memory (our `_sessions` attribute) unless a persistent store is provided.
+        # Handles our sessions per Instance and makes sure we only ever have one login in flight per Instance.
+        # Like the connection pool, we keep an existing manager (and its store) so a running keep-alive is not orphaned
+        # and a re-init without `session_store` doesn't drop a store configured earlier.
+        if not hasattr(self, "_session_manager"):
+            store: SessionStore = session_store if session_store is not None else MemorySessionStore(sessions=self._sessions)
+            store.load()
+            self._session_manager = SessionManager(store=store)
+        elif session_store is not None:
+            session_store.load()
+            self._session_manager.store = session_store
+        # Shares identical in flight read-only requests, see `Base.idempotent_endpoints`.
+        if not hasattr(self, "_coalescer"):
+            self._coalescer = RequestCoalescer()
+        # Merges get_config/set_config calls into GetConfigs/SetConfigs requests per Instance.
+        if not hasattr(self, "_config_batcher"):
+            self._config_batcher = ConfigBatcher()
+        # Fails calls fast per Instance once it keeps failing; kept so the failure counts survive a re-init.
+        if not hasattr(self, "circuit_breaker"):
+            self.circuit_breaker = CircuitBreaker()
+        # Caps how many requests are in flight, globally and per Instance; kept so in flight slots stay accounted for.
+        if not hasattr(self, "scheduler"):
+            self.scheduler = RequestScheduler()
+        # Opt-in hedging of latency critical reads; kept so the recorded latencies survive a re-init.
+        if not hasattr(self, "hedger"):
+            self.hedger = RequestHedger()
+        # Keeps the responses of read-mostly endpoints, see `Base.cache_ttls`; kept so a re-init doesn't drop them.
+        if not hasattr(self, "response_cache"):
+            self.response_cache = ResponseCache()
+        # The AMP version and endpoints of each Instance, see `Base.version_validation`.
+        if not hasattr(self, "capabilities"):
+            self.capabilities = CapabilityRegistry()
+        # Specs shared by every Instance of a module on the same AMP version, see `Core.get_api_spec`.
+        if spec_cache is not None:
+            self.spec_cache = spec_cache
+        elif not hasattr(self, "spec_cache"):
+            self.spec_cache = SpecCache()
+        # The Bridge is a singleton; so we keep any existing connection pool around instead of leaking it.
+        if not hasattr(self, "_client_session"):
+            self._client_session = None
+            self._client_loop = None
+            self._client_settings = None
+            # Old connection pools being closed; the event loop only keeps a weak reference to a task.
+            self._closing = set()
+
+    async def __aenter__(self) -> "Bridge":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None],
+    ) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        If the shared connection pool is closed or has not been created yet.
+
+        Returns
+        --------
+        :class:`bool`
+            True if there is no open connection pool.
+        """
+        return self._client_session is None or self._client_session.closed
+
     @classmethod
     def _get_bridge(cls) -> "Bridge":
         """
@@ -64,3 +222,136 @@ class Bridge(APIParams):
         if cls._instance is None:
             raise ValueError("Failed to setup connection. You need to initiate `<class Bridge>` first.")
         return cls._instance
+
+    def _get_client_session(self) -> aiohttp.ClientSession:
+        """
+        Retrieves the shared :class:`aiohttp.ClientSession`, creating it with our :attr:`connection_settings` if needed.
+
+        .. note::
+            A new pool is created if the previous one was closed, belongs to a different event loop or
+            :attr:`connection_settings` was replaced since.
+
+
+        .. warning::
+            **DO NOT CALL THIS FUNCTION OUTSIDE OF AN API CLASS (:class:`ADSModule`, :class:`Core`, etc..)**
+
+
+        Returns
+        --------
+        :class:`aiohttp.ClientSession`
+            The shared connection pool.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        settings: ConnectionSettings = self.connection_settings
+        if (
+            self._client_session is None
+            or self._client_session.closed
+            or self._client_loop is not loop
+            or self._client_settings is not settings
+        ):
+            self._discard_client_session()
+            connector = aiohttp.TCPConnector(
+                limit=settings.limit,
+                limit_per_host=settings.limit_per_host,
+                use_dns_cache=settings.use_dns_cache,
+                ttl_dns_cache=settings.ttl_dns_cache,
+                keepalive_timeout=settings.keepalive_timeout,
+                enable_cleanup_closed=settings.enable_cleanup_closed,
+                ssl=None if settings.verify_ssl else False,
+            )
+            self._logger.debug("DEBUG %s creating connection pool | %s", type(self).__name__, settings)
+            self._client_session = aiohttp.ClientSession(connector=connector)
+            self._client_loop = loop
+            self._client_settings = settings
+        return self._client_session
+
+    def _discard_client_session(self) -> None:
+        """
+        Closes the connection pool we are about to replace without awaiting it; either because :attr:`connection_settings`
+        was replaced or because it was left behind by another event loop (eg a previous :func:`asyncio.run`),
+        which is usually closed already.
+
+        .. note::
+            Requests still in flight on a pool replaced for new :attr:`connection_settings` lose their connection.
+        """
+        session: Union[aiohttp.ClientSession, None] = self._client_session
+        if session is None or session.closed:
+            return
+        if self._client_loop is asyncio.get_running_loop():
+            self._logger.debug("DEBUG %s closing the connection pool for new connection settings", type(self).__name__)
+            task: asyncio.Task[None] = self._client_loop.create_task(session.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            return
+        self._logger.warning(
+            "The connection pool of %s belongs to another event loop; closing it. Call `Bridge.close()` before the loop ends.",
+            type(self).__name__,
+        )
+        connector: Union[aiohttp.BaseConnector, None] = session.connector
+        # Marks the session closed without it trying to close the connector on its (other) loop.
+        session.detach()
+        old_loop: Union[asyncio.AbstractEventLoop, None] = self._client_loop
+        if connector is None:
+            return
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            old_loop.call_soon_threadsafe(lambda: old_loop.create_task(connector.close()))
+            return
+        try:
+            # aiohttp closes the pooled connections before `close()` returns; only waiting on them needs their loop.
+            closing: Awaitable[None] = connector.close()
+        except RuntimeError:
+            # The transports belonged to a closed loop; they are gone already.
+            return
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(self._wait_closed(closing=closing))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _wait_closed(closing: Awaitable[None]) -> None:
+        try:
+            await closing
+        except RuntimeError:
+            # Waiting on the connections to close needs the loop they belonged to, which no longer runs.
+            pass
+
+    def start_keep_alive(self, interval: float = 30.0, max_concurrency: int = 5) -> None:
+        """
+        Opt-in background task that keeps every used session warm so calls never have to wait on ``Core/Login``.
+
+        .. note::
+            Sessions idle close to :attr:`Base.session_ttl` are refreshed with a cheap API call, see :attr:`SessionManager.keep_alive_api`.
+
+
+        Parameters
+        -----------
+        interval: :class:`float`, optional
+            How often in seconds the sessions are checked, by default 30.0.
+        max_concurrency: :class:`int`, optional
+            The max number of sessions refreshed at the same time across all Instances, by default 5.
+        """
+        self._session_manager.start_keep_alive(interval=interval, max_concurrency=max_concurrency)
+
+    async def stop_keep_alive(self) -> None:
+        """|coro|
+
+        Stops the keep-alive task started by :meth:`start_keep_alive`.
+        """
+        await self._session_manager.stop_keep_alive()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops the keep-alive task, waits for pending session writes, clears the :attr:`response_cache` and closes the shared connection pool.
+        Any API call made afterwards will open a new pool.
+        """
+        await self.stop_keep_alive()
+        await self._session_manager.store.flush()
+        self.response_cache.clear()
+        if self._client_session is not None and not self._client_session.closed:
+            await self._client_session.close()
+        # Pools replaced for new connection settings that are still closing.
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        await asyncio.gather(*(task for task in self._closing if task.get_loop() is loop))
+        self._client_session = None
+        self._client_loop = None
+        self._client_settings = None
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from .codec import get_default_codec
+from .dataclass import VersionInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .codec import JSONCodec
+
+__all__ = ("CapabilityRegistry", "FileSpecCache", "SpecCache")
+
+# Anything but these characters is replaced in the file names of a :class:`FileSpecCache`.
+_UNSAFE_FILENAME: re.Pattern[str] = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class CapabilityRegistry:
+    """
+    Remembers the AMP version and the API endpoints of each Instance; so version gated calls don't need a request first.
+
+    .. note::
+        The :class:`Bridge` creates this for you. It is filled in as we go; from :attr:`Instance.amp_version` when an
+        :class:`AMPInstance` is created, from :meth:`Core.get_diagnostics_info` and from :meth:`Core.get_api_spec`.
+        :meth:`Base.version_validation` only calls ``Core/GetDiagnosticsInfo`` for Instances we know nothing about yet.\n
+        Calls that upgrade AMP drop what we know about the Instance, see :attr:`Base.version_endpoints`.
+
+
+    .. code-block:: python
+        :linenos:
+
+
+        # None until we know the version of the Instance.
+        if _bridge.capabilities.supports(instance_id=instance.instance_id, api="Core/UpdateAccountInfo") is False:
+            ...
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to always look up the version via ``Core/GetDiagnosticsInfo``, default is True.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+
+    def __init__(self) -> None:
+        self._versions: dict[str, VersionInfo] = {}
+        self._endpoints: dict[str, frozenset[str]] = {}
+
+    def get_version(self, instance_id: str) -> Union[VersionInfo, None]:
+        """
+        Retrieves the AMP version of an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance id.
+
+        Returns
+        --------
+        :class:`VersionInfo` | None
+            The AMP version or None if we don't know it (yet).
+        """
+        if self.enabled is False:
+            return None
+        return self._versions.get(instance_id)
+
+    def set_version(
+        self, instance_id: str, version: Union[VersionInfo, str, Mapping[str, Any], None]
+    ) -> Union[VersionInfo, None]:
+        """
+        Records the AMP version of an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance id.
+        version: Union[:class:`VersionInfo`, :class:`str`, Mapping[:class:`str`, Any], None]
+            The version, as found in :attr:`Instance.amp_version` or :attr:`Diagnostics.application_version`;
+            anything that can't be parsed is ignored.
+
+        Returns
+        --------
+        :class:`VersionInfo` | None
+            The recorded version or None if ``version`` couldn't be parsed.
+        """
+        if isinstance(version, str):
+            version = VersionInfo.to_dataclass(data=version)
+        elif version is not None and not isinstance(version, VersionInfo):
+            try:
+                version = VersionInfo(**version)
+            except TypeError:
+                version = None
+        if not isinstance(version, VersionInfo):
+            return None
+        if self._versions.get(instance_id) != version:
+            self._logger.debug("DEBUG %s Instance %s runs AMP %s", type(self).__name__, instance_id, version)
+            self._versions[instance_id] = version
+        return version
+
+    def set_api_spec(self, instance_id: str, spec: Mapping[str, Any]) -> frozenset[str]:
+        """
+        Records the API endpoints of an Instance from the unsanitized response of ``Core/GetAPISpec``.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance id.
+        spec: Mapping[:class:`str`, Any]
+            The API spec, eg ``{"Core": {"GetStatus": {...}, ...}, ...}``.
+
+        Returns
+        --------
+        frozenset[:class:`str`]
+            The endpoints, eg ``"Core/GetStatus"``.
+        """
+        endpoints: frozenset[str] = frozenset(
+            f"{module}/{method}" for module, methods in spec.items() if isinstance(methods, dict) for method in methods
+        )
+        self._endpoints[instance_id] = endpoints
+        return endpoints
+
+    def supports(
+        self, instance_id: str, api: Union[str, None] = None, version: Union[VersionInfo, None] = None
+    ) -> Union[bool, None]:
+        """
+        Checks if an Instance has an API endpoint and/or runs at least a version of AMP; without making a request.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance id.
+        api: Union[:class:`str`, None], optional
+            The API endpoint, eg ``Core/UpdateAccountInfo``. Checked against the recorded API spec, otherwise against the
+            version listed in :attr:`Base.endpoint_versions`, by default None.
+        version: Union[:class:`VersionInfo`, None], optional
+            The minimum AMP version, by default None.
+
+        Returns
+        --------
+        :class:`bool` | None
+            If the Instance supports it or None if we don't know enough about the Instance (yet).
+        """
+        from .base import Base
+
+        if self.enabled is False:
+            return None
+        if api is not None:
+            endpoints: Union[frozenset[str], None] = self._endpoints.get(instance_id)
+            if endpoints is not None:
+                if api not in endpoints:
+                    return False
+            elif version is None:
+                version = Base.endpoint_versions.get(api)
+                if version is None:
+                    return None
+        if version is None:
+            return True
+        current: Union[VersionInfo, None] = self._versions.get(instance_id)
+        if current is None:
+            return None
+        return not current < version
+
+    def invalidate(self, instance_id: Union[str, None] = None) -> None:
+        """
+        Forgets what we know about an Instance, eg after it was upgraded.
+
+        Parameters
+        -----------
+        instance_id: Union[:class:`str`, None], optional
+            The Instance id, by default None (every Instance).
+        """
+        if instance_id is None:
+            self._versions.clear()
+            self._endpoints.clear()
+        else:
+            self._versions.pop(instance_id, None)
+            self._endpoints.pop(instance_id, None)
+
+
+class SpecCache:
+    """
+    Keeps the spec responses (eg ``Core/GetAPISpec``) that are the same for every Instance of a module on the same AMP version.
+
+    .. note::
+        The :class:`Bridge` creates an in memory cache for you; pass a :class:`FileSpecCache` to the :class:`Bridge` so a
+        restarted worker doesn't need to fetch them again.\n
+        Entries are keyed by the module and AMP version of the Instance, see :meth:`Core.get_api_spec`. Once an Instance is
+        upgraded its version changes and so does the key; there is no expiry.\n
+        API classes use :meth:`read` and :meth:`write`, which keep any file I/O of a subclass off the event loop.
+
+
+    .. warning::
+        Every caller gets the same cached response object; treat the responses of :meth:`Core.get_api_spec` and
+        :meth:`Core.get_permissions_spec` as read-only.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to always fetch the specs from each Instance, default is True.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+
+    def __init__(self) -> None:
+        self._entries: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(module: str, version: VersionInfo, api: str, sanitize_json: bool) -> str:
+        """
+        Builds the key of a spec response.
+
+        Parameters
+        -----------
+        module: :class:`str`
+            The Instance module, eg ``Minecraft``; Generic Instances should include their :attr:`Instance.module_display_name`.
+        version: :class:`VersionInfo`
+            The AMP version of the Instance.
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetAPISpec``.
+        sanitize_json: :class:`bool`
+            If the response was sanitized, see :meth:`Base.sanitize_json`.
+
+        Returns
+        --------
+        :class:`str`
+            The key, eg ``Minecraft-2.6.0.0-Core.GetAPISpec-raw``.
+        """
+        return "-".join(
+            (
+                module,
+                f"{version.major}.{version.minor}.{version.revision}.{version.minor_revision}",
+                api.replace("/", "."),
+                "sanitized" if sanitize_json is True else "raw",
+            )
+        )
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieves a spec response.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key, see :meth:`make_key`.
+
+        Returns
+        --------
+        Any
+            The spec response or None if we don't have it.
+        """
+        if self.enabled is False:
+            return None
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a spec response.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key, see :meth:`make_key`.
+        value: Any
+            The JSON spec response.
+        """
+        if self.enabled is False or value is None:
+            return
+        self._entries[key] = value
+
+    async def read(self, key: str) -> Any:
+        """|coro|
+
+        Same as :meth:`get`; without blocking the event loop when a subclass needs to read the response from a file.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key, see :meth:`make_key`.
+
+        Returns
+        --------
+        Any
+            The spec response or None if we don't have it.
+        """
+        return self.get(key)
+
+    async def write(self, key: str, value: Any) -> None:
+        """|coro|
+
+        Same as :meth:`set`; without blocking the event loop when a subclass needs to write the response to a file.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key, see :meth:`make_key`.
+        value: Any
+            The JSON spec response.
+        """
+        self.set(key, value)
+
+    def clear(self) -> None:
+        """
+        Forgets every spec response.
+        """
+        self._entries.clear()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} entries={len(self._entries)}>"
+
+
+class FileSpecCache(SpecCache):
+    """
+    A :class:`SpecCache` that also keeps each spec response as a gzip compressed JSON file in a directory.
+
+    .. note::
+        Every worker pointed at the same directory shares the files; files are written to a temp file first and then
+        moved in place, so a worker never reads half a file. Files of AMP versions no longer in use are never read again
+        and can be deleted at any time.\n
+        :meth:`read` and :meth:`write` compress and access the files in a worker thread; :meth:`get` and :meth:`set`
+        do so right away.
+
+
+    .. code-block:: python
+        :linenos:
+
+
+        _bridge = Bridge(api_params=_params, spec_cache=FileSpecCache(path="./amp_specs"))
+
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`Path`]
+        The directory to keep the files in, it is created if it does not exist.
+    json_codec: Union[:class:`JSONCodec`, None], optional
+        Encodes and decodes the files, by default None (see :func:`get_default_codec`).
+    compress_level: :class:`int`, optional
+        The gzip compression level, by default 6.
+    """
+
+    def __init__(self, path: Union[str, Path], json_codec: Union[JSONCodec, None] = None, compress_level: int = 6) -> None:
+        super().__init__()
+        self.path: Path = Path(path)
+        self.json_codec: JSONCodec = json_codec if json_codec is not None else get_default_codec()
+        self.compress_level: int = compress_level
+
+    def get(self, key: str) -> Any:
+        value: Any = super().get(key)
+        if value is not None or self.enabled is False:
+            return value
+        return self._remember(key=key, value=self._read_file(key=key))
+
+    def set(self, key: str, value: Any) -> None:
+        super().set(key, value)
+        if self.enabled is False or value is None:
+            return
+        self._write_file(key=key, value=value)
+
+    async def read(self, key: str) -> Any:
+        value: Any = super().get(key)
+        if value is not None or self.enabled is False:
+            return value
+        return self._remember(key=key, value=await asyncio.to_thread(self._read_file, key=key))
+
+    async def write(self, key: str, value: Any) -> None:
+        super().set(key, value)
+        if self.enabled is False or value is None:
+            return
+        await asyncio.to_thread(self._write_file, key=key, value=value)
+
+    def _remember(self, key: str, value: Any) -> Any:
+        if value is not None:
+            self._entries[key] = value
+        return value
+
+    def _read_file(self, key: str) -> Any:
+        try:
+            return self.json_codec.loads(data=gzip.decompress(self._file(key=key).read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            self._logger.warning("Failed to read the spec cache file for %s, it will be fetched again. %s", key, e)
+            return None
+
+    def _write_file(self, key: str, value: Any) -> None:
+        file: Path = self._file(key=key)
+        temp: Path = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            temp.write_bytes(gzip.compress(self.json_codec.dumps(obj=value), compresslevel=self.compress_level))
+            temp.replace(file)
+        except OSError as e:
+            # We still have it in memory; the next worker will just have to fetch it.
+            self._logger.warning("Failed to write the spec cache file for %s. %s", key, e)
+
+    def clear(self) -> None:
+        """
+        Forgets every spec response and deletes the files.
+        """
+        super().clear()
+        for file in self.path.glob("*.json.gz"):
+            file.unlink(missing_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{_UNSAFE_FILENAME.sub('_', key)}.json.gz"
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} path={str(self.path)!r} entries={len(self._entries)}>"
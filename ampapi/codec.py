@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; `pip install cc-ampapi[speed]`.
+    orjson = None
+
+__all__ = ("JSONCodec", "OrjsonCodec", "StdlibJSONCodec", "get_default_codec")
+
+
+class JSONCodec:
+    """
+    The interface used to encode API parameters and decode the JSON responses from AMP.
+
+    .. note::
+        Subclass this to use a different JSON library and pass it into the :class:`Bridge` via ``json_codec``.
+        See :func:`get_default_codec` for the codec used when none is provided.
+
+
+    """
+
+    name: str = "base"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """
+        Encodes ``obj`` as JSON.
+
+        Parameters
+        -----------
+        obj: Any
+            The object to encode.
+        pretty: :class:`bool`, optional
+            Indent the output and sort the keys, used for dump files, by default False.
+
+        Returns
+        --------
+        :class:`bytes`
+            The UTF-8 encoded JSON.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes JSON.
+
+        Parameters
+        -----------
+        data: Union[:class:`bytes`, :class:`str`]
+            The raw JSON, eg the body of a response.
+
+        Returns
+        --------
+        Any
+            The decoded JSON.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            When ``data`` is not valid JSON.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} name={self.name}>"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Uses the standard library :mod:`json` module, always available.
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=4, skipkeys=True, separators=(",", ": "), sort_keys=True).encode()
+        return json.dumps(obj).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Uses `orjson <https://github.com/ijl/orjson>`_ which encodes and decodes several times faster than :mod:`json`.
+
+    .. note::
+        Only available when ``orjson`` is installed, eg via ``pip install cc-ampapi[speed]``.
+        Pretty output is indented with 2 spaces instead of 4.
+
+
+    Raises
+    ------
+    :exc:`RuntimeError`
+        When ``orjson`` is not installed.
+    """
+
+    name: str = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("OrjsonCodec requires `orjson`; install it via `pip install cc-ampapi[speed]`.")
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+_default_codec: Union[JSONCodec, None] = None
+
+
+def get_default_codec() -> JSONCodec:
+    """
+    Retrieves the fastest available codec; :class:`OrjsonCodec` if ``orjson`` is installed otherwise :class:`StdlibJSONCodec`.
+
+    Returns
+    --------
+    :class:`JSONCodec`
+        The shared default codec.
+    """
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = OrjsonCodec() if orjson is not None else StdlibJSONCodec()
+        logging.getLogger(__name__).debug("DEBUG using %s as the default JSON codec", _default_codec)
+    return _default_codec
@@ -1,15 +1,243 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import fields
 from typing import Any, Union
 
 from .adsmodule import ADSModule
 from .core import Core
-from .dataclass import Controller, Instance
+from .dataclass import Controller, Instance, InstanceDelta
 from .emailsender import EmailSenderPlugin
+from .enums import AMPInstanceState
 from .filemanager import FileManagerPlugin
 from .instance import AMPADSInstance, AMPInstance, AMPMinecraftInstance
 
-__all__ = ("AMPControllerInstance",)
+__all__ = ("AMPControllerInstance", "InstanceIndex")
+
+# The Instance fields :class:`InstanceIndex` looks Instances up by.
+_INDEXED_FIELDS: frozenset[str] = frozenset(
+    {
+        "app_state",
+        "friendly_name",
+        "instance_id",
+        "instance_name",
+        "module",
+        "tags",
+        "target_id",
+    }
+)
+
+
+class InstanceIndex:
+    """
+    Looks up the Instances of an :class:`AMPControllerInstance` without scanning :attr:`~AMPControllerInstance.instances`.
+
+    .. note::
+        The :class:`AMPControllerInstance` keeps this up to date as :meth:`~AMPControllerInstance.get_instances` refreshes
+        the Instances, see :attr:`~AMPControllerInstance.instance_index`.\n
+        If you change an indexed attribute of an Instance yourself (eg via :meth:`Base.parse_data`) call :meth:`update`.\n
+        The secondary lookups return a :class:`frozenset`; empty if nothing matches.
+
+
+    .. code-block:: python
+        :linenos:
+
+
+        await controller.get_instances()
+        instance = controller.instance_index.get_by_name(name="Minecraft01")
+        for instance in controller.instance_index.find(module="Minecraft", tag="Survival"):
+            ...
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]] = {}
+        self._by_name: dict[str, Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]] = {}
+        self._by_friendly_name: dict[str, set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = {}
+        self._by_module: dict[str, set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = {}
+        self._by_target: dict[str, set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = {}
+        self._by_state: dict[AMPInstanceState, set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = {}
+        self._by_tag: dict[str, set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = {}
+        # The values each Instance was indexed under; so we can remove it without knowing its previous values.
+        self._keys: dict[str, tuple[str, str, str, str, AMPInstanceState, tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]:
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, instance_id: object) -> bool:
+        return instance_id in self._by_id
+
+    def get(self, instance_id: str) -> Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance, None]:
+        """
+        Retrieves an Instance by its :attr:`~Instance.instance_id`.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID.
+
+        Returns
+        --------
+        Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`, None]
+            The Instance or None if there is no such Instance.
+        """
+        return self._by_id.get(instance_id)
+
+    def get_by_name(self, name: str) -> Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance, None]:
+        """
+        Retrieves an Instance by its :attr:`~Instance.instance_name`.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The Instance name, eg ``Minecraft01``.
+
+        Returns
+        --------
+        Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`, None]
+            The Instance or None if there is no such Instance.
+        """
+        return self._by_name.get(name)
+
+    def find(
+        self,
+        friendly_name: Union[str, None] = None,
+        module: Union[str, None] = None,
+        target_id: Union[str, None] = None,
+        app_state: Union[AMPInstanceState, None] = None,
+        tag: Union[str, None] = None,
+    ) -> frozenset[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]:
+        """
+        Retrieves the Instances that match all of the given values.
+
+        Parameters
+        -----------
+        friendly_name: Union[:class:`str`, None], optional
+            The :attr:`~Instance.friendly_name`, by default None.
+        module: Union[:class:`str`, None], optional
+            The :attr:`~Instance.module`, eg ``Minecraft``, by default None.
+        target_id: Union[:class:`str`, None], optional
+            The :attr:`~Instance.target_id` of the Target ADS the Instances run on, by default None.
+        app_state: Union[:class:`AMPInstanceState`, None], optional
+            The :attr:`~Instance.app_state`, by default None.
+        tag: Union[:class:`str`, None], optional
+            One of the :attr:`~Instance.tags`, by default None.
+
+        Returns
+        --------
+        frozenset[Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]]
+            The matching Instances; every Instance if no values are given.
+        """
+        buckets: list[set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]] = []
+        for index, value in (
+            (self._by_friendly_name, friendly_name),
+            (self._by_module, module),
+            (self._by_target, target_id),
+            (self._by_state, app_state),
+            (self._by_tag, tag),
+        ):
+            if value is not None:
+                bucket: Union[set[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]], None] = index.get(value)
+                if not bucket:
+                    return frozenset()
+                buckets.append(bucket)
+        if not buckets:
+            return frozenset(self._by_id.values())
+        # Intersecting from the smallest bucket keeps this proportional to the number of matches.
+        buckets.sort(key=len)
+        return frozenset(buckets[0]).intersection(*buckets[1:])
+
+    def add(self, instance: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]) -> None:
+        """
+        Indexes an Instance, replacing any Instance with the same :attr:`~Instance.instance_id`.
+
+        Parameters
+        -----------
+        instance: Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]
+            The Instance to index.
+        """
+        previous: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance, None] = self._by_id.get(instance.instance_id)
+        if previous is not None:
+            self.remove(instance=previous)
+        keys: tuple[str, str, str, str, AMPInstanceState, tuple[str, ...]] = (
+            instance.instance_name,
+            instance.friendly_name,
+            instance.module,
+            instance.target_id,
+            instance.app_state,
+            tuple(instance.tags or ()),
+        )
+        self._keys[instance.instance_id] = keys
+        self._by_id[instance.instance_id] = instance
+        self._by_name[keys[0]] = instance
+        self._by_friendly_name.setdefault(keys[1], set()).add(instance)
+        self._by_module.setdefault(keys[2], set()).add(instance)
+        self._by_target.setdefault(keys[3], set()).add(instance)
+        self._by_state.setdefault(keys[4], set()).add(instance)
+        for tag in keys[5]:
+            self._by_tag.setdefault(tag, set()).add(instance)
+
+    def remove(self, instance: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]) -> None:
+        """
+        Removes an Instance from the index, if it is indexed.
+
+        Parameters
+        -----------
+        instance: Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]
+            The Instance to remove.
+        """
+        keys: Union[tuple[str, str, str, str, AMPInstanceState, tuple[str, ...]], None] = self._keys.pop(
+            instance.instance_id, None
+        )
+        if keys is None:
+            return
+        indexed: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance] = self._by_id.pop(instance.instance_id)
+        if self._by_name.get(keys[0]) is indexed:
+            del self._by_name[keys[0]]
+        self._discard(index=self._by_friendly_name, key=keys[1], instance=indexed)
+        self._discard(index=self._by_module, key=keys[2], instance=indexed)
+        self._discard(index=self._by_target, key=keys[3], instance=indexed)
+        self._discard(index=self._by_state, key=keys[4], instance=indexed)
+        for tag in keys[5]:
+            self._discard(index=self._by_tag, key=tag, instance=indexed)
+
+    def update(self, instance: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]) -> None:
+        """
+        Re-indexes an Instance after its attributes changed.
+
+        Parameters
+        -----------
+        instance: Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]
+            The Instance to re-index.
+        """
+        self.add(instance=instance)
+
+    def clear(self) -> None:
+        """
+        Removes every Instance from the index.
+        """
+        for index in (
+            self._by_id,
+            self._by_name,
+            self._by_friendly_name,
+            self._by_module,
+            self._by_target,
+            self._by_state,
+            self._by_tag,
+            self._keys,
+        ):
+            index.clear()
+
+    @staticmethod
+    def _discard(index: dict[Any, set[Any]], key: Any, instance: Any) -> None:
+        bucket: Union[set[Any], None] = index.get(key)
+        if bucket is not None:
+            bucket.discard(instance)
+            if not bucket:
+                del index[key]
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} instances={len(self._by_id)}>"
 
 
 class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugin, Controller):
@@ -27,6 +255,9 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
     def __init__(self) -> None:
         super().__init__()
         self.module: str = "ADS"
+        # Our converted Instances by `instance_id` and other fields; a refresh updates the existing objects instead of replacing them.
+        self.instance_index: InstanceIndex = InstanceIndex()
+        self.instances_delta: InstanceDelta = InstanceDelta()
 
     def __getattr__(self, name: str) -> Union[AttributeError, Any]:
         if name in [field.name for field in fields(class_or_instance=Controller)] and self._controller_exists is False:
@@ -43,7 +274,7 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
 
         .. note::
             Similar to :attr:`~Controller.available_instance` but converted into a type of :class:`AMPInstance` classes that have API functions.\n
-            The set of :class:`AMPInstance` types will be ordered by :attr:`~Instance.instance_id`.
+            Each refresh keeps the existing object of an Instance and updates it in place, see :meth:`reconcile_instances`.
 
 
         Returns
@@ -56,16 +287,14 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
     @instances.setter
     def instances(self, data: Any) -> None:
         """
-        self.instances setter will take :attr:`~Controller.available_instances` and convert them into a type of :class:`AMPInstance`.
+        self.instances setter will take :attr:`~Controller.available_instances` and reconcile them with our :class:`AMPInstance` objects.
 
         Parameters
         -----------
         data: Any
             A list of :class:`Instance`.
         """
-        self._instances: set[Union[AMPInstance, AMPMinecraftInstance, AMPADSInstance]] = self.instance_conversion(
-            instances=self.available_instances
-        )
+        self.reconcile_instances(instances=self.available_instances)
 
     def instance_conversion(
         self, instances: Iterable[Instance]
@@ -91,18 +320,88 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
         conv_instances: set[Union[AMPInstance, AMPMinecraftInstance, AMPADSInstance]] = set()
         if isinstance(instances, list) and len(instances) > 0:
             for entry in instances:
-                if entry.module == "ADS":
-                    conv_instances.add(AMPADSInstance(data=entry, controller=self))
+                conv_instances.add(self._convert_instance(data=entry))
+        return conv_instances
 
-                elif entry.module == "Minecraft":
-                    conv_instances.add(AMPMinecraftInstance(data=entry, controller=self))
+    def reconcile_instances(self, instances: Iterable[Instance]) -> InstanceDelta:
+        """
+        Updates :attr:`instances` to match a fresh list of :class:`Instance` dataclasses.
 
-                else:
-                    conv_instances.add(AMPInstance(data=entry, controller=self))
-        return conv_instances
+        .. note::
+            Existing :class:`AMPInstance` objects are kept and only the :class:`Instance` fields that changed are set on them;
+            so any state you attached to them survives a refresh. New Instances are converted, see :meth:`instance_conversion`,
+            and Instances that are gone are dropped.\n
+            The result is also kept in :attr:`instances_delta`.
+
+
+        Parameters
+        -----------
+        instances: Iterable[:class:`Instance`]
+            Every Instance the :class:`AMPControllerInstance` can see; any Instance not in here is removed.
+
+        Returns
+        --------
+        :class:`InstanceDelta`
+            The Instances that were added, removed and which of their fields changed.
+        """
+        delta: InstanceDelta = InstanceDelta()
+        index: InstanceIndex = self.instance_index
+        names: tuple[str, ...] = tuple(field.name for field in fields(class_or_instance=Instance))
+        current: dict[str, Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]] = {}
+        for entry in instances:
+            existing: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance, None] = index.get(
+                instance_id=entry.instance_id
+            )
+            if existing is None or existing.module != entry.module:
+                if existing is not None:
+                    delta.removed.append(existing)
+                converted: Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance] = self._convert_instance(data=entry)
+                index.add(instance=converted)
+                delta.added.append(converted)
+                current[entry.instance_id] = converted
+                continue
+
+            changed: list[str] = []
+            for name in names:
+                value: Any = getattr(entry, name)
+                if getattr(existing, name, None) != value:
+                    setattr(existing, name, value)
+                    changed.append(name)
+            if changed:
+                delta.changed[entry.instance_id] = frozenset(changed)
+                if _INDEXED_FIELDS.isdisjoint(changed) is False:
+                    index.update(instance=existing)
+                if "amp_version" in changed and existing.amp_version is not None:
+                    self._bridge.capabilities.set_version(instance_id=existing.instance_id, version=existing.amp_version)
+            current[entry.instance_id] = existing
+
+        for instance in index:
+            if instance.instance_id not in current:
+                index.remove(instance=instance)
+                delta.removed.append(instance)
+
+        # A new set each refresh; so a caller iterating the previous one is not affected.
+        self._instances: set[Union[AMPInstance, AMPMinecraftInstance, AMPADSInstance]] = set(current.values())
+        self.instances_delta = delta
+        if delta:
+            self.logger.debug(
+                "DEBUG %s instances added: %s removed: %s changed: %s",
+                type(self).__name__,
+                len(delta.added),
+                len(delta.removed),
+                len(delta.changed),
+            )
+        return delta
+
+    def _convert_instance(self, data: Instance) -> Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]:
+        if data.module == "ADS":
+            return AMPADSInstance(data=data, controller=self)
+        elif data.module == "Minecraft":
+            return AMPMinecraftInstance(data=data, controller=self)
+        return AMPInstance(data=data, controller=self)
 
     async def get_instances(
-        self, include_self: bool = True, format_data: Union[bool, None] = None
+        self, include_self: bool = True, format_data: Union[bool, None] = None, lazy: bool = False
     ) -> Union[set[Union[AMPInstance, AMPMinecraftInstance, AMPADSInstance]], Iterable[Union[Controller, Instance]]]:
         """|coro|
 
@@ -120,6 +419,9 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
         -----------
         format_data: Union[:class:`bool`, None], optional
             Format the JSON response data. (Uses ``FORMAT_DATA`` global constant if None), by default None.
+        lazy: :class:`bool`, optional
+            Has no effect here and is only kept so the signature matches :meth:`ADSModule.get_instances`; turning the Instances into
+            :attr:`instances` reads every field anyway, so they are always decoded up front, by default False.
 
         Returns
         --------
@@ -127,8 +429,9 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
             On success returns a set of :class:`AMPInstance`, :class:`AMPMinecraftInstance` and or :class:`AMPADSInstance` dataclasses. \n
 
         """
+        # `reconcile_instances` reads every field of every Instance; lazy views would only add overhead to that.
         result: list[Union[Controller, Instance]] = await super().get_instances(
-            include_self=include_self, format_data=format_data
+            include_self=include_self, format_data=format_data, lazy=False
         )
 
         if isinstance(result[0], Controller):
@@ -141,18 +444,15 @@ class AMPControllerInstance(ADSModule, Core, EmailSenderPlugin, FileManagerPlugi
             self._controller_exists = True
             self.url = _url
             # Since we populated all the attributes from result[0] onto ourselves;
-            # we can convert Controller.available_instances dynamically by
-            # setting it to our self.instances attribute using the @setter for instances attribute.
-            self.instances = self.available_instances
-            # Then we remove the Controller from the list as we converted that object and don't want to re-add those instances again.
-            result.pop(0)
-            # Now we are going to go through and find any other Controllers and place all those Instances under our self object.
-            for i in result:
-                # If we have another Controller, we want to get it's available_instances and convert them into proper objects to be used.
+            # we gather the Instances of every Controller (us first) and reconcile them with our self.instances attribute in one go,
+            # otherwise the Instances of the other Controllers would be seen as removed.
+            available: list[Instance] = list(self.available_instances)
+            for i in result[1:]:
+                # If we have another Controller, we want its available_instances placed under our self object too.
                 if isinstance(i, Controller):
                     self.logger.debug("Found an additional Controller dataclass: %s | %s", id(i), i)
-                    # after the conversion we are updating our instance attribute; we cannot overwrite the attribute as we just updated the attribute above.
-                    self.instances.update(self.instance_conversion(instances=i.available_instances))
+                    available.extend(i.available_instances)
+            self.reconcile_instances(instances=available)
 
             return self.instances
 
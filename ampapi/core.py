@@ -1,8 +1,7 @@
 import warnings
 from datetime import datetime
-from typing import Any, Literal, Union, overload
+from typing import TYPE_CHECKING, Any, Literal, Union, overload
 
-from pyotp import TOTP
 from typing_extensions import deprecated
 
 from .base import Base
@@ -26,11 +25,14 @@ from .dataclass import (
     UpdateInfo,
     Updates,
     User,
-    VersionInfo,
 )
 from .modules import TriggerID, UserApplicationData
 from .types_ import ActionSpec, APISpec, PermissionNode, ScheduleDataData, TriggersData
 
+if TYPE_CHECKING:
+    from .capability import CapabilityRegistry, SpecCache
+    from .dataclass import VersionInfo
+
 __all__: tuple[Literal["Core"]] = ("Core",)
 
 
@@ -55,6 +57,63 @@ class Core(Base):
         except AttributeError:
             raise AttributeError("You need to first call function <Core.get_triggers()> before accessing this attribute.")
 
+    async def _call_spec_api(self, api: str, sanitize_json: bool = True) -> Any:
+        """|coro|
+
+        Calls a spec endpoint unless the :class:`SpecCache` of the :class:`Bridge` has the response for the module and AMP version
+        of this Instance already.
+
+        .. note::
+            Only for responses that are the same for every Instance of a module on the same AMP version;
+            Instances without a :attr:`module` always make the request.
+
+
+        Parameters
+        -----------
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetAPISpec``.
+        sanitize_json: :class:`bool`, optional
+            Sanitize the JSON response, by default True.
+
+        Returns
+        --------
+        Any
+            The JSON response.
+        """
+        spec_cache: SpecCache = self._bridge.spec_cache
+        module: Union[str, None] = getattr(self, "module", None)
+        key: Union[str, None] = None
+        if spec_cache.enabled is True and module is not None:
+            capabilities: CapabilityRegistry = self._bridge.capabilities
+            version: Union[VersionInfo, None] = capabilities.get_version(instance_id=self.instance_id)
+            if version is None:
+                diagnostics: Any = await self._call_api(
+                    api="Core/GetDiagnosticsInfo",
+                    format_data=True,
+                    format_=Diagnostics,
+                    _use_from_dict=False,
+                    _auto_unpack=True,
+                )
+                if isinstance(diagnostics, Diagnostics):
+                    version = capabilities.set_version(instance_id=self.instance_id, version=diagnostics.application_version)
+            if version is not None:
+                # Generic Instances share a module but not their application; neither do Minecraft Java and Bedrock.
+                display_name: str = getattr(self, "module_display_name", "")
+                key = spec_cache.make_key(
+                    module=f"{module}.{display_name}" if display_name else module,
+                    version=version,
+                    api=api,
+                    sanitize_json=sanitize_json,
+                )
+                result: Any = await spec_cache.read(key=key)
+                if result is not None:
+                    return result
+
+        result = await self._call_api(api=api, sanitize_json=sanitize_json)
+        if key is not None and isinstance(result, (dict, list)):
+            await spec_cache.write(key=key, value=result)
+        return result
+
     async def _create_test_task(self) -> None:
         """|coro|
 
@@ -545,6 +604,8 @@ class Core(Base):
         :class:`ActionResult`
             On success returns a :class:`ActionResult` dataclass.
         """
+        from pyotp import TOTP
+
         await self._connect()
         parameters: dict[str, str] = {"Password": self._bridge.password, "TwoFactorCode": TOTP(self._bridge.token).now()}
         result: Any = await self._call_api(
@@ -867,7 +928,9 @@ class Core(Base):
         Get's all the API specs for the Instance.
 
         .. note::
-            See :ref:`API Reference <Documentation>` for more information.
+            See :ref:`API Reference <Documentation>` for more information.\n
+            The spec is the same for every Instance of a module on the same AMP version; it is kept in the :class:`SpecCache`
+            of the :class:`Bridge` and only fetched once per module and version.
 
 
         Returns
@@ -877,7 +940,10 @@ class Core(Base):
         """
 
         await self._connect()
-        result: Any = await self._call_api(api="Core/GetAPISpec", sanitize_json=sanitize_json)
+        result: Any = await self._call_spec_api(api="Core/GetAPISpec", sanitize_json=sanitize_json)
+        # The sanitized spec has snake_case names; so only the raw one tells us the endpoint names.
+        if sanitize_json is False and isinstance(result, dict):
+            self._bridge.capabilities.set_api_spec(instance_id=self.instance_id, spec=result)
         return result
 
     async def get_audit_log_entries(
@@ -947,7 +1013,8 @@ class Core(Base):
         Returns the config settings for a specific node.
 
         .. note::
-            See :ref:`Setting Nodes <Documentation>` for more information.
+            See :ref:`Setting Nodes <Documentation>` for more information.\n
+            Calls made close together for the same Instance are sent as one ``Core/GetConfigs`` request, see :class:`ConfigBatcher`.
 
 
         Parameters
@@ -964,6 +1031,10 @@ class Core(Base):
         """
 
         await self._connect()
+        if self._bridge._config_batcher.enabled is True:
+            result: Any = await self._bridge._config_batcher.get_config(owner=self, node=node)
+            return self._format_response(data=result, format_data=format_data, format_=SettingSpec)
+
         parameters: dict[str, str] = {"node": node}
         result: Any = await self._call_api(
             api="Core/GetConfig", parameters=parameters, format_data=format_data, format_=SettingSpec
@@ -1024,6 +1095,8 @@ class Core(Base):
             _use_from_dict=False,
             _auto_unpack=True,
         )
+        if isinstance(result, Diagnostics):
+            self._bridge.capabilities.set_version(instance_id=self.instance_id, version=result.application_version)
         return result
 
     async def get_module_info(self, format_data: Union[bool, None] = None) -> Module:
@@ -1084,6 +1157,10 @@ class Core(Base):
 
         Retrieves the AMP Permissions node tree.
 
+        .. note::
+            Like :meth:`get_api_spec` this is kept in the :class:`SpecCache` of the :class:`Bridge`; except for the ADS,
+            which has permission nodes for each of its Instances.
+
         Returns
         --------
         list[:class:`PermissionNode`]
@@ -1091,7 +1168,10 @@ class Core(Base):
         """
 
         await self._connect()
-        result: Any = await self._call_api(api="Core/GetPermissionsSpec")
+        if getattr(self, "module", None) == "ADS":
+            result: Any = await self._call_api(api="Core/GetPermissionsSpec")
+        else:
+            result = await self._call_spec_api(api="Core/GetPermissionsSpec")
         return result
 
     async def get_port_summaries(self, format_data: Union[bool, None] = None) -> list[Port]:
@@ -1588,7 +1668,9 @@ class Core(Base):
 
         await self._connect()
         try:
-            await self.version_validation(version=VersionInfo(2, 6, 0, 0))
+            await self.version_validation(
+                version=self.endpoint_versions["Core/UpdateAccountInfo"], api="Core/UpdateAccountInfo"
+            )
         except RuntimeError as e:
             return e
 
@@ -2062,6 +2144,10 @@ class Core(Base):
 
         Set a Setting Node value.
 
+        .. note::
+            Calls made close together for the same Instance are sent as one ``Core/SetConfigs`` request, see :class:`ConfigBatcher`.
+
+
         Parameters
         -----------
         name: :class:`str`
@@ -2077,6 +2163,10 @@ class Core(Base):
             On success returns a :class:`ActionResult` dataclass.
         """
         await self._connect()
+        if self._bridge._config_batcher.enabled is True:
+            result: Any = await self._bridge._config_batcher.set_config(owner=self, node=node, value=value)
+            return self._format_response(data=result, format_data=format_data, format_=ActionResult)
+
         parameters: dict[str, str] = {"node": node, "value": value}
         result: Any = await self._call_api(
             api="Core/SetConfig", parameters=parameters, format_data=format_data, format_=ActionResult
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import logging
+import random
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from logging import Logger
@@ -9,15 +10,15 @@ from operator import attrgetter
 from pprint import pformat
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Union
 
-from dataclass_wizard.errors import MissingFields
 from typing_extensions import Self
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Callable, Coroutine, Mapping
     from typing import Concatenate
 
     from typing_extensions import ParamSpec, Self, TypeVar
 
+    from .instance import AMPADSInstance, AMPInstance, AMPMinecraftInstance
     from .types_ import MCUserData
 
     D = TypeVar("D", bound="Instance")
@@ -40,8 +41,10 @@ from .enums import (
     PostCreateActionsState,
     PostCreateState,
     ReleaseStreamState,
+    RequestPriority,
     TwoFactoryModeState,
 )
+from .timestamp import timestamps
 
 SettingSpecTableAliases = Union[
     AccessModeState,
@@ -108,12 +111,18 @@ def attribute_converter(data: dict[str, Any]) -> dict[str, Any]:
     return new_vars
 
 
+def _field_values(data: Any) -> dict[str, Any]:
+    # Our response dataclasses use `slots=True` so `vars()` doesn't work on them; used by their `__repr__`.
+    return {item.name: getattr(data, item.name) for item in fields(data)}
+
+
 def timestamp_converter(data: str) -> datetime:
     """
     Convert either the ``C#`` date str into a Python :class:`datetime` object or the ISO format.
 
     .. note::
-        This is for older than 2.6.0.0 AMP Installs.
+        This is for older than 2.6.0.0 AMP Installs.\n
+        Uses the shared :class:`TimestampDecoder`, which memoises the converted strings; see ``timestamps``.
 
 
     Parameters
@@ -127,13 +136,10 @@ def timestamp_converter(data: str) -> datetime:
         The converted string as a :class:`datetime` object..
     """
 
-    if data.startswith("/Date"):
-        return datetime.fromtimestamp(int(data[6:-2]) / 1000)
-    else:
-        return datetime.fromisoformat(data)
+    return timestamps.to_datetime(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """
     Represents the JSON response data from most API Endpoints.
@@ -153,10 +159,10 @@ class ActionResult:
     result: Union[str, None] = field(default=None)
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsCountryData:
     """
     Represents the JSON response data from :attr:`~AnalyticsSummary.country_data`.
@@ -254,7 +260,7 @@ class AnalyticsFilter:
             raise ValueError(f"The Country attribute must be in ISO 3166-1 Alpha-2 format. | Received: {self.country}")
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsStats:
     """
     Represents the JSON response data from :attr:`AnalyticsSummary.stats`.
@@ -289,7 +295,7 @@ class AnalyticsStats:
     previous: Union[int, str, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsSummary:
     """
     Represents the JSON response data from :meth:`~AnalyticsPlugin.get_analytics_summary`.
@@ -321,10 +327,10 @@ class AnalyticsSummary:
     top_players: list[AnalyticsTopPlayers] = field(default_factory=list)
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsTopPlayers:
     """
     Represents the JSON Response data from :attr:`~Analytics_Summary.top_players`.
@@ -393,13 +399,16 @@ class APISession:
         The ``SESSIONID`` dict key from the JSON response of :meth:`Login`.
     ttl: :class:`datetime`
         The time to live of the :attr:`id`. This can be adjusted by ::class:`Base.session_ttl` value.
+    last_used: :class:`datetime`
+        The last time the :attr:`id` was used successfully, AMP expires sessions by inactivity, default is :meth:`datetime.now`.
     """
 
     id: str
     ttl: datetime
+    last_used: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Application:
     """
     Represents the JSON response data from :meth:`MinecraftModule.get_supported_applications`.
@@ -453,10 +462,10 @@ class Application:
     settings: dict = field(default_factory=dict)
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """
     Represents the JSON response data from :meth:`Core.get_audit_log_entries`
@@ -489,15 +498,16 @@ class AuditLogEntry:
     source: str
     user: str
     timestamp: str  # type:ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("timestamp",)
 
     def __post_init__(self) -> None:
         self.timestamp: datetime = timestamp_converter(data=self.timestamp)  # type:ignore
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class Backup:
     """
     Represents the JSON response data from :meth:`ADSModule.get_backups`.
@@ -542,15 +552,16 @@ class Backup:
     taken_by: str
     total_size_bytes: int
     timestamp: str  # type: ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("timestamp",)
 
     def __post_init__(self) -> None:
         self.timestamp: datetime = timestamp_converter(data=self.timestamp)  # type:ignore
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class BukkitPlugin:
     """
     Represents the JSON response data from any Bukkit function call. Related to :class:`MinecraftModule`.
@@ -633,10 +644,46 @@ class BukkitPlugin:
     donation_link: str = field(default="")
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
 @dataclass
+class ConnectionSettings:
+    """
+    Connection pool settings for the shared :class:`aiohttp.ClientSession` owned by the :class:`Bridge`.
+
+    .. note::
+        Pass this into the :class:`Bridge` via the ``connection_settings`` parameter. All API classes share the same pool.
+
+
+    Attributes
+    -----------
+    limit: :class:`int`
+        The total number of simultaneous connections the pool will open, default is 100.
+    limit_per_host: :class:`int`
+        The number of simultaneous connections to the same host, ``0`` means no limit, default is 0.
+    use_dns_cache: :class:`bool`
+        Cache the resolved DNS entries, default is True.
+    ttl_dns_cache: Union[:class:`int`, None]
+        How long (in seconds) a resolved DNS entry is cached for, ``None`` caches forever, default is 10.
+    keepalive_timeout: :class:`float`
+        How long (in seconds) an idle connection is kept open for re-use, default is 30.0.
+    enable_cleanup_closed: :class:`bool`
+        Aborts SSL connections that were not shut down properly by the remote host, default is False.
+    verify_ssl: :class:`bool`
+        Validate the SSL certificate of the AMP Web Panel, default is True.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Union[int, None] = 10
+    keepalive_timeout: float = 30.0
+    enable_cleanup_closed: bool = False
+    verify_ssl: bool = True
+
+
+@dataclass(slots=True)
 class ConsoleEntries:
     """
     Represents the JSON response data from :attr:`Updates.console_entries`.
@@ -658,12 +705,13 @@ class ConsoleEntries:
     source: str
     type: str
     timestamp: str  # type: ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("timestamp",)
 
     def __post_init__(self) -> None:
         self.timestamp: datetime = timestamp_converter(data=self.timestamp)  # type:ignore
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
 @dataclass
@@ -743,6 +791,7 @@ class Controller:
     state_reason: str = ""
     description: str = ""
     tags_list: Union[list[str], None] = field(default=None)
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("last_updated",)
 
     def __post_init__(self) -> None:
         self.last_updated: datetime = timestamp_converter(data=self.last_updated)  # type:ignore
@@ -772,7 +821,7 @@ class Controller:
         # return res
 
 
-@dataclass
+@dataclass(slots=True)
 class CPUInfo:
     """
 
@@ -807,10 +856,10 @@ class CPUInfo:
     total_threads: int
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateInstance:
     """
     Represents the JSON response data from :meth:`ADSModule.create_instance` function call.
@@ -878,7 +927,7 @@ class CreateInstance:
     # Having default values could be an issue if they forget to set something with auto_configure is False.
 
 
-@dataclass
+@dataclass(slots=True)
 class DCConsumes:
     """
     Represents the JSON response data from :attr:`~Methods.consumes`.
@@ -911,7 +960,7 @@ class DCConsumes:
 
 
 # TODO - update docstring
-@dataclass
+@dataclass(slots=True)
 class DCParameterMapping:
     """
     Represents the JSON response data for :attr:`~TriggerTasks.parameter_mapping`
@@ -934,7 +983,7 @@ class DCParameterMapping:
     subtitle: str = field(default="")
 
 
-@dataclass
+@dataclass(slots=True)
 class Diagnostics:
     """
     Represents the JSON response data from :meth:`Core.get_diagnostics_info`.
@@ -1009,16 +1058,17 @@ class Diagnostics:
     tools_version: str
     virtualization: str
     os: str
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("application_version",)
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
     def __post_init__(self) -> None:
         if isinstance(self.application_version, str):
             self.application_version = VersionInfo.to_dataclass(data=self.application_version)
 
 
-@dataclass
+@dataclass(slots=True)
 class Directory:
     """
     Represents the JSON response data from :meth:`FileManagerPlugin.get_directory_listing`
@@ -1057,13 +1107,14 @@ class Directory:
     is_excluded_from_backups: bool
     created: str  # type: ignore
     modified: str  # type: ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("created", "modified")
 
     def __post_init__(self) -> None:
         self.created: datetime = timestamp_converter(self.created)  # type: ignore
         self.modified: datetime = timestamp_converter(self.modified)  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoints:
     """
     Represents the JSON response data from :meth:`ADSModule.get_application_endpoints`
@@ -1084,7 +1135,7 @@ class Endpoints:
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChunk:
     """
     Represents the JSON response data from :meth:`FileManagerPlugin.get_file_chunk`
@@ -1102,7 +1153,7 @@ class FileChunk:
     bytes_length: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Fitness:
     """
     Represents the JSON response data for :attr:`Instance.fitness` attribute.
@@ -1149,6 +1200,57 @@ class Fitness:
 
 
 @dataclass
+class HedgeStats:
+    """
+    The hedging metrics of an API endpoint, see :meth:`RequestHedger.get_stats`.
+
+
+    Attributes
+    -----------
+    api: :class:`str`
+        The API endpoint these metrics are for.
+    requests: :class:`int`
+        The number of calls made through the :class:`RequestHedger`.
+    hedged: :class:`int`
+        The number of calls that sent a second (hedge) request.
+    hedge_wins: :class:`int`
+        The number of hedge requests that answered before the original request.
+    delay: :class:`float`
+        The current delay in seconds before a hedge request is sent.
+    """
+
+    api: str
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    delay: float = 0.0
+
+    @property
+    def hedge_rate(self) -> float:
+        """
+        The fraction of calls that sent a hedge request.
+
+        Returns
+        --------
+        :class:`float`
+            The hedge rate, ``0.0`` if no calls were made yet.
+        """
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """
+        The fraction of hedge requests that answered first.
+
+        Returns
+        --------
+        :class:`float`
+            The win rate, ``0.0`` if no hedge requests were sent yet.
+        """
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+@dataclass(slots=True)
 class InstanceDatastore:
     """
     Represents a the class object to be used in :meth:`ADSModule.add_datastore`
@@ -1204,7 +1306,32 @@ class InstanceDatastore:
     sanitized_name: str = field(default="None")
 
 
-@dataclass
+@dataclass(slots=True)
+class InstanceDelta:
+    """
+    What changed in :attr:`AMPControllerInstance.instances` since the previous refresh, see :meth:`AMPControllerInstance.reconcile_instances`.
+
+
+    Attributes
+    -----------
+    added: list[Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]]
+        The Instances that are new, default is empty.
+    removed: list[Union[:class:`AMPADSInstance`, :class:`AMPInstance`, :class:`AMPMinecraftInstance`]]
+        The Instances that are gone, default is empty.
+    changed: dict[:class:`str`, frozenset[:class:`str`]]
+        The :attr:`~Instance.instance_id` of each updated Instance and the names of the :class:`Instance` fields that changed,
+        default is empty.
+    """
+
+    added: list[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]] = field(default_factory=list)
+    removed: list[Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]] = field(default_factory=list)
+    changed: dict[str, frozenset[str]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass(slots=True)
 class InstanceInfo:
     """
     Represents the JSON response data for :meth:`ADSModule.update_instance_info`.
@@ -1350,6 +1477,7 @@ class Instance:
     description: str = ""
 
     _instance_offline: str = "The requested instance is not available at this time."
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("amp_version",)
 
     def __post_init__(self) -> None:
         if self.amp_version is not None:
@@ -1359,7 +1487,7 @@ class Instance:
                 try:
                     setattr(self, "amp_version", VersionInfo(**self.amp_version))
                 except Exception as e:
-                    _logger: Logger = logging.getLogger()
+                    _logger: Logger = logging.getLogger(__name__)
                     _logger.warning("We attempted to unpack <self.amp_version> and failed %s", e)
                     return
             if isinstance(self.amp_version, str):
@@ -1421,7 +1549,7 @@ class InstanceStatus:
     running: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginResults:
     """
     Represents the JSON response data from the AMP Login response.
@@ -1454,7 +1582,7 @@ class LoginResults:
     user_info: Union[LoginUserInfo, None] = field(default=None)  # second data class
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginUserInfo:
     """
     Represents an AMP users information, tied to :class:`LoginResults` along with representing the JSON response from the function :meth`~Core.get_amp_users_summary`
@@ -1488,12 +1616,13 @@ class LoginUserInfo:
     is_ldap_user: bool
     last_login: str  # type: ignore
     email_address: str = ""
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("last_login",)
 
     def __post_init__(self) -> None:
         self.last_login: datetime = timestamp_converter(self.last_login)  # type:ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class MCUser:
     """
     Represents the JSON response data from :meth:`MinecraftModule.mc_get_whitelist`.
@@ -1511,7 +1640,7 @@ class MCUser:
     uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Messages:
     """
     Represents a Message from the dataclass attribute :attr:`Updates.messages`
@@ -1538,7 +1667,7 @@ class Messages:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Methods:
     """
     Tied to :attr:`ScheduleData.available_methods`.
@@ -1570,7 +1699,7 @@ class Methods:
         return isinstance(other, self.__class__) and self.name < other.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """
     Represents the JSON response data for :attr:`AppStatus.metrics` and :attr:`Instance.metrics`.
@@ -1591,7 +1720,7 @@ class Metric:
     memory_usage: Union[None, MetricsData] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsData:
     """
     Represents the JSON response data for each of the attributes of :class:`Metrics`.
@@ -1624,7 +1753,7 @@ class MetricsData:
     color3: Union[None, str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     """
     Represents the JSON response data from :meth:`Core.get_module_info`
@@ -1713,7 +1842,7 @@ class Module:
     version_codename: str  # ': 'Callisto'}
 
 
-@dataclass
+@dataclass(slots=True)
 class OPList:
     """
     Represents the JSON response data from :meth:`MinecraftModule.get_op_whitelist`.
@@ -1734,7 +1863,7 @@ class OPList:
     uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OPWhitelist:
     """
     Represents the JSON response data from :meth:`MinecraftModule.get_op_whitelist`.
@@ -1752,7 +1881,7 @@ class OPWhitelist:
     whitelist: list[MCUserData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformInfo:
     """
     Represents the data from the attribute :attr:`RemoteTargetInfo.platform_info`.
@@ -1816,7 +1945,7 @@ class Player(NamedTuple):
         return isinstance(other, self.__class__) and self.name < other.name
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Players:
     """
     Represents the JSON response data from :meth:`~Core.get_user_list`.
@@ -1862,7 +1991,7 @@ class Players:
         return [p for p in self.sorted if name_or_uuid in (p.name, p.uuid)]
 
 
-@dataclass
+@dataclass(slots=True)
 class Port:
     """
 
@@ -1893,7 +2022,7 @@ class Port:
     is_delayed_open: Union[bool, None] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Provision:
     """
     Represents the JSON response data from :meth:`ADSModule.get_provision_fitness`.
@@ -1932,7 +2061,7 @@ class Provision:
     total_services: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProvisionSettingInfo:
     """
     Represents the JSON response data from :meth:`ADSModule.get_provision_arguments`.
@@ -1962,7 +2091,7 @@ class ProvisionSettingInfo:
     value_range: Union[int, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PortInfo:
     """
     Represents the JSON response data from :meth:`ADSModule.get_instance_network_info`.
@@ -1996,6 +2125,84 @@ class PortInfo:
 
 
 @dataclass
+class QueueStats:
+    """
+    The queue-wait statistics of a :class:`RequestScheduler` lane, see :meth:`RequestScheduler.get_stats`.
+
+
+    Attributes
+    -----------
+    priority: :class:`RequestPriority`
+        The lane these statistics are for.
+    waiting: :class:`int`
+        The number of requests currently waiting for a slot.
+    in_flight: :class:`int`
+        The number of requests currently holding a slot.
+    granted: :class:`int`
+        The number of requests that were granted a slot.
+    total_wait: :class:`float`
+        The total time in seconds granted requests spent waiting for a slot.
+    max_wait: :class:`float`
+        The longest time in seconds a request waited for a slot.
+    """
+
+    priority: RequestPriority
+    waiting: int = 0
+    in_flight: int = 0
+    granted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """
+        The average time in seconds granted requests spent waiting for a slot.
+
+        Returns
+        --------
+        :class:`float`
+            The average wait, ``0.0`` if no request was granted yet.
+        """
+        return self.total_wait / self.granted if self.granted else 0.0
+
+
+@dataclass(slots=True)
+class RawResponse:
+    """
+    The undecoded response of an API call made with ``raw=True``, see :meth:`Base.call_end_point`.
+
+    .. note::
+        Meant for relays and proxies that forward the JSON response as is; the body is never decoded or sanitized.
+
+
+    Attributes
+    -----------
+    status: :class:`int`
+        The HTTP status code, always ``200`` as other status codes raise a :exc:`ConnectionError`.
+    headers: Mapping[:class:`str`, :class:`str`]
+        The response headers, eg ``Content-Type``.
+    body: :class:`bytes`
+        The raw JSON response body.
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        A zero-copy view of :attr:`body`, eg to slice or write it out without copying.
+
+        Returns
+        --------
+        :class:`memoryview`
+            The view of the response body.
+        """
+        return memoryview(self.body)
+
+
+@dataclass(slots=True)
 class RemoteTargetInfo:
     """
     Represents the JSON response data from :meth:`ADSModule.get_target_info`.
@@ -2019,6 +2226,53 @@ class RemoteTargetInfo:
 
 
 @dataclass
+class RetryPolicy:
+    """
+    How the :class:`Bridge` retries idempotent API calls (see :attr:`Base.idempotent_endpoints`) after a transport error.
+
+    .. note::
+        Pass this into the :class:`Bridge` via the ``retry_policy`` parameter. Calls that change state on AMP are never retried.
+
+
+    Attributes
+    -----------
+    max_retries: :class:`int`
+        The number of times a failed call is retried, ``0`` disables retries, default is 3.
+    base_delay: :class:`float`
+        The delay (in seconds) before the first retry, doubled on every following retry, default is 0.2.
+    max_delay: :class:`float`
+        The upper limit (in seconds) of the delay between retries, default is 5.0.
+    jitter: :class:`float`
+        The fraction of the delay that is randomized so callers do not retry in lockstep, default is 0.5.
+    retry_statuses: frozenset[:class:`int`]
+        The HTTP status codes that are retried, default is ``502``, ``503`` and ``504``.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+    jitter: float = 0.5
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        The exponential backoff delay, with jitter, before the retry ``attempt``.
+
+        Parameters
+        -----------
+        attempt: :class:`int`
+            The retry number, starting at 1.
+
+        Returns
+        --------
+        :class:`float`
+            The delay in seconds.
+        """
+        delay: float = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay - (delay * self.jitter * random.random())
+
+
+@dataclass(slots=True)
 class Role:
     """
     Represents the JSON response data from :meth:`Core.get_role`.
@@ -2060,7 +2314,7 @@ class Role:
     disable_edits: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RunningTask:
     """
     Represents the JSON response data from functions that return RunningTask.
@@ -2112,16 +2366,17 @@ class RunningTask:
     is_indeterminate: bool
     state: int
     status: str
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("last_update_pushed", "start_time")
 
     def __repr__(self) -> str:
-        return pformat(vars(self), indent=1)
+        return pformat(_field_values(self), indent=1)
 
     def __post_init__(self) -> None:
         self.last_update_pushed: datetime = timestamp_converter(data=self.last_update_pushed)  # type: ignore
         self.start_time: datetime = timestamp_converter(data=self.start_time)  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleData:
     """
     Represents the JSON response data from :meth:`Core.get_schedule_data`.
@@ -2142,7 +2397,7 @@ class ScheduleData:
     populated_triggers: list[Triggers] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     Represents the JSON response data from :meth:`Core.get_active_amp_sessions`.
@@ -2170,13 +2425,14 @@ class Session:
     session_type: str
     start_time: str  # type: ignore
     last_activity: str  # type: ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("start_time", "last_activity")
 
     def __post_init__(self) -> None:
         self.start_time: datetime = timestamp_converter(self.start_time)  # type: ignore
         self.last_activity: datetime = timestamp_converter(self.last_activity)  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingSpec:
     """
     Represents the JSON response data from :meth:`Core.get_config` or :meth:`Core.get_configs`.
@@ -2270,6 +2526,7 @@ class SettingSpec:
     suffix: str = ""
     tag: str = ""
     val_type: str = ""  # ['Boolean', 'Int32', 'String', 'Enum', "List<String>"]
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("node", "current_value")
 
     def __post_init__(self) -> None:
         # determines the current value type and converts the data into the respective dataclass if needed.
@@ -2284,7 +2541,7 @@ class SettingSpec:
         return isinstance(other, self.__class__) and self.name < other.name
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingSpecAction:
     """
     Represents the JSON response data from :attr:`SettingSpec.actions`.
@@ -2313,7 +2570,7 @@ class SettingSpecAction:
     type_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingsSpecAttribute:
     """
     Represents the JSON response data from :attr:`SettingSpec.attributes`.
@@ -2342,7 +2599,7 @@ class SettingsSpecAttribute:
     read_only_keys: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingsSpecParent:
     """
     Represents the JSON response data from :meth:`Core.get_setting_spec`.
@@ -2377,7 +2634,7 @@ class SettingsSpecParent:
     updates: list[SettingSpec] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingSpecSelectionSource:
     """
     Represents the JSON response data from :attr:`SettingSpec.selection_source`.
@@ -2397,7 +2654,7 @@ class SettingSpecSelectionSource:
     type_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Status:
     """
     Represents the JSON response data from :meth:`Core.get_updates`
@@ -2417,7 +2674,7 @@ class Status:
     metrics: Union[Metric, None] = field(default=None)
 
     def __repr__(self) -> str:
-        return pformat(vars(self))
+        return pformat(_field_values(self))
 
 
 @dataclass
@@ -2472,6 +2729,38 @@ class Template:
 
 
 @dataclass
+class TimeoutSettings:
+    """
+    How long (in seconds) a single request may take before it times out, per endpoint class.
+
+    .. note::
+        Pass this into the :class:`Bridge` via the ``timeout_settings`` parameter. The endpoint classes are listed in
+        :attr:`Base.fast_endpoints`, :attr:`Base.heavy_endpoints` and :attr:`Base.long_running_endpoints`;
+        a :class:`Deadline` can only shorten these.
+
+
+    Attributes
+    -----------
+    fast: :class:`float`
+        Status reads that AMP answers right away, default is 10.0.
+    default: :class:`float`
+        Every endpoint not in another class, default is 30.0.
+    heavy: :class:`float`
+        Large listings and specs, default is 120.0.
+    long_running: :class:`float`
+        Actions that block until AMP finishes the work, eg taking a backup, default is 600.0.
+    endpoints: dict[:class:`str`, :class:`float`]
+        Per endpoint overrides, eg ``{"FileManagerPlugin/GetDirectoryListing": 300.0}``, default is empty.
+    """
+
+    fast: float = 10.0
+    default: float = 30.0
+    heavy: float = 120.0
+    long_running: float = 600.0
+    endpoints: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
 class TimedTrigger:
     """
     Represents the data of :meth:`Core.get_time_interval_trigger`.
@@ -2515,7 +2804,7 @@ class TimedTrigger:
     tasks: TriggerTasks
 
 
-@dataclass
+@dataclass(slots=True)
 class Triggers:
     """
     Represents the JSON reponse data for attributes :attr:`ScheduleData.available_triggers` and :attr:`ScheduleData.populated_triggers`.
@@ -2564,7 +2853,7 @@ class Triggers:
         return isinstance(other, self.__class__) and self.description < other.description
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerTasks:
     """
     Represents the JSON response for the attribute :attr:`Triggers.tasks`.
@@ -2599,7 +2888,7 @@ class TriggerTasks:
     order: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateInfo:
     """
     Represents the JSON response data from :meth:`Core.get_update_info`.
@@ -2657,7 +2946,7 @@ class Updates:
         return pformat(vars(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Represents the JSON response data from the function :meth:`Core.get_all_amp_user_info` or :meth:`Core.get_amp_user_info`
@@ -2709,12 +2998,13 @@ class User:
     roles: list[str]
     email_address: str
     last_login: str  # type:ignore
+    _post_init_fields: ClassVar[tuple[str, ...]] = ("last_login",)
 
     def __post_init__(self) -> None:
         self.last_login: datetime = timestamp_converter(self.last_login)  # type:ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """
     Tied to the class attribute for :class:`UpdateInfo.build`
@@ -2772,8 +3062,8 @@ class VersionInfo:
         try:
             temp: Self = cls(*[int(entry) for entry in new_data])
 
-        except (UnboundLocalError, MissingFields) as e:
-            _logger = logging.getLogger()
+        except (UnboundLocalError, TypeError) as e:
+            _logger = logging.getLogger(__name__)
             _logger.error("Unable to convert the data %s | Error: %s", data, e)
             return data
         return temp
@@ -2788,12 +3078,12 @@ class VersionInfo:
         )
 
     def __lt__(self, other: object) -> bool:
-        return (
-            isinstance(other, self.__class__)
-            and self.major < other.major
-            and self.minor < other.minor
-            and self.revision < other.revision
-            and self.minor_revision < other.minor_revision
+        # Compared in order; eg 2.5.9.0 is older than 2.6.0.0.
+        return isinstance(other, self.__class__) and (self.major, self.minor, self.revision, self.minor_revision) < (
+            other.major,
+            other.minor,
+            other.revision,
+            other.minor_revision,
         )
 
     def __repr__(self) -> str:
@@ -0,0 +1,574 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import logging
+import sys
+import types
+import typing
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ("DecoderRegistry", "decoders")
+
+
+class _Fallback(Exception):
+    """Raised by a compiled decoder when the data needs the full :func:`fromdict` handling."""
+
+
+class _Unsupported(Exception):
+    """Raised while compiling when a field type has no compiled converter."""
+
+
+def _fromdict(cls: type[Any], data: Any) -> Any:
+    # `dataclass_wizard` is slow to import and only needed for the fallback; so we import it on first use.
+    from dataclass_wizard import fromdict
+
+    return fromdict(cls, data)
+
+
+_MISSING: Any = object()
+_UNSET: Any = object()
+
+
+def _to_str(value: Any) -> str:
+    if value.__class__ is str:
+        return value
+    if value.__class__ is int or value.__class__ is float:
+        return str(value)
+    raise _Fallback
+
+
+def _to_int(value: Any) -> int:
+    if value.__class__ is int:
+        return value
+    if value.__class__ is str or (value.__class__ is float and value.is_integer()):
+        return int(value)
+    raise _Fallback
+
+
+def _to_float(value: Any) -> float:
+    if value.__class__ is float:
+        return value
+    if value.__class__ is int or value.__class__ is str:
+        return float(value)
+    raise _Fallback
+
+
+def _to_bool(value: Any) -> bool:
+    if value.__class__ is bool:
+        return value
+    raise _Fallback
+
+
+def _to_list(value: Any) -> list[Any]:
+    if value.__class__ is list:
+        return value
+    # AMP sends a few lists JSON encoded, eg `TagsList: "[]"`; `fromdict` iterates the string so we do the same.
+    if value.__class__ is str:
+        return list(value)
+    raise _Fallback
+
+
+def _wrong_type() -> Any:
+    raise _Fallback
+
+
+def _to_none(value: Any) -> None:
+    if value is None:
+        return value
+    raise _Fallback
+
+
+class _LazyField:
+    """A field of a lazy view; decodes the JSON value the first time it is read, see :meth:`DecoderRegistry.view`."""
+
+    __slots__ = ("convert", "default", "default_factory", "name", "post_init", "registry")
+
+    def __init__(self, registry: DecoderRegistry, field: dataclasses.Field[Any], post_init: bool) -> None:
+        self.registry: DecoderRegistry = registry
+        self.name: str = field.name
+        self.default: Any = field.default
+        self.default_factory: Any = field.default_factory
+        self.post_init: bool = post_init
+        self.convert: Callable[[Any], Any] = _wrong_type
+
+    def __get__(self, instance: Any, owner: Union[type[Any], None] = None) -> Any:
+        if instance is None:
+            if self.default is dataclasses.MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        if self.post_init is True:
+            return self.registry._resolve(view=instance, field=self)
+        try:
+            value: Any = self.load(instance._raw)
+        except Exception:
+            return self.registry._resolve(view=instance, field=self)
+        # Cached in the instance `__dict__` which takes priority over our (non-data) descriptor from then on.
+        instance.__dict__[self.name] = value
+        return value
+
+    def load(self, data: dict[str, Any]) -> Any:
+        value: Any = data.get(self.name, _MISSING)
+        if value is _MISSING:
+            if self.default_factory is not dataclasses.MISSING:
+                return self.default_factory()
+            return self.default
+        if value is self.default:
+            return value
+        return self.convert(value)
+
+
+class DecoderRegistry:
+    """
+    Turns JSON response data into our dataclasses with a construction function compiled for each dataclass.
+
+    .. note::
+        :meth:`Base.json_to_dataclass` uses the shared ``decoders`` registry in place of :func:`dataclass_wizard.fromdict`.
+        The first time a dataclass is decoded its field types are resolved once and a specialised function is generated;
+        nested dataclasses, :class:`Enum` fields, ``list``/``dict``/``Union`` fields and the common primitive coercions are handled
+        and ``__post_init__`` (eg :func:`timestamp_converter`) runs as usual.\n
+        Dataclasses with field types we can't compile, and any data the compiled function can't handle, fall back to :func:`fromdict`.\n
+        :meth:`view` creates lazy views instead, which only decode a field when it is read; see ``lazy`` of :meth:`Base._call_api`.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to always use :func:`fromdict`, default is True.
+    intern_fields: frozenset[:class:`str`]
+        The names of ``str`` fields with only a handful of distinct values (eg ``source``, ``units`` or ``module``) whose values
+        are interned with :func:`sys.intern`; so thousands of :class:`ConsoleEntries` share one ``"Console"`` string.
+        Call :meth:`clear` after changing it.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+    intern_fields: frozenset[str] = frozenset(
+        {
+            "category",
+            "color",
+            "color2",
+            "color3",
+            "input_type",
+            "ip",
+            "module",
+            "module_display_name",
+            "module_name",
+            "origin",
+            "session_type",
+            "source",
+            "status",
+            "subcategory",
+            "taken_by",
+            "target_id",
+            "type",
+            "units",
+            "user",
+            "username",
+            "val_type",
+        }
+    )
+
+    def __init__(self) -> None:
+        self._decoders: dict[type, Union[Callable[[dict[str, Any]], Any], None]] = {}
+        self._views: dict[type, Union[Callable[[dict[str, Any]], Any], None]] = {}
+
+    def decode(self, cls: type[Any], data: Any) -> Any:
+        """
+        Decodes ``data`` into an instance of the dataclass ``cls``.
+
+        Parameters
+        -----------
+        cls: type[Any]
+            The dataclass to create.
+        data: Any
+            The JSON response data, typically a dict.
+
+        Returns
+        --------
+        Any
+            The dataclass instance.
+        """
+        decoder: Union[Callable[[dict[str, Any]], Any], None] = self._decoders.get(cls, _UNSET)
+        if decoder is _UNSET:
+            decoder = self.get(cls=cls)
+        if decoder is None or self.enabled is False:
+            return _fromdict(cls, data)
+        try:
+            return decoder(data)
+        except Exception:
+            # Anything unexpected gets the full `fromdict` treatment; including its error if the data is invalid.
+            return _fromdict(cls, data)
+
+    def view(self, cls: type[Any], data: Any) -> Any:
+        """
+        Creates a lazy view of the dataclass ``cls`` backed by ``data``; each field is decoded the first time it is read.
+
+        .. note::
+            The view is an instance of a subclass of ``cls`` so ``isinstance``, :func:`dataclasses.fields` and
+            :meth:`Base.parse_data` work as usual. Nested dataclasses are views as well.
+
+            Fields listed in the dataclass' ``_post_init_fields`` are converted by its ``__post_init__`` when one of them is first read.
+            Dataclasses with a ``__post_init__`` but no ``_post_init_fields`` (or ``slots``/``init=False``) are decoded right away.
+
+
+        Parameters
+        -----------
+        cls: type[Any]
+            The dataclass to create a view of.
+        data: Any
+            The JSON response data, typically a dict; it should not be modified while the view is in use.
+
+        Returns
+        --------
+        Any
+            The view, otherwise the result of :meth:`decode` if ``cls`` or ``data`` can't be viewed.
+        """
+        factory: Union[Callable[[dict[str, Any]], Any], None] = self._views.get(cls, _UNSET)
+        if factory is _UNSET:
+            factory = None
+            if dataclasses.is_dataclass(cls):
+                try:
+                    factory = self._compile_view(cls=cls)
+                except Exception as e:
+                    self._logger.debug("DEBUG %s decoding %s eagerly | %s", type(self).__name__, cls.__name__, e)
+            self._views[cls] = factory
+        if factory is None or self.enabled is False:
+            return self.decode(cls=cls, data=data)
+        try:
+            return factory(data)
+        except Exception:
+            return self.decode(cls=cls, data=data)
+
+    def get(self, cls: type[Any]) -> Union[Callable[[dict[str, Any]], Any], None]:
+        """
+        Retrieves the compiled decoder for ``cls``, compiling it on first use.
+
+        Parameters
+        -----------
+        cls: type[Any]
+            The dataclass to retrieve the decoder for.
+
+        Returns
+        --------
+        Union[Callable[[dict[:class:`str`, Any]], Any], None]
+            The decoder or None if ``cls`` can't be compiled and uses :func:`fromdict` instead.
+        """
+        decoder: Union[Callable[[dict[str, Any]], Any], None] = self._decoders.get(cls, _UNSET)
+        if decoder is not _UNSET:
+            return decoder
+
+        decoder = None
+        if dataclasses.is_dataclass(cls):
+            try:
+                decoder = self._compile(cls=cls)
+            except Exception as e:
+                self._logger.debug("DEBUG %s using fromdict for %s | %s", type(self).__name__, cls.__name__, e)
+        self._decoders[cls] = decoder
+        return decoder
+
+    def register(self, cls: type[Any], decoder: Callable[[dict[str, Any]], Any]) -> None:
+        """
+        Registers a hand written decoder for ``cls``; it may raise any exception to fall back to :func:`fromdict`.
+
+        Parameters
+        -----------
+        cls: type[Any]
+            The dataclass the decoder creates.
+        decoder: Callable[[dict[:class:`str`, Any]], Any]
+            The function that turns a dict into an instance of ``cls``.
+        """
+        self._decoders[cls] = decoder
+
+    def clear(self) -> None:
+        """
+        Removes every compiled and registered decoder and the lazy view classes.
+        """
+        self._decoders.clear()
+        self._views.clear()
+
+    def _compile(self, cls: type[Any]) -> Callable[[dict[str, Any]], Any]:
+        hints: dict[str, Any] = typing.get_type_hints(cls)
+        namespace: dict[str, Any] = self._namespace(cls=cls)
+        # Guards against dataclasses that (indirectly) contain themselves while we compile them.
+        self._decoders[cls] = functools.partial(self._decode_nested, cls)
+        names: set[str] = set()
+        positional: list[str] = []
+        keywords: list[str] = []
+        lines: list[str] = [
+            "def decode(data):",
+            "    if data.__class__ is not dict:",
+            "        raise _Fallback",
+            "    if not _names.issuperset(data):",
+            "        _check_extra(_names, _normalized, data)",
+        ]
+        try:
+            for index, field in enumerate(dataclasses.fields(cls)):
+                if field.init is False:
+                    continue
+                names.add(field.name)
+                var: str = f"v{index}"
+                value: str = self._expression(
+                    hint=hints[field.name], var=var, namespace=namespace, depth=0, intern=field.name in self.intern_fields
+                )
+                if field.default is not dataclasses.MISSING:
+                    # The default is passed through untouched, just like the dataclass would use it.
+                    default: str = self._bind(namespace, field.default)
+                    lines.append(f"    {var} = data.get({field.name!r}, {default})")
+                    lines.append(f"    if {var} is not {default}:")
+                    lines.append(f"        {var} = {value}")
+                elif field.default_factory is not dataclasses.MISSING:
+                    default = self._bind(namespace, field.default_factory)
+                    lines.append(f"    {var} = data.get({field.name!r}, _MISSING)")
+                    lines.append(f"    {var} = {default}() if {var} is _MISSING else {value}")
+                else:
+                    lines.append("    try:")
+                    lines.append(f"        {var} = data[{field.name!r}]")
+                    lines.append("    except KeyError:")
+                    lines.append("        raise _Fallback from None")
+                    lines.append(f"    {var} = {value}")
+                # Positional arguments are noticeably cheaper to pass than keywords; `__init__` takes the fields in order.
+                if getattr(field, "kw_only", False) is True:
+                    keywords.append(f"{field.name}={var}")
+                else:
+                    positional.append(var)
+        finally:
+            del self._decoders[cls]
+        lines.append(f"    return _cls({', '.join(positional + keywords)})")
+
+        namespace["_names"] = frozenset(names)
+        namespace["_normalized"] = self._normalize(names=names)
+        exec("\n".join(lines), namespace)
+        decoder: Callable[[dict[str, Any]], Any] = namespace["decode"]
+        decoder.__qualname__ = f"{type(self).__name__}.decode_{cls.__name__}"
+        self._logger.debug("DEBUG %s compiled a decoder for %s", type(self).__name__, cls.__name__)
+        return decoder
+
+    def _compile_view(self, cls: type[Any]) -> Callable[[dict[str, Any]], Any]:
+        params: Any = getattr(cls, "__dataclass_params__", None)
+        if params is None or params.init is False:
+            raise _Unsupported(cls)
+        post_init_fields: frozenset[str] = frozenset(getattr(cls, "_post_init_fields", ()))
+        if hasattr(cls, "__post_init__") and not post_init_fields:
+            # We can't tell which fields `__post_init__` touches, so it has to run on a fully decoded instance.
+            raise _Unsupported(cls.__post_init__)
+
+        hints: dict[str, Any] = typing.get_type_hints(cls)
+        namespace: dict[str, Any] = self._namespace(cls=cls)
+        lines: list[str] = []
+        # Decoded fields are cached in the instance `__dict__`; `slots=True` dataclasses (eg Instance) don't have one.
+        has_dict: bool = any("__dict__" in vars(base) for base in cls.__mro__[:-1])
+        attributes: dict[str, Any] = {
+            "__slots__": ("_raw",) if has_dict else ("_raw", "__dict__"),
+            "__module__": cls.__module__,
+            # The generated `__eq__`/`__repr__` of a dataclass use `self.__class__`; so a view compares equal to (and looks like)
+            # the eagerly decoded dataclass.
+            "__class__": property(lambda view: cls),
+            "__repr__": self._view_repr,
+        }
+        names: set[str] = set()
+        required: set[str] = set()
+        for index, field in enumerate(dataclasses.fields(cls)):
+            if field.init is False:
+                raise _Unsupported(field.name)
+            names.add(field.name)
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+                required.add(field.name)
+            value: str = self._expression(
+                hint=hints[field.name],
+                var="value",
+                namespace=namespace,
+                depth=0,
+                lazy=True,
+                intern=field.name in self.intern_fields,
+            )
+            lines.append(f"def convert_{index}(value):")
+            lines.append(f"    return {value}")
+            attributes[field.name] = _LazyField(registry=self, field=field, post_init=field.name in post_init_fields)
+        exec("\n".join(lines), namespace)
+        for index, field in enumerate(dataclasses.fields(cls)):
+            attributes[field.name].convert = namespace[f"convert_{index}"]
+
+        view_cls: type[Any] = type(cls.__name__, (cls,), attributes)
+        view_cls.__qualname__ = f"{cls.__qualname__}View"
+        return functools.partial(
+            self._new_view, view_cls, frozenset(names), self._normalize(names=names), frozenset(required), {}
+        )
+
+    @staticmethod
+    def _new_view(
+        view_cls: type[Any],
+        names: frozenset[str],
+        normalized: frozenset[str],
+        required: frozenset[str],
+        seen: dict[str, bool],
+        data: Any,
+    ) -> Any:
+        if data.__class__ is not dict or not required.issubset(data):
+            raise _Fallback
+        if not names.issuperset(data):
+            DecoderRegistry._check_extra(seen, names, normalized, data)
+        view: Any = object.__new__(view_cls)
+        view._raw = data
+        return view
+
+    def _resolve(self, view: Any, field: _LazyField) -> Any:
+        # Handles the fields converted by `__post_init__` and any data the field converters can't handle.
+        state: dict[str, Any] = view.__dict__
+        if field.post_init is True:
+            try:
+                for lazy_field in (vars(type(view))[name] for name in view._post_init_fields):
+                    state[lazy_field.name] = lazy_field.load(view._raw)
+                # The dataclass' own `__post_init__` converts the fields, eg `timestamp_converter` or VersionInfo parsing.
+                type(view).__post_init__(view)
+                return state[field.name]
+            except Exception:
+                pass
+        # Same as `decode`; the data needs the full `fromdict` treatment so we decode everything in one go.
+        decoded: Any = self.decode(cls=view.__class__, data=view._raw)
+        state.update((item.name, getattr(decoded, item.name)) for item in dataclasses.fields(decoded))
+        return state[field.name]
+
+    @staticmethod
+    def _view_repr(view: Any) -> str:
+        # Some of our dataclasses build their repr from `vars(self)`; so everything is decoded first.
+        for field in dataclasses.fields(view):
+            getattr(view, field.name)
+        return view.__class__.__repr__(view)
+
+    def _namespace(self, cls: type[Any]) -> dict[str, Any]:
+        return {
+            "_cls": cls,
+            "_Fallback": _Fallback,
+            "_MISSING": _MISSING,
+            "_check_extra": functools.partial(self._check_extra, {}),
+            "_to_str": _to_str,
+            "_to_int": _to_int,
+            "_to_float": _to_float,
+            "_to_bool": _to_bool,
+            "_to_none": _to_none,
+            "_to_list": _to_list,
+            "_wrong_type": _wrong_type,
+            "_intern": sys.intern,
+        }
+
+    @staticmethod
+    def _normalize(names: set[str]) -> frozenset[str]:
+        return frozenset(name.replace("_", "").lower() for name in names)
+
+    @staticmethod
+    def _check_extra(seen: dict[str, bool], names: frozenset[str], normalized: frozenset[str], data: dict[str, Any]) -> None:
+        # Unknown keys are ignored like `fromdict` does; unless the key is a differently cased version of a field,
+        # eg unsanitized JSON, which `fromdict` knows how to match up.
+        for key in data:
+            harmless: Union[bool, None] = seen.get(key)
+            if harmless is None:
+                harmless = key in names or (
+                    key.__class__ is str and key.replace("_", "").replace(" ", "").lower() not in normalized
+                )
+                if len(seen) < 1024:
+                    seen[key] = harmless
+            if harmless is False:
+                raise _Fallback
+
+    @staticmethod
+    def _checked(kind: type, var: str) -> str:
+        if kind is list:
+            return f"({var} if {var}.__class__ is list else _to_list({var}))"
+        return f"({var} if {var}.__class__ is {kind.__name__} else _wrong_type())"
+
+    def _decode_nested(self, cls: type[Any], value: Any) -> Any:
+        # Used for nested dataclasses we could not compile; `decode` falls back to `fromdict` for them.
+        if value.__class__ is not dict:
+            raise _Fallback
+        return self.decode(cls=cls, data=value)
+
+    def _view_nested(self, cls: type[Any], value: Any) -> Any:
+        if value.__class__ is not dict:
+            raise _Fallback
+        return self.view(cls=cls, data=value)
+
+    def _bind(self, namespace: dict[str, Any], obj: Any) -> str:
+        name: str = f"_n{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    def _expression(
+        self, hint: Any, var: str, namespace: dict[str, Any], depth: int, lazy: bool = False, intern: bool = False
+    ) -> str:
+        # Builds the source of an expression converting `var` to the `hint` type.
+        if hint is Any or hint is object:
+            return var
+        if hint is str and intern is True:
+            return f"_intern({var} if {var}.__class__ is str else _to_str({var}))"
+        for kind in (str, int, float, bool):
+            if hint is kind:
+                return f"({var} if {var}.__class__ is {kind.__name__} else _to_{kind.__name__}({var}))"
+        if hint is type(None):
+            return f"_to_none({var})"
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            return f"{self._bind(namespace, hint)}({var})"
+        if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+            if lazy is True:
+                return f"{self._bind(namespace, functools.partial(self._view_nested, hint))}({var})"
+            decoder: Union[Callable[[dict[str, Any]], Any], None] = self.get(cls=hint)
+            if decoder is None:
+                decoder = functools.partial(self._decode_nested, hint)
+            return f"{self._bind(namespace, decoder)}({var})"
+        if hint is list or hint is dict:
+            return self._checked(kind=hint, var=var)
+
+        origin: Any = typing.get_origin(hint)
+        args: tuple[Any, ...] = typing.get_args(hint)
+        item: str = f"x{depth}"
+        if origin is list:
+            if not args or args[0] is Any:
+                return self._checked(kind=list, var=var)
+            value: str = self._expression(hint=args[0], var=item, namespace=namespace, depth=depth + 1, lazy=lazy)
+            return f"[{value} for {item} in {self._checked(kind=list, var=var)}]"
+        if origin is dict:
+            if args and args[0] is not str and args[0] is not Any:
+                raise _Unsupported(hint)
+            if not args or args[1] is Any:
+                return self._checked(kind=dict, var=var)
+            value = self._expression(hint=args[1], var=item, namespace=namespace, depth=depth + 1, lazy=lazy)
+            return f"{{k{depth}: {value} for k{depth}, {item} in {self._checked(kind=dict, var=var)}.items()}}"
+        if origin is Union or origin is types.UnionType:
+            options: list[Any] = [arg for arg in args if arg is not type(None)]
+            if len(options) == 1:
+                # Optional[T]
+                value = self._expression(
+                    hint=options[0], var=var, namespace=namespace, depth=depth, lazy=lazy, intern=intern
+                )
+                return f"(None if {var} is None else {value})"
+            return f"{self._bind(namespace, self._union_converter(args=args, lazy=lazy))}({var})"
+        raise _Unsupported(hint)
+
+    def _union_converter(self, args: tuple[Any, ...], lazy: bool = False) -> Callable[[Any], Any]:
+        # A value whose type is one of the plain types of the Union is used as is; eg `Union[str, dict, VersionInfo]`.
+        plain: set[type] = set()
+        nested: list[type] = []
+        for option in args:
+            base: Any = typing.get_origin(option) or option
+            if base in (str, int, float, bool, list, dict, type(None)):
+                plain.add(base)
+            elif isinstance(base, type) and dataclasses.is_dataclass(base):
+                nested.append(base)
+            else:
+                raise _Unsupported(option)
+        return functools.partial(self._convert_union, frozenset(plain), nested[0] if len(nested) == 1 else None, lazy)
+
+    def _convert_union(self, plain: frozenset[type], nested: Union[type[Any], None], lazy: bool, value: Any) -> Any:
+        if value.__class__ in plain:
+            return value
+        if nested is not None and value.__class__ is dict:
+            return self.view(cls=nested, data=value) if lazy is True else self.decode(cls=nested, data=value)
+        raise _Fallback
+
+
+# The registry used by `Base.json_to_dataclass`.
+decoders: DecoderRegistry = DecoderRegistry()
@@ -177,6 +177,16 @@ class ReleaseStreamState(Enum):
     development = 20
 
 
+class RequestPriority(Enum):
+    """
+    The lanes of the :class:`RequestScheduler`, lower values are served first.
+    """
+
+    interactive = 0
+    normal = 10
+    background = 20
+
+
 class TwoFactoryModeState(Enum):
     """
     Related to Node: Core.Security.TwoFactorMode
@@ -63,6 +63,9 @@ class AMPInstance(
 
         if isinstance(data, Instance):
             self.parse_data(data=data)
+            # Saves a `Core/GetDiagnosticsInfo` request the first time a version gated call is made.
+            if self.amp_version is not None:
+                self._bridge.capabilities.set_version(instance_id=self.instance_id, version=self.amp_version)
 
         # We use the AMPControllerInstance class to call ADSModule specific Endpoints as a
         # typical AMP Instance will not have the :py:class:`ADSModule` API Endpoints.
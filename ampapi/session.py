@@ -0,0 +1,623 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import weakref
+from contextvars import Context
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from .dataclass import APISession
+from .enums import RequestPriority
+from .transport import Deadline, RequestScheduler
+
+try:
+    import fcntl
+except ImportError:  # Windows; the file store still works but without cross process locking.
+    fcntl = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+    from .base import Base
+    from .dataclass import LoginResults
+
+__all__ = ("FileSessionStore", "MemorySessionStore", "SessionManager", "SessionStore")
+
+
+class SessionStore:
+    """
+    The interface used by the :class:`SessionManager` to store an :class:`APISession` per Instance.
+
+    .. note::
+        Subclass this to store sessions elsewhere (eg. Redis) and pass it into the :class:`Bridge` via ``session_store``.\n
+        Stored sessions are validated lazily; a session AMP no longer accepts is replaced on the first ``Unauthorized Access``.
+
+
+    """
+
+    def load(self) -> None:
+        """
+        Loads any persisted sessions, called when the :class:`Bridge` is constructed.
+        """
+        return None
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Waits for any pending writes to finish, called by :meth:`Bridge.close`.
+        """
+        return None
+
+    def get(self, instance_id: str) -> Union[APISession, None]:
+        """
+        Retrieves the session for an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+
+        Returns
+        --------
+        Union[:class:`APISession`, None]
+            The stored session, if any.
+        """
+        raise NotImplementedError
+
+    def set(self, instance_id: str, session: APISession) -> None:
+        """
+        Stores the session for an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        session: :class:`APISession`
+            The session to store.
+        """
+        raise NotImplementedError
+
+    def delete(self, instance_id: str) -> None:
+        """
+        Removes the session for an Instance, if any.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        """
+        raise NotImplementedError
+
+    def touch(self, instance_id: str) -> None:
+        """
+        Updates :attr:`APISession.last_used` for an Instance after a successful API call.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        """
+        session: Union[APISession, None] = self.get(instance_id)
+        if session is not None:
+            session.last_used = datetime.now()
+
+    def items(self) -> Iterator[tuple[str, APISession]]:
+        """
+        Iterates over every stored Instance ID and session.
+
+        Returns
+        --------
+        Iterator[tuple[:class:`str`, :class:`APISession`]]
+            The stored Instance IDs and sessions.
+        """
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Stores sessions in memory, this is the default :class:`SessionStore`.
+
+    Parameters
+    -----------
+    sessions: Union[dict[:class:`str`, :class:`APISession`], None], optional
+        The dict to store sessions in, the :class:`Bridge` uses :attr:`APIParams._sessions`, by default None.
+    """
+
+    def __init__(self, sessions: Union[dict[str, APISession], None] = None) -> None:
+        self._sessions: dict[str, APISession] = sessions if sessions is not None else {}
+
+    def get(self, instance_id: str) -> Union[APISession, None]:
+        return self._sessions.get(instance_id)
+
+    def set(self, instance_id: str, session: APISession) -> None:
+        self._sessions[instance_id] = session
+
+    def delete(self, instance_id: str) -> None:
+        self._sessions.pop(instance_id, None)
+
+    def items(self) -> Iterator[tuple[str, APISession]]:
+        return iter(list(self._sessions.items()))
+
+
+class FileSessionStore(MemorySessionStore):
+    """
+    Persists sessions to a JSON file so restarted workers can skip ``Core/Login``.
+
+    .. note::
+        Several worker processes on one host can share the same file; writes are locked and atomic
+        and each process picks up sessions written by the others when the file changes.\n
+        Writes run in a worker thread so a slow disk or a busy lock never blocks the event loop; changes made while a write is
+        in flight are written together right after it. Call :meth:`flush` (or :meth:`Bridge.close`) to wait for them.\n
+        A failed write is retried after ``retry_delay`` (up to :attr:`max_retries` times in a row); if it keeps failing the
+        changes stay queued for the next write.
+
+
+    .. warning::
+        The file holds valid session IDs for your AMP user, keep it somewhere only your workers can read.\n
+        On Windows there is no ``fcntl``; writes are still atomic but not locked, so workers sharing the file can overwrite
+        each other's sessions. Give each worker its own file there.
+
+
+    Parameters
+    -----------
+    path: Union[:class:`str`, :class:`Path`]
+        The file to persist sessions to, it is created if it does not exist.
+    sync_interval: :class:`float`, optional
+        The minimum number of seconds between writes caused only by session activity, by default 30.0.
+    check_interval: :class:`float`, optional
+        The minimum number of seconds between checks if another worker changed the file, by default 1.0.
+    retry_delay: :class:`float`, optional
+        How many seconds to wait before retrying a failed write, by default 1.0.
+
+    Attributes
+    -----------
+    max_retries: :class:`int`
+        How many times in a row a failed write is retried before the changes are left for the next write, default is 3.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    max_retries: int = 3
+
+    def __init__(
+        self, path: Union[str, Path], sync_interval: float = 30.0, check_interval: float = 1.0, retry_delay: float = 1.0
+    ) -> None:
+        super().__init__()
+        self.path: Path = Path(path)
+        self.sync_interval: float = sync_interval
+        self.check_interval: float = check_interval
+        self.retry_delay: float = retry_delay
+        self._mtime: Union[int, None] = None
+        self._last_sync: float = 0.0
+        self._last_check: Union[float, None] = None
+        # Changes waiting to be written; None deletes the session.
+        self._pending: dict[str, Union[APISession, None]] = {}
+        self._writer: Union[asyncio.Task[None], None] = None
+        if fcntl is None:
+            self._logger.warning(
+                "%s has no cross process locking on this platform; don't share %s between workers.",
+                type(self).__name__,
+                self.path,
+            )
+
+    def load(self) -> None:
+        # Every API call looks up its session; so we only `stat()` the file once per `check_interval`.
+        now: float = time.monotonic()
+        if self._last_check is not None and now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        try:
+            stat: os.stat_result = self.path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_mtime_ns == self._mtime:
+            return
+        self._sessions = self._apply_pending(sessions=self._merge(sessions=self._read()))
+        self._mtime = stat.st_mtime_ns
+
+    def get(self, instance_id: str) -> Union[APISession, None]:
+        # Picks up sessions another worker wrote since we last looked.
+        self.load()
+        return super().get(instance_id)
+
+    def set(self, instance_id: str, session: APISession) -> None:
+        super().set(instance_id, session)
+        self._schedule(instance_id=instance_id, session=session)
+
+    def delete(self, instance_id: str) -> None:
+        super().delete(instance_id)
+        self._schedule(instance_id=instance_id, session=None)
+
+    def touch(self, instance_id: str) -> None:
+        super().touch(instance_id)
+        session: Union[APISession, None] = self._sessions.get(instance_id)
+        if session is not None and time.monotonic() - self._last_sync >= self.sync_interval:
+            # Counts as a sync right away; so we don't queue a write on every call until it is done.
+            self._last_sync = time.monotonic()
+            self._schedule(instance_id=instance_id, session=session)
+
+    async def flush(self) -> None:
+        if self._pending and (self._writer is None or self._writer.done()):
+            # The last write gave up on these changes; give them another go.
+            self._writer = asyncio.get_running_loop().create_task(self._write())
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+
+    def _schedule(self, instance_id: str, session: Union[APISession, None]) -> None:
+        self._pending[instance_id] = session
+        try:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not in a loop (eg a script storing a session up front); nothing to block, so write it now.
+            pending: dict[str, Union[APISession, None]] = self._pending
+            self._pending = {}
+            try:
+                self._commit(*self._update(changes=pending))
+            except Exception as e:
+                self._requeue(pending=pending)
+                self._logger.warning("Failed to write the sessions to %s. %s", self.path, e)
+            return
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._write())
+
+    async def _write(self) -> None:
+        failures: int = 0
+        while self._pending:
+            pending: dict[str, Union[APISession, None]] = self._pending
+            self._pending = {}
+            try:
+                result: tuple[dict[str, APISession], int] = await asyncio.to_thread(self._update, changes=pending)
+            except Exception as e:
+                # Our in memory sessions are still correct; the failed changes are queued again and retried.
+                self._requeue(pending=pending)
+                failures += 1
+                if failures > self.max_retries:
+                    self._logger.error(
+                        "Failed to write the sessions to %s %s times; the next change tries again. %s",
+                        self.path,
+                        failures,
+                        e,
+                    )
+                    return
+                self._logger.warning(
+                    "Failed to write the sessions to %s, retrying in %.2fs. %s", self.path, self.retry_delay, e
+                )
+                await asyncio.sleep(self.retry_delay)
+                continue
+            failures = 0
+            self._commit(*result)
+
+    def _requeue(self, pending: dict[str, Union[APISession, None]]) -> None:
+        # Changes made while the write was in flight are newer; so they win over the ones that failed to write.
+        pending.update(self._pending)
+        self._pending = pending
+
+    def _commit(self, sessions: dict[str, APISession], mtime: int) -> None:
+        # Changes made while the write was in flight are not in `sessions` yet; they are written next.
+        self._sessions = self._apply_pending(sessions=self._merge(sessions=sessions))
+        self._mtime = mtime
+        self._last_sync = time.monotonic()
+
+    def _apply_pending(self, sessions: dict[str, APISession]) -> dict[str, APISession]:
+        for instance_id, session in self._pending.items():
+            if session is None:
+                sessions.pop(instance_id, None)
+            else:
+                sessions[instance_id] = session
+        return sessions
+
+    def _read(self) -> dict[str, APISession]:
+        try:
+            with self.path.open(mode="r", encoding="utf-8") as file:
+                data: dict[str, dict[str, Any]] = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        sessions: dict[str, APISession] = {}
+        for instance_id, entry in data.items():
+            try:
+                sessions[instance_id] = APISession(
+                    id=entry["id"],
+                    ttl=datetime.fromtimestamp(entry["ttl"]),
+                    last_used=datetime.fromtimestamp(entry.get("last_used", entry["ttl"])),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return sessions
+
+    def _merge(self, sessions: dict[str, APISession]) -> dict[str, APISession]:
+        """
+        Keeps our own :class:`APISession` objects (and their latest activity) for sessions that did not change on disk.
+        """
+        for instance_id, session in sessions.items():
+            current: Union[APISession, None] = self._sessions.get(instance_id)
+            if current is not None and current.id == session.id:
+                current.last_used = max(current.last_used, session.last_used)
+                sessions[instance_id] = current
+        return sessions
+
+    def _update(self, changes: dict[str, Union[APISession, None]]) -> tuple[dict[str, APISession], int]:
+        """
+        Merges our session changes into the file while holding the lock, so we never overwrite other workers sessions.
+        Runs in a worker thread, see :meth:`_write`.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.with_name(self.path.name + ".lock").open(mode="a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                sessions: dict[str, APISession] = self._read()
+                for instance_id, session in changes.items():
+                    if session is None:
+                        sessions.pop(instance_id, None)
+                    else:
+                        sessions[instance_id] = session
+                data: dict[str, dict[str, Any]] = {
+                    key: {"id": value.id, "ttl": value.ttl.timestamp(), "last_used": value.last_used.timestamp()}
+                    for key, value in sessions.items()
+                }
+                temp: Path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                # Session IDs are credentials; keep the file private to our user.
+                temp.touch(mode=0o600, exist_ok=True)
+                with temp.open(mode="w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                temp.replace(self.path)
+                return sessions, self.path.stat().st_mtime_ns
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class SessionManager:
+    """
+    Keeps track of the :class:`APISession` for each Instance and makes sure only one ``Core/Login`` is in flight per Instance.
+
+    .. note::
+        The :class:`Bridge` creates this for you; every API class shares it through :attr:`Bridge._session_manager`.\n
+        Concurrent callers that need a login for the same :attr:`~Base.instance_id` all wait on the same request.
+
+
+    Parameters
+    -----------
+    store: :class:`SessionStore`
+        Where the sessions are kept, see :class:`MemorySessionStore` and :class:`FileSessionStore`.
+
+    Attributes
+    -----------
+    store: :class:`SessionStore`
+        Where the sessions are kept.
+    refresh_margin: :class:`int`
+        How many seconds before :attr:`Base.session_ttl` lapses a session is considered expired and refreshed, default is 15.
+    keep_alive_api: :class:`str`
+        The API endpoint used by the keep-alive to refresh an idle session, default is ``Core/GetStatus``.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    refresh_margin: int = 15
+    keep_alive_api: str = "Core/GetStatus"
+
+    def __init__(self, store: SessionStore) -> None:
+        self.store: SessionStore = store
+        self._inflight: dict[str, asyncio.Future[Union[LoginResults, None]]] = {}
+        # The last API class used per Instance; the keep-alive uses it to make calls with the right url.
+        self._owners: weakref.WeakValueDictionary[str, Base] = weakref.WeakValueDictionary()
+        self._keep_alive_task: Union[asyncio.Task[None], None] = None
+
+    @property
+    def keep_alive_running(self) -> bool:
+        """
+        If the keep-alive scheduler is currently running.
+
+        Returns
+        --------
+        :class:`bool`
+            True if the keep-alive task is running.
+        """
+        return self._keep_alive_task is not None and not self._keep_alive_task.done()
+
+    def get(self, instance_id: str) -> Union[APISession, None]:
+        """
+        Retrieves the session for an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+
+        Returns
+        --------
+        Union[:class:`APISession`, None]
+            The stored session, if any.
+        """
+        return self.store.get(instance_id)
+
+    def set(self, instance_id: str, session: APISession) -> None:
+        """
+        Stores the session for an Instance.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        session: :class:`APISession`
+            The session to store.
+        """
+        self.store.set(instance_id, session)
+
+    def invalidate(self, instance_id: str, session_id: Union[str, None] = None) -> None:
+        """
+        Removes the session for an Instance so the next call logs in again.
+
+        .. note::
+            If ``session_id`` is provided the session is only removed if it still matches;
+            this stops a late failure from discarding a session another caller just created.
+
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        session_id: Union[:class:`str`, None], optional
+            The session ID that failed, by default None.
+        """
+        session: Union[APISession, None] = self.store.get(instance_id)
+        if session is None:
+            return
+        if session_id is None or session.id == session_id:
+            self.store.delete(instance_id)
+
+    def is_valid(self, session: Union[APISession, None], session_ttl: int) -> bool:
+        """
+        Checks if a session can still be used or if it is about to expire.
+
+        Parameters
+        -----------
+        session: Union[:class:`APISession`, None]
+            The session to check.
+        session_ttl: :class:`int`
+            How long a session lives for in seconds, see :attr:`Base.session_ttl`.
+
+        Returns
+        --------
+        :class:`bool`
+            True if the session is usable for at least :attr:`refresh_margin` more seconds.
+        """
+        if session is None or session.id == "0":
+            return False
+        return self.idle_time(session=session) < max(session_ttl - self.refresh_margin, 0)
+
+    @staticmethod
+    def idle_time(session: APISession) -> float:
+        """
+        How long a session has gone without being used.
+
+        Parameters
+        -----------
+        session: :class:`APISession`
+            The session to check.
+
+        Returns
+        --------
+        :class:`float`
+            The number of seconds since the session was created or last used.
+        """
+        return (datetime.now() - max(session.ttl, session.last_used)).total_seconds()
+
+    def touch(self, instance_id: str, owner: Base) -> None:
+        """
+        Records a successful use of the Instance session, keeping it alive from our side.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the session belongs to.
+        owner: :class:`Base`
+            The API class that used the session; the keep-alive makes its calls through it.
+        """
+        self.store.touch(instance_id)
+        self._owners[instance_id] = owner
+
+    def start_keep_alive(self, interval: float = 30.0, max_concurrency: int = 5) -> None:
+        """
+        Starts a background task that refreshes idle sessions shortly before they would expire.
+
+        .. note::
+            Must be called while an event loop is running. Calling this again restarts the task with the new values.
+
+
+        Parameters
+        -----------
+        interval: :class:`float`, optional
+            How often in seconds the sessions are checked, by default 30.0.
+        max_concurrency: :class:`int`, optional
+            The max number of sessions refreshed at the same time, by default 5.
+        """
+        if self._keep_alive_task is not None:
+            self._keep_alive_task.cancel()
+        self._keep_alive_task = asyncio.get_running_loop().create_task(
+            self._keep_alive(interval=interval, max_concurrency=max_concurrency)
+        )
+
+    async def stop_keep_alive(self) -> None:
+        """|coro|
+
+        Stops the keep-alive task if it is running.
+        """
+        task: Union[asyncio.Task[None], None] = self._keep_alive_task
+        self._keep_alive_task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _keep_alive(self, interval: float, max_concurrency: int) -> None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        while True:
+            await asyncio.sleep(interval)
+            due: list[Base] = []
+            for instance_id, owner in list(self._owners.items()):
+                session: Union[APISession, None] = self.store.get(instance_id)
+                if session is None or session.id == "0":
+                    continue
+                # Refresh anything that would be considered expired before our next check.
+                if self.idle_time(session=session) + interval + self.refresh_margin >= owner.session_ttl:
+                    due.append(owner)
+            if due:
+                self._logger.debug("DEBUG %s keep-alive refreshing %s sessions", type(self).__name__, len(due))
+                await asyncio.gather(*[self._refresh(owner=owner, semaphore=semaphore) for owner in due])
+
+    async def _refresh(self, owner: Base, semaphore: asyncio.Semaphore) -> None:
+        # Keep-alive pings should never hold up anyone else's requests.
+        async with semaphore:
+            try:
+                with RequestScheduler.priority(RequestPriority.background):
+                    await owner._call_api(api=self.keep_alive_api, format_data=False)
+            except Exception as e:
+                self._logger.warning("Keep-alive failed for %s: %s", owner.instance_id, e)
+
+    async def login(
+        self, instance_id: str, login: Callable[[], Coroutine[None, None, Union[LoginResults, None]]]
+    ) -> Union[LoginResults, None]:
+        """|coro|
+
+        Runs ``login`` for the Instance unless a login is already in flight; in which case we wait on that one instead.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID to log in to.
+        login: Callable[[], Coroutine[None, None, Union[:class:`LoginResults`, None]]]
+            The coroutine function that performs ``Core/Login`` and stores the session.
+
+        Returns
+        --------
+        Union[:class:`LoginResults`, None]
+            The results from the shared ``Core/Login`` call.
+        """
+        future: Union[asyncio.Future[Union[LoginResults, None]], None] = self._inflight.get(instance_id)
+        if future is None or future.done():
+            self._logger.debug("DEBUG %s login started for %s", type(self).__name__, instance_id)
+            # The login is shared; so it must not inherit the `Deadline` or priority of whoever needed it first.
+            future = Context().run(asyncio.ensure_future, login())
+            self._inflight[instance_id] = future
+            future.add_done_callback(lambda fut: self._inflight_done(instance_id=instance_id, future=fut))
+        else:
+            self._logger.debug("DEBUG %s waiting on in flight login for %s", type(self).__name__, instance_id)
+        # Shielded so a cancelled (or timed out) caller does not cancel the login everyone else is waiting on.
+        remaining: Union[float, None] = Deadline.remaining()
+        if remaining is None:
+            return await asyncio.shield(future)
+        return await asyncio.wait_for(asyncio.shield(future), timeout=max(0.0, remaining))
+
+    def _inflight_done(self, instance_id: str, future: asyncio.Future[Union[LoginResults, None]]) -> None:
+        if self._inflight.get(instance_id) is future:
+            self._inflight.pop(instance_id, None)
+        # Retrieve the exception so asyncio doesn't warn about it never being retrieved.
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Union, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = ("TimestampArray", "TimestampDecoder", "timestamps")
+
+# .NET writes up to 7 fractional digits; `datetime.fromisoformat` before Python 3.11 only takes exactly 3 or 6.
+_ISO_FRACTION: re.Pattern[str] = re.compile(r"\.(\d+)")
+
+
+def _iso_fraction(match: re.Match[str]) -> str:
+    return "." + (match.group(1) + "000000")[:6]
+
+
+class TimestampArray(Sequence[datetime]):
+    """
+    A compact sequence of timestamps stored as epoch seconds in an :class:`array.array` of doubles (8 bytes each).
+
+    .. note::
+        A :class:`datetime` is only created when an item is read, as a naive local time like ``/Date(ms)/`` timestamps.
+        Use :attr:`epochs` to sort, filter or compare the timestamps without creating any :class:`datetime` objects.\n
+        See :meth:`TimestampDecoder.pack`.
+
+
+    Parameters
+    -----------
+    epochs: Iterable[:class:`float`], optional
+        The epoch seconds to store, by default empty.
+    """
+
+    __slots__ = ("_epochs",)
+
+    def __init__(self, epochs: Iterable[float] = ()) -> None:
+        self._epochs: array[float] = array("d", epochs)
+
+    @property
+    def epochs(self) -> array[float]:
+        """
+        The raw epoch seconds.
+
+        Returns
+        --------
+        :class:`array.array`
+            The underlying array of doubles; changing it changes this sequence.
+        """
+        return self._epochs
+
+    def append(self, data: str) -> None:
+        """
+        Decodes an AMP timestamp string to epoch seconds and adds it to the end.
+
+        Parameters
+        -----------
+        data: :class:`str`
+            The ``/Date(ms)/`` or ISO format timestamp.
+        """
+        self._epochs.append(timestamps.to_epoch(data))
+
+    def __len__(self) -> int:
+        return len(self._epochs)
+
+    @overload
+    def __getitem__(self, index: int) -> datetime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TimestampArray: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[datetime, TimestampArray]:
+        if isinstance(index, slice):
+            return TimestampArray(epochs=self._epochs[index])
+        return datetime.fromtimestamp(self._epochs[index])
+
+    def __iter__(self) -> Iterator[datetime]:
+        fromtimestamp = datetime.fromtimestamp
+        for epoch in self._epochs:
+            yield fromtimestamp(epoch)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} len={len(self._epochs)}>"
+
+
+class TimestampDecoder:
+    """
+    Decodes AMP's timestamp strings; either the ``C#`` ``/Date(ms)/`` format or ISO format.
+
+    .. note::
+        :func:`timestamp_converter` (and so every ``__post_init__`` of our dataclasses) uses the shared ``timestamps`` decoder.
+        Decoded :class:`datetime` objects are memoised per string; polling the same audit logs, sessions or backups again only costs
+        a dictionary lookup. The cache is cleared once it holds :attr:`cache_size` strings.\n
+        Use :meth:`to_epoch` or :meth:`pack` to keep timestamps as epoch seconds without creating a :class:`datetime` at all,
+        or lazy views (see ``lazy`` of :meth:`Base._call_api`) to only convert the timestamps that are read.
+
+
+    Attributes
+    -----------
+    cache_size: :class:`int`
+        The max number of memoised timestamp strings, default is 4096. Set to ``0`` to disable the cache.
+    """
+
+    __slots__ = ("_cache", "cache_size")
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self.cache_size: int = cache_size
+        self._cache: dict[str, datetime] = {}
+
+    def to_datetime(self, data: str) -> datetime:
+        """
+        Convert an AMP timestamp string into a :class:`datetime` object.
+
+        .. note::
+            ``/Date(ms)/`` timestamps are converted into a naive local time; ISO timestamps keep their offset, if any.
+
+
+        Parameters
+        -----------
+        data: :class:`str`
+            The ``/Date(ms)/`` or ISO format timestamp.
+
+        Returns
+        --------
+        :class:`datetime`
+            The converted timestamp.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            When ``data`` is not in either format.
+        """
+        cache: dict[str, datetime] = self._cache
+        value: Union[datetime, None] = cache.get(data)
+        if value is not None:
+            return value
+
+        if data[:6] == "/Date(":
+            # Fast path for the usual `/Date(1700000000000)/`.
+            try:
+                value = datetime.fromtimestamp(int(data[6:-2]) / 1000)
+            except ValueError:
+                value = datetime.fromtimestamp(self._date_ms(data) / 1000)
+        else:
+            try:
+                value = datetime.fromisoformat(data)
+            except ValueError:
+                value = self._from_iso(data)
+        if len(cache) >= self.cache_size:
+            if self.cache_size <= 0:
+                return value
+            cache.clear()
+        cache[data] = value
+        return value
+
+    def to_epoch(self, data: str) -> float:
+        """
+        Convert an AMP timestamp string into epoch seconds.
+
+        .. note::
+            ``/Date(ms)/`` timestamps never create a :class:`datetime`; naive ISO timestamps are treated as local time.
+
+
+        Parameters
+        -----------
+        data: :class:`str`
+            The ``/Date(ms)/`` or ISO format timestamp.
+
+        Returns
+        --------
+        :class:`float`
+            The seconds since the epoch.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            When ``data`` is not in either format.
+        """
+        if data[:6] == "/Date(":
+            try:
+                return int(data[6:-2]) / 1000
+            except ValueError:
+                return self._date_ms(data) / 1000
+        value: Union[datetime, None] = self._cache.get(data)
+        if value is None:
+            value = self._from_iso(data)
+        return value.timestamp()
+
+    def pack(self, data: Iterable[str]) -> TimestampArray:
+        """
+        Convert AMP timestamp strings into a compact :class:`TimestampArray` of epoch seconds.
+
+        .. note::
+            Useful for busy consoles; eg ``timestamps.pack(entry["Timestamp"] for entry in updates["ConsoleEntries"])``
+            with ``format_data=False`` or ``raw=True`` API calls.
+
+
+        Parameters
+        -----------
+        data: Iterable[:class:`str`]
+            The ``/Date(ms)/`` or ISO format timestamps.
+
+        Returns
+        --------
+        :class:`TimestampArray`
+            The timestamps in the order given.
+        """
+        to_epoch = self.to_epoch
+        return TimestampArray(epochs=[to_epoch(entry) for entry in data])
+
+    def clear(self) -> None:
+        """
+        Clears the memoised :class:`datetime` objects.
+        """
+        self._cache.clear()
+
+    @staticmethod
+    def _date_ms(data: str) -> int:
+        # `/Date(1700000000000)/` or with the (informational) offset `/Date(1700000000000+0100)/`.
+        body: str = data[6:-2]
+        sign: int = max(body.rfind("+"), body.rfind("-"))
+        if sign > 0:
+            body = body[:sign]
+        try:
+            return int(body)
+        except ValueError:
+            raise ValueError(f"Invalid C# date string: {data!r}") from None
+
+    @staticmethod
+    def _from_iso(data: str) -> datetime:
+        try:
+            return datetime.fromisoformat(data)
+        except ValueError:
+            # Python 3.10 rejects a trailing `Z` and fractions that aren't exactly 3 or 6 digits.
+            normalized: str = _ISO_FRACTION.sub(_iso_fraction, data, count=1)
+            if normalized.endswith(("Z", "z")):
+                normalized = normalized[:-1] + "+00:00"
+            if normalized == data:
+                raise
+            return datetime.fromisoformat(normalized)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} cache_size={self.cache_size} cached={len(self._cache)}>"
+
+
+# The decoder used by `timestamp_converter`.
+timestamps: TimestampDecoder = TimestampDecoder()
@@ -0,0 +1,1181 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from contextvars import Context, ContextVar
+from typing import TYPE_CHECKING, Any, ClassVar, Union
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Iterator
+    from contextvars import Token
+    from types import TracebackType
+
+    from .core import Core
+
+from .dataclass import HedgeStats, QueueStats
+from .enums import RequestPriority
+
+__all__ = (
+    "CircuitBreaker",
+    "ConfigBatcher",
+    "Deadline",
+    "RequestCoalescer",
+    "RequestHedger",
+    "RequestScheduler",
+    "ResponseCache",
+)
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures per Instance and fails calls fast while an Instance is unreachable.
+
+    .. note::
+        The :class:`Bridge` creates this for you. After :attr:`failure_threshold` consecutive failures calls to that Instance
+        raise a :exc:`ConnectionError` without touching the network for :attr:`recovery_time` seconds;
+        afterwards a single trial call is let through and its result decides if the circuit closes again.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to always send requests, default is True.
+    failure_threshold: :class:`int`
+        The number of consecutive failures that open the circuit for an Instance, default is 5.
+    recovery_time: :class:`float`
+        How long in seconds the circuit stays open before a trial call is let through, default is 30.0.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+    failure_threshold: int = 5
+    recovery_time: float = 30.0
+
+    def __init__(self) -> None:
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._trials: dict[str, float] = {}
+
+    def is_open(self, instance_id: str) -> bool:
+        """
+        If calls to the Instance are currently being failed fast.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID to check.
+
+        Returns
+        --------
+        :class:`bool`
+            True if the circuit is open and the recovery time has not passed yet.
+        """
+        opened: Union[float, None] = self._opened_at.get(instance_id)
+        return opened is not None and time.monotonic() - opened < self.recovery_time
+
+    def allow(self, instance_id: str) -> bool:
+        """
+        Checks if a request to the Instance may be sent.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID the request is for.
+
+        Returns
+        --------
+        :class:`bool`
+            True if the request may be sent.
+        """
+        if self.enabled is False or instance_id not in self._opened_at:
+            return True
+        if self.is_open(instance_id=instance_id):
+            return False
+        # Recovery time has passed; let a single trial call through (or another one if it never reported back).
+        trial: Union[float, None] = self._trials.get(instance_id)
+        if trial is not None and time.monotonic() - trial < self.recovery_time:
+            return False
+        self._trials[instance_id] = time.monotonic()
+        self._logger.debug("DEBUG %s letting a trial call through | %s", type(self).__name__, instance_id)
+        return True
+
+    def record_success(self, instance_id: str) -> None:
+        """
+        Closes the circuit for the Instance and resets its failure count.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID that responded.
+        """
+        if instance_id in self._opened_at:
+            self._logger.info("%s closed the circuit for Instance %s", type(self).__name__, instance_id)
+        self._failures.pop(instance_id, None)
+        self._opened_at.pop(instance_id, None)
+        self._trials.pop(instance_id, None)
+
+    def record_failure(self, instance_id: str) -> None:
+        """
+        Counts a failure for the Instance and opens the circuit once :attr:`failure_threshold` is reached.
+
+        Parameters
+        -----------
+        instance_id: :class:`str`
+            The Instance ID that failed.
+        """
+        failures: int = self._failures.get(instance_id, 0) + 1
+        self._failures[instance_id] = failures
+        self._trials.pop(instance_id, None)
+        if failures >= self.failure_threshold:
+            if instance_id not in self._opened_at or not self.is_open(instance_id=instance_id):
+                self._logger.warning(
+                    "%s opened the circuit for Instance %s after %s failures", type(self).__name__, instance_id, failures
+                )
+            self._opened_at[instance_id] = time.monotonic()
+
+    def reset(self, instance_id: Union[str, None] = None) -> None:
+        """
+        Closes the circuit for an Instance, or every Instance if ``instance_id`` is None.
+
+        Parameters
+        -----------
+        instance_id: Union[:class:`str`, None], optional
+            The Instance ID to reset, by default None.
+        """
+        if instance_id is None:
+            self._failures.clear()
+            self._opened_at.clear()
+            self._trials.clear()
+        else:
+            self.record_success(instance_id=instance_id)
+
+
+class ConfigBatcher:
+    """
+    Collects :meth:`Core.get_config` and :meth:`Core.set_config` calls made close together for the same Instance
+    and sends them as a single ``Core/GetConfigs`` or ``Core/SetConfigs`` request.
+
+    .. note::
+        The :class:`Bridge` creates this for you. Each caller still receives its own result (or exception);
+        nodes missing from a batched response and batches AMP rejects are retried one node at a time
+        so an error is only raised for the node that caused it.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to send every get/set config call on its own, default is True.
+    window: :class:`float`
+        How long in seconds to wait for more calls before sending a batch, ``0`` sends on the next event loop tick, default is 0.0.
+    max_batch_size: :class:`int`
+        The max number of nodes sent in a single request, default is 100.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+    window: float = 0.0
+    max_batch_size: int = 100
+
+    def __init__(self) -> None:
+        self._gets: dict[str, list[tuple[Core, str, asyncio.Future[Any]]]] = {}
+        self._sets: dict[str, list[tuple[Core, str, str, asyncio.Future[Any]]]] = {}
+        # The running flushes; the event loop only keeps a weak reference to a task.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def get_config(self, owner: Core, node: str) -> Any:
+        """|coro|
+
+        Queues a node to be read in the next ``Core/GetConfigs`` batch for the Instance of ``owner``.
+
+        Parameters
+        -----------
+        owner: :class:`Core`
+            The API class making the call.
+        node: :class:`str`
+            The AMP node to inspect.
+
+        Returns
+        --------
+        Any
+            The sanitized JSON response data for the node.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue(table=self._gets, key=owner.url, entry=(owner, node, future), flush=self._flush_gets)
+        return await self._wait(future=future)
+
+    async def set_config(self, owner: Core, node: str, value: str) -> Any:
+        """|coro|
+
+        Queues a node to be set in the next ``Core/SetConfigs`` batch for the Instance of ``owner``.
+
+        Parameters
+        -----------
+        owner: :class:`Core`
+            The API class making the call.
+        node: :class:`str`
+            The setting node name.
+        value: :class:`str`
+            The value to set.
+
+        Returns
+        --------
+        Any
+            The sanitized JSON response data, similar to an :class:`ActionResult`.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue(table=self._sets, key=owner.url, entry=(owner, node, value, future), flush=self._flush_sets)
+        return await self._wait(future=future)
+
+    @staticmethod
+    async def _wait(future: asyncio.Future[Any]) -> Any:
+        # The batch runs outside of our context; so our own `Deadline` only bounds how long we wait for it.
+        remaining: Union[float, None] = Deadline.remaining()
+        if remaining is None:
+            return await future
+        return await asyncio.wait_for(future, timeout=max(0.0, remaining))
+
+    def _queue(
+        self,
+        table: dict[str, list[Any]],
+        key: str,
+        entry: tuple[Any, ...],
+        flush: Callable[[str], Coroutine[None, None, None]],
+    ) -> None:
+        pending: Union[list[Any], None] = table.get(key)
+        if pending is not None:
+            pending.append(entry)
+            return
+        table[key] = [entry]
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # The batch is sent for every caller; so it must not inherit the `Deadline` or priority of whoever queued first.
+        if self.window > 0:
+            loop.call_later(self.window, self._start_flush, flush, key, context=Context())
+        else:
+            loop.call_soon(self._start_flush, flush, key, context=Context())
+
+    def _start_flush(self, flush: Callable[[str], Coroutine[None, None, None]], key: str) -> None:
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(flush(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future[Any], result: Any = None, exception: Union[BaseException, None] = None) -> None:
+        # The caller may have been cancelled while waiting on the batch.
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    async def _flush_gets(self, key: str) -> None:
+        batch: list[tuple[Core, str, asyncio.Future[Any]]] = self._gets.pop(key, [])
+        for start in range(0, len(batch), self.max_batch_size):
+            chunk: list[tuple[Core, str, asyncio.Future[Any]]] = batch[start : start + self.max_batch_size]
+            owner: Core = chunk[0][0]
+            nodes: list[str] = list(dict.fromkeys(node for _, node, _ in chunk))
+            self._logger.debug("DEBUG %s sending %s nodes via Core/GetConfigs | %s", type(self).__name__, len(nodes), key)
+            try:
+                result: Any = await owner._call_api(api="Core/GetConfigs", parameters={"nodes": nodes}, format_data=False)
+            except Exception as e:
+                for _, _, future in chunk:
+                    self._resolve(future=future, exception=e)
+                continue
+
+            by_node: dict[str, Any] = {}
+            if isinstance(result, list):
+                for entry in result:
+                    if isinstance(entry, dict) and "node" in entry:
+                        by_node[entry["node"]] = entry
+
+            for caller, node, future in chunk:
+                if node in by_node:
+                    self._resolve(future=future, result=by_node[node])
+                    continue
+                # Not in the batched response; ask for the node on its own so the caller gets AMP's actual error.
+                try:
+                    single: Any = await caller._call_api(api="Core/GetConfig", parameters={"node": node}, format_data=False)
+                except Exception as e:
+                    self._resolve(future=future, exception=e)
+                else:
+                    self._resolve(future=future, result=single)
+
+    async def _flush_sets(self, key: str) -> None:
+        batch: list[tuple[Core, str, str, asyncio.Future[Any]]] = self._sets.pop(key, [])
+        # A node can only appear once per request; repeated sets of a node go out in order in later rounds.
+        rounds: list[dict[str, tuple[Core, str, asyncio.Future[Any]]]] = []
+        for owner, node, value, future in batch:
+            for entries in rounds:
+                if node not in entries and len(entries) < self.max_batch_size:
+                    entries[node] = (owner, value, future)
+                    break
+            else:
+                rounds.append({node: (owner, value, future)})
+
+        for entries in rounds:
+            owner: Core = next(iter(entries.values()))[0]
+            data: dict[str, str] = {node: value for node, (_, value, _) in entries.items()}
+            self._logger.debug("DEBUG %s sending %s nodes via Core/SetConfigs | %s", type(self).__name__, len(data), key)
+            try:
+                result: Any = await owner._call_api(api="Core/SetConfigs", parameters={"data": data}, format_data=False)
+            except Exception as e:
+                self._logger.debug("DEBUG %s Core/SetConfigs failed, retrying each node | %s", type(self).__name__, e)
+                result = False
+
+            if result is True:
+                for _, _, future in entries.values():
+                    self._resolve(future=future, result={"status": True, "reason": None, "result": None})
+                continue
+
+            # AMP doesn't tell us which node failed; set each node on its own to find out.
+            for node, (caller, value, future) in entries.items():
+                try:
+                    single: Any = await caller._call_api(
+                        api="Core/SetConfig", parameters={"node": node, "value": value}, format_data=False
+                    )
+                except Exception as e:
+                    self._resolve(future=future, exception=e)
+                else:
+                    self._resolve(future=future, result=single)
+
+
+class Deadline:
+    """
+    A time budget shared by every API call made inside the ``async with`` block, including tasks created in it.
+
+    .. note::
+        Each request is given whatever is left of the budget (or its :class:`TimeoutSettings` value if that is shorter)
+        and retries stop once the budget is spent; an API call that runs out of time raises :exc:`asyncio.TimeoutError`.
+        Nested deadlines can only shorten the budget of the outer one.
+
+
+    .. code-block:: python
+        :linenos:
+
+
+        async with Deadline(5.0) as deadline:
+            # Instances that did not answer in time get an `asyncio.TimeoutError` instead of a result.
+            results = await deadline.gather(*[instance.get_status() for instance in controller.instances])
+
+
+    Parameters
+    -----------
+    seconds: :class:`float`
+        How long the calls inside the block may take in total.
+    """
+
+    _expires_at: ClassVar[ContextVar[Union[float, None]]] = ContextVar("ampapi_deadline", default=None)
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds: float = seconds
+        self.expires_at: Union[float, None] = None
+        self._token: Union[Token[Union[float, None]], None] = None
+
+    async def __aenter__(self) -> Deadline:
+        expires_at: float = time.monotonic() + self.seconds
+        parent: Union[float, None] = self._expires_at.get()
+        if parent is not None:
+            expires_at = min(parent, expires_at)
+        self.expires_at = expires_at
+        self._token = self._expires_at.set(expires_at)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None],
+    ) -> None:
+        if self._token is not None:
+            self._expires_at.reset(self._token)
+            self._token = None
+
+    @property
+    def remaining_time(self) -> float:
+        """
+        How many seconds are left of this deadline.
+
+        Returns
+        --------
+        :class:`float`
+            The seconds left, ``0.0`` once the deadline passed or :attr:`seconds` if the block was not entered yet.
+        """
+        if self.expires_at is None:
+            return self.seconds
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """
+        If this deadline has passed.
+
+        Returns
+        --------
+        :class:`bool`
+            True if there is no time left.
+        """
+        return self.remaining_time <= 0
+
+    @classmethod
+    def remaining(cls) -> Union[float, None]:
+        """
+        How many seconds are left of the deadline active in the current context.
+
+        Returns
+        --------
+        Union[:class:`float`, None]
+            The seconds left (``0.0`` or less once passed) or None if no :class:`Deadline` is active.
+        """
+        expires_at: Union[float, None] = cls._expires_at.get()
+        if expires_at is None:
+            return None
+        return expires_at - time.monotonic()
+
+    async def gather(self, *aws: Awaitable[Any]) -> list[Any]:
+        """|coro|
+
+        Runs the awaitables concurrently and returns once they all finished or the deadline passed.
+        Anything still running at that point is cancelled.
+
+        .. note::
+            Like :func:`asyncio.gather` with ``return_exceptions=True`` the results keep the order of ``aws``;
+            failed awaitables return their exception and the cancelled ones an :exc:`asyncio.TimeoutError`.
+
+
+        Parameters
+        -----------
+        *aws: Awaitable[Any]
+            The awaitables to run, eg API calls.
+
+        Returns
+        --------
+        list[Any]
+            The result or exception of each awaitable.
+
+        Raises
+        ------
+        :exc:`RuntimeError`
+            When called outside of the ``async with`` block of this deadline.
+        """
+        if self.expires_at is None or self._token is None:
+            raise RuntimeError("Deadline.gather() must be called inside `async with Deadline(...)`.")
+        tasks: list[asyncio.Future[Any]] = [asyncio.ensure_future(aw) for aw in aws]
+        if not tasks:
+            return []
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.remaining_time)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Give the cancelled tasks a chance to clean up; eg release their scheduler slot.
+            await asyncio.wait(pending)
+
+        results: list[Any] = []
+        for task in tasks:
+            if task.cancelled():
+                results.append(asyncio.TimeoutError(f"The deadline of {self.seconds}s passed before the call finished."))
+                continue
+            exception: Union[BaseException, None] = task.exception()
+            results.append(exception if exception is not None else task.result())
+        return results
+
+
+class RequestCoalescer:
+    """
+    Merges identical API calls that are in flight at the same time into a single HTTP request.
+
+    .. note::
+        The :class:`Bridge` creates this for you and :meth:`Base._call_api` only uses it for the read-only endpoints
+        listed in :attr:`Base.idempotent_endpoints`; mutating calls are never merged.
+
+
+    .. warning::
+        Callers that share a request also share the decoded JSON response, treat unformatted responses as read-only.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to send every request on its own, default is True.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+
+    def __init__(self) -> None:
+        self._inflight: dict[tuple[str, str, str, bool], asyncio.Future[Any]] = {}
+
+    @staticmethod
+    def make_key(url: str, api: str, parameters: dict[str, Any], raw: bool = False) -> tuple[str, str, str, bool]:
+        """
+        Builds the key identical requests share; ``SESSIONID`` is left out as it is handled per Instance.
+
+        Parameters
+        -----------
+        url: :class:`str`
+            The url of the Instance the request is for.
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetStatus``.
+        parameters: dict[:class:`str`, Any]
+            The parameters of the request.
+        raw: :class:`bool`, optional
+            If the request returns a :class:`RawResponse` instead of the decoded JSON response, by default False.
+
+        Returns
+        --------
+        tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The ``(url, api, canonical parameters, raw)`` key.
+        """
+        params: dict[str, Any] = {key: value for key, value in parameters.items() if key != "SESSIONID"}
+        return (url, api, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str), raw)
+
+    async def run(self, key: tuple[str, str, str, bool], request: Callable[[], Coroutine[None, None, Any]]) -> Any:
+        """|coro|
+
+        Runs ``request`` unless an identical request is already in flight; in which case we wait on that one instead.
+
+        Parameters
+        -----------
+        key: tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The key from :meth:`make_key`.
+        request: Callable[[], Coroutine[None, None, Any]]
+            The coroutine function that sends the request and decodes the response.
+
+        Returns
+        --------
+        Any
+            The decoded response shared by every caller.
+        """
+        future: Union[asyncio.Future[Any], None] = self._inflight.get(key)
+        if future is None or future.done():
+            # The request is shared; so it must not inherit the `Deadline` or priority of whoever sent it first.
+            future = Context().run(asyncio.ensure_future, request())
+            self._inflight[key] = future
+            future.add_done_callback(lambda fut: self._done(key=key, future=fut))
+        else:
+            self._logger.debug("DEBUG %s joined in flight request %s | %s", type(self).__name__, key[1], key[0])
+        return await self._wait(future=future)
+
+    @staticmethod
+    async def _wait(future: asyncio.Future[Any]) -> Any:
+        # Shielded so a cancelled (or timed out) caller does not cancel the request everyone else is waiting on.
+        remaining: Union[float, None] = Deadline.remaining()
+        if remaining is None:
+            return await asyncio.shield(future)
+        return await asyncio.wait_for(asyncio.shield(future), timeout=max(0.0, remaining))
+
+    def _done(self, key: tuple[str, str, str, bool], future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            self._inflight.pop(key, None)
+        # Retrieve the exception so asyncio doesn't warn about it never being retrieved.
+        if not future.cancelled():
+            future.exception()
+
+
+class RequestHedger:
+    """
+    Opt-in hedging of latency critical reads; if a request has not answered within the usual latency of its endpoint
+    a second identical request is sent and whichever answers first is used, the other one is cancelled.
+
+    .. note::
+        The :class:`Bridge` creates this for you and :meth:`Base._call_api` only uses it for the endpoints listed in
+        :attr:`Base.hedge_endpoints` (which must also be in :attr:`Base.idempotent_endpoints`).
+        The hedge delay is the :attr:`percentile` of the recent latencies of the endpoint, clamped to
+        :attr:`min_delay` and :attr:`max_delay`; until :attr:`min_samples` latencies are known :attr:`default_delay` is used.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``True`` to hedge requests, default is False.
+    percentile: :class:`float`
+        The latency percentile (between 0 and 1) used as the hedge delay, default is 0.95.
+    min_delay: :class:`float`
+        The lowest hedge delay in seconds, default is 0.05.
+    max_delay: :class:`float`
+        The highest hedge delay in seconds, default is 2.0.
+    default_delay: :class:`float`
+        The hedge delay in seconds until enough latencies are known, default is 0.5.
+    min_samples: :class:`int`
+        The number of latencies needed before :attr:`percentile` is used, default is 20.
+    window: :class:`int`
+        The number of recent latencies kept per endpoint, default is 200.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = False
+    percentile: float = 0.95
+    min_delay: float = 0.05
+    max_delay: float = 2.0
+    default_delay: float = 0.5
+    min_samples: int = 20
+    window: int = 200
+
+    def __init__(self) -> None:
+        self._latencies: dict[str, deque[float]] = {}
+        self._stats: dict[str, HedgeStats] = {}
+
+    def get_delay(self, api: str) -> float:
+        """
+        Calculates how long to wait on a request to ``api`` before sending a hedge request.
+
+        Parameters
+        -----------
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetStatus``.
+
+        Returns
+        --------
+        :class:`float`
+            The hedge delay in seconds.
+        """
+        latencies: Union[deque[float], None] = self._latencies.get(api)
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.default_delay
+        ordered: list[float] = sorted(latencies)
+        index: int = min(len(ordered) - 1, max(0, math.ceil(self.percentile * len(ordered)) - 1))
+        return min(self.max_delay, max(self.min_delay, ordered[index]))
+
+    def get_stats(self) -> dict[str, HedgeStats]:
+        """
+        Retrieves the hedging metrics per API endpoint.
+
+        Returns
+        --------
+        dict[:class:`str`, :class:`HedgeStats`]
+            A snapshot of the metrics keyed by API endpoint.
+        """
+        return {api: dataclasses.replace(stats, delay=self.get_delay(api=api)) for api, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """
+        Resets the hedging metrics and the recorded latencies of every endpoint.
+        """
+        self._latencies.clear()
+        self._stats.clear()
+
+    def _record(self, api: str, latency: float) -> None:
+        latencies: Union[deque[float], None] = self._latencies.get(api)
+        if latencies is None or latencies.maxlen != self.window:
+            latencies = self._latencies[api] = deque(latencies or (), maxlen=self.window)
+        latencies.append(latency)
+
+    async def run(self, api: str, request: Callable[[], Coroutine[None, None, Any]]) -> Any:
+        """|coro|
+
+        Runs ``request`` and, if it is slower than :meth:`get_delay`, a second copy of it.
+
+        Parameters
+        -----------
+        api: :class:`str`
+            The API endpoint the request is for.
+        request: Callable[[], Coroutine[None, None, Any]]
+            The coroutine function that sends the request, called once per copy.
+
+        Returns
+        --------
+        Any
+            The result of the copy that answered first; if both fail the last exception is raised.
+        """
+        stats: HedgeStats = self._stats.setdefault(api, HedgeStats(api=api))
+        stats.requests += 1
+        started: float = time.monotonic()
+        hedge_started: float = started
+        primary: asyncio.Future[Any] = asyncio.ensure_future(request())
+        tasks: set[asyncio.Future[Any]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.get_delay(api=api))
+            if not done:
+                stats.hedged += 1
+                self._logger.debug("DEBUG %s sending a hedge request for %s", type(self).__name__, api)
+                hedge_started = time.monotonic()
+                tasks.add(asyncio.ensure_future(request()))
+
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a successful copy; only give up once every copy failed.
+                succeeded: list[asyncio.Future[Any]] = [task for task in done if task.exception() is None]
+                if succeeded:
+                    winner: asyncio.Future[Any] = primary if primary in succeeded else succeeded[0]
+                    if winner is primary:
+                        self._record(api=api, latency=time.monotonic() - started)
+                    else:
+                        stats.hedge_wins += 1
+                        self._record(api=api, latency=time.monotonic() - hedge_started)
+                    return winner.result()
+                if not tasks:
+                    return next(iter(done)).result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class RequestScheduler:
+    """
+    Limits how many HTTP requests are in flight at once, globally and per Instance, with an optional token-bucket rate limit.
+
+    .. note::
+        The :class:`Bridge` creates this for you and every request made by :meth:`Base._call_api` waits for a slot.
+        Requests are queued in :class:`RequestPriority` lanes; a lane is only served when every higher lane is empty or blocked
+        and within a lane waiting requests are served round-robin across Instances so one busy Instance can't starve the others.\n
+        Endpoints in :attr:`Base.background_endpoints` use the ``background`` lane, everything else ``normal``,
+        use :meth:`priority` to pick the lane for a block of code.
+
+
+    .. code-block:: python
+        :linenos:
+
+
+        with _bridge.scheduler.priority(RequestPriority.interactive):
+            await instance.send_console_message(msg="say Hello")
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to send every request right away, default is True.
+    max_in_flight: :class:`int`
+        The max number of requests in flight across every Instance, default is 32.
+    max_per_instance: :class:`int`
+        The max number of requests in flight to a single Instance, default is 8.
+    background_share: :class:`float`
+        The fraction of :attr:`max_in_flight` the ``background`` lane may use, so the other lanes always have free slots, default is 0.5.
+    rate: :class:`float`
+        The max number of requests started per second across every Instance, ``0`` disables the rate limit, default is 0.0.
+    burst: :class:`int`
+        The number of requests that may start at once before :attr:`rate` applies, default is 10.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    _priority: ContextVar[Union[RequestPriority, None]] = ContextVar("ampapi_request_priority", default=None)
+    enabled: bool = True
+    max_in_flight: int = 32
+    max_per_instance: int = 8
+    background_share: float = 0.5
+    rate: float = 0.0
+    burst: int = 10
+
+    def __init__(self) -> None:
+        self._lanes: dict[RequestPriority, dict[str, deque[tuple[asyncio.Future[None], float]]]] = {
+            priority: {} for priority in RequestPriority
+        }
+        # The keys with waiters per lane, in the order they are served.
+        self._order: dict[RequestPriority, deque[str]] = {priority: deque() for priority in RequestPriority}
+        self._stats: dict[RequestPriority, QueueStats] = {
+            priority: QueueStats(priority=priority) for priority in RequestPriority
+        }
+        self._in_flight: dict[str, int] = {}
+        self._total: int = 0
+        self._tokens: float = 0.0
+        self._last_refill: Union[float, None] = None
+        self._timer: Union[asyncio.TimerHandle, None] = None
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently holding a slot.
+
+        Returns
+        --------
+        :class:`int`
+            The number of requests in flight.
+        """
+        return self._total
+
+    @property
+    def waiting(self) -> int:
+        """
+        The number of requests waiting for a slot across every lane.
+
+        Returns
+        --------
+        :class:`int`
+            The number of queued requests.
+        """
+        return sum(len(queue) for lane in self._lanes.values() for queue in lane.values())
+
+    def get_stats(self) -> dict[RequestPriority, QueueStats]:
+        """
+        Retrieves the queue-wait statistics of each lane.
+
+        Returns
+        --------
+        dict[:class:`RequestPriority`, :class:`QueueStats`]
+            A snapshot of the statistics per lane.
+        """
+        stats: dict[RequestPriority, QueueStats] = {}
+        for priority, lane in self._lanes.items():
+            stats[priority] = dataclasses.replace(self._stats[priority], waiting=sum(len(queue) for queue in lane.values()))
+        return stats
+
+    def reset_stats(self) -> None:
+        """
+        Resets the queue-wait statistics of every lane, requests in flight are still counted.
+        """
+        for priority, stats in self._stats.items():
+            self._stats[priority] = QueueStats(priority=priority, in_flight=stats.in_flight)
+
+    @classmethod
+    @contextlib.contextmanager
+    def priority(cls, priority: RequestPriority) -> Iterator[None]:
+        """
+        Sends every request made inside the ``with`` block (including tasks created in it) through the ``priority`` lane.
+
+        Parameters
+        -----------
+        priority: :class:`RequestPriority`
+            The lane to use.
+        """
+        token: Token[Union[RequestPriority, None]] = cls._priority.set(priority)
+        try:
+            yield
+        finally:
+            cls._priority.reset(token)
+
+    @classmethod
+    def current_priority(cls, default: RequestPriority = RequestPriority.normal) -> RequestPriority:
+        """
+        Retrieves the lane set by :meth:`priority` for the current context.
+
+        Parameters
+        -----------
+        default: :class:`RequestPriority`, optional
+            The lane to use when :meth:`priority` is not active, by default ``normal``.
+
+        Returns
+        --------
+        :class:`RequestPriority`
+            The lane requests in the current context use.
+        """
+        priority: Union[RequestPriority, None] = cls._priority.get()
+        return default if priority is None else priority
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: str, priority: RequestPriority = RequestPriority.normal) -> AsyncIterator[None]:
+        """|coro|
+
+        Waits for a slot for ``key`` in the ``priority`` lane and holds it for the duration of the ``async with`` block.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The Instance ID the request is for.
+        priority: :class:`RequestPriority`, optional
+            The lane to wait in, by default ``normal``.
+        """
+        if self.enabled is False:
+            yield
+            return
+
+        await self._acquire(key=key, priority=priority)
+        try:
+            yield
+        finally:
+            self._release(key=key, priority=priority)
+
+    async def _acquire(self, key: str, priority: RequestPriority) -> None:
+        lane: dict[str, deque[tuple[asyncio.Future[None], float]]] = self._lanes[priority]
+        queue: Union[deque[tuple[asyncio.Future[None], float]], None] = lane.get(key)
+        if queue is None:
+            queue = lane[key] = deque()
+            self._order[priority].append(key)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append((future, time.monotonic()))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # We were granted a slot right as we got cancelled; hand it to the next waiter.
+            if future.done() and not future.cancelled():
+                self._release(key=key, priority=priority)
+            raise
+
+    def _release(self, key: str, priority: RequestPriority) -> None:
+        self._total -= 1
+        self._stats[priority].in_flight -= 1
+        count: int = self._in_flight.get(key, 1) - 1
+        if count > 0:
+            self._in_flight[key] = count
+        else:
+            self._in_flight.pop(key, None)
+        self._dispatch()
+
+    def _next_key(self, priority: RequestPriority) -> Union[str, None]:
+        lane: dict[str, deque[tuple[asyncio.Future[None], float]]] = self._lanes[priority]
+        order: deque[str] = self._order[priority]
+        for _ in range(len(order)):
+            key: str = order.popleft()
+            queue: deque[tuple[asyncio.Future[None], float]] = lane[key]
+            # Drop waiters that were cancelled while queued.
+            while queue and queue[0][0].done():
+                queue.popleft()
+            if not queue:
+                del lane[key]
+                continue
+            # Served keys go to the back of the line.
+            order.append(key)
+            if self._in_flight.get(key, 0) < self.max_per_instance:
+                return key
+        return None
+
+    def _next_waiter(self) -> Union[tuple[RequestPriority, str], None]:
+        for priority in sorted(RequestPriority, key=lambda lane: lane.value):
+            # Background work never takes the last free slots; they are kept for the other lanes.
+            if priority is RequestPriority.background and self._stats[priority].in_flight >= max(
+                1, int(self.max_in_flight * self.background_share)
+            ):
+                continue
+            key: Union[str, None] = self._next_key(priority=priority)
+            if key is not None:
+                return priority, key
+        return None
+
+    def _take_token(self) -> float:
+        # Returns 0 if a token was taken, otherwise how long until the next token is available.
+        if self.rate <= 0:
+            return 0.0
+        now: float = time.monotonic()
+        if self._last_refill is None:
+            self._tokens = float(self.burst)
+        else:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _wake(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._total < self.max_in_flight:
+            waiter: Union[tuple[RequestPriority, str], None] = self._next_waiter()
+            if waiter is None:
+                return
+            delay: float = self._take_token()
+            if delay > 0:
+                if self._timer is None:
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+                return
+            priority, key = waiter
+            future, queued_at = self._lanes[priority][key].popleft()
+            future.set_result(None)
+            wait: float = time.monotonic() - queued_at
+            stats: QueueStats = self._stats[priority]
+            stats.granted += 1
+            stats.in_flight += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+            self._total += 1
+
+
+class ResponseCache:
+    """
+    Keeps the responses of read-mostly endpoints per Instance for a while; so menus and lookups don't hit AMP every time.
+
+    .. note::
+        The :class:`Bridge` creates this for you and :meth:`Base._call_api` only caches the endpoints listed in :attr:`Base.cache_ttls`,
+        for the time listed there. Mutating calls made through any API class drop the related entries of the same Instance,
+        see :attr:`Base.cache_invalidations`; use :meth:`invalidate` for changes made elsewhere, eg in the AMP web panel.\n
+        An expired entry is still returned for :attr:`stale_ttl` seconds while it is refreshed in the background.
+
+
+    .. warning::
+        Callers share the cached JSON response, treat unformatted responses as read-only.
+
+
+    Attributes
+    -----------
+    enabled: :class:`bool`
+        Set to ``False`` to always send the request, default is True.
+    max_entries: :class:`int`
+        The max number of cached responses; the least recently used are dropped first, default is 512.
+    stale_ttl: :class:`float`
+        How long in seconds an expired response may still be returned while it is refreshed, ``0`` disables it, default is 30.0.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+    enabled: bool = True
+    max_entries: int = 512
+    stale_ttl: float = 30.0
+
+    def __init__(self) -> None:
+        # key -> (response, expires at)
+        self._entries: OrderedDict[tuple[str, str, str, bool], tuple[Any, float]] = OrderedDict()
+        self._refreshing: dict[tuple[str, str, str, bool], asyncio.Future[Any]] = {}
+        # Bumped by every invalidation of an Instance url (or of every url for `_epoch`);
+        # a response fetched before an invalidation of its Instance is never stored.
+        self._generations: dict[str, int] = {}
+        self._epoch: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, url: str) -> int:
+        """
+        Changes every time the entries of an Instance are invalidated; pass the value from before the request to :meth:`set`.
+
+        Parameters
+        -----------
+        url: :class:`str`
+            The url of the Instance.
+
+        Returns
+        --------
+        :class:`int`
+            The current generation of the Instance.
+        """
+        # Both only ever go up; so their sum changes whenever either of them does.
+        return self._epoch + self._generations.get(url, 0)
+
+    @staticmethod
+    def make_key(url: str, api: str, parameters: dict[str, Any], sanitize_json: bool = True) -> tuple[str, str, str, bool]:
+        """
+        Builds the key of a cached response; ``SESSIONID`` is left out as it is handled per Instance.
+
+        Parameters
+        -----------
+        url: :class:`str`
+            The url of the Instance the request is for.
+        api: :class:`str`
+            The API endpoint, eg ``Core/GetModuleInfo``.
+        parameters: dict[:class:`str`, Any]
+            The parameters of the request.
+        sanitize_json: :class:`bool`, optional
+            If the response was sanitized, see :meth:`Base.sanitize_json`, by default True.
+
+        Returns
+        --------
+        tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The ``(url, api, canonical parameters, sanitize_json)`` key.
+        """
+        params: dict[str, Any] = {key: value for key, value in parameters.items() if key != "SESSIONID"}
+        return (url, api, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str), sanitize_json)
+
+    def get(self, key: tuple[str, str, str, bool]) -> Union[tuple[Any, bool], None]:
+        """
+        Retrieves a cached response.
+
+        Parameters
+        -----------
+        key: tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The key from :meth:`make_key`.
+
+        Returns
+        --------
+        tuple[Any, :class:`bool`] | None
+            The response and if it is stale (expired but within :attr:`stale_ttl`), otherwise None.
+        """
+        entry: Union[tuple[Any, float], None] = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        now: float = time.monotonic()
+        if now < expires_at:
+            self._entries.move_to_end(key)
+            return value, False
+        if now < expires_at + self.stale_ttl:
+            return value, True
+        del self._entries[key]
+        return None
+
+    def set(self, key: tuple[str, str, str, bool], value: Any, ttl: float, generation: int) -> None:
+        """
+        Stores a response, unless the entries of its Instance were invalidated since the request was sent.
+
+        Parameters
+        -----------
+        key: tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The key from :meth:`make_key`.
+        value: Any
+            The (sanitized) JSON response.
+        ttl: :class:`float`
+            How long in seconds the response is fresh.
+        generation: :class:`int`
+            The :meth:`generation` of the Instance from before the request was sent.
+        """
+        if self.enabled is False or generation != self.generation(url=key[0]):
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: tuple[str, str, str, bool], request: Callable[[], Coroutine[None, None, Any]]) -> None:
+        """
+        Runs ``request`` in the background to refresh a stale entry; unless a refresh for it is already running.
+
+        Parameters
+        -----------
+        key: tuple[:class:`str`, :class:`str`, :class:`str`, :class:`bool`]
+            The key from :meth:`make_key`.
+        request: Callable[[], Coroutine[None, None, Any]]
+            The coroutine function that sends the request and stores the response via :meth:`set`.
+        """
+        if key in self._refreshing:
+            return
+        self._logger.debug("DEBUG %s refreshing %s | %s", type(self).__name__, key[1], key[0])
+        # The refresh outlives the call that noticed the stale entry; so it must not inherit its `Deadline` or priority.
+        future: asyncio.Future[Any] = Context().run(asyncio.ensure_future, request())
+        self._refreshing[key] = future
+        future.add_done_callback(lambda fut: self._refreshed(key=key, future=fut))
+
+    def invalidate(self, url: Union[str, None] = None, apis: Union[Iterable[str], None] = None) -> int:
+        """
+        Drops cached responses.
+
+        Parameters
+        -----------
+        url: Union[:class:`str`, None], optional
+            Only drop the responses of this Instance url, by default None (every Instance).
+        apis: Union[Iterable[:class:`str`], None], optional
+            Only drop the responses of these API endpoints, eg ``{"Core/GetSettingsSpec"}``, by default None (every endpoint).
+
+        Returns
+        --------
+        :class:`int`
+            The number of responses dropped.
+        """
+        if url is None:
+            self._epoch += 1
+        else:
+            self._generations[url] = self._generations.get(url, 0) + 1
+        endpoints: Union[frozenset[str], None] = frozenset(apis) if apis is not None else None
+        keys: list[tuple[str, str, str, bool]] = [
+            key for key in self._entries if (url is None or key[0] == url) and (endpoints is None or key[1] in endpoints)
+        ]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self._logger.debug("DEBUG %s dropped %s responses | %s %s", type(self).__name__, len(keys), url, endpoints)
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drops every cached response and cancels the running background refreshes.
+        """
+        self._epoch += 1
+        self._entries.clear()
+        for future in self._refreshing.values():
+            future.cancel()
+        self._refreshing.clear()
+
+    def _refreshed(self, key: tuple[str, str, str, bool], future: asyncio.Future[Any]) -> None:
+        if self._refreshing.get(key) is future:
+            self._refreshing.pop(key, None)
+        if not future.cancelled() and future.exception() is not None:
+            # The stale response is kept until it runs out; the next call past that tries again.
+            self._logger.debug("DEBUG %s refreshing %s failed | %s", type(self).__name__, key[1], future.exception())
@@ -1,25 +1,25 @@
 from __future__ import annotations
 
-import json
 import logging
 import traceback
+from dataclasses import fields
 from datetime import datetime
 from logging import Logger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Union
 
-from dataclass_wizard import fromdict
-
+from .codec import get_default_codec
 from .dataclass import ScheduleData
-from .instance import AMPMinecraftInstance
 from .types_ import ScheduleDataData
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from io import TextIOWrapper
 
+    from .codec import JSONCodec
     from .controller import AMPADSInstance, AMPControllerInstance, AMPInstance
     from .dataclass import Diagnostics, Methods, SettingSpec, SettingsSpecParent, Triggers
+    from .instance import AMPMinecraftInstance
     from .types_ import APISpec, PermissionNode, ScheduleDataData
 
 
@@ -123,7 +123,7 @@ async def _parse_get_api_spec_to_file(
     sanitize_json : bool
         Sanitize the JSON responses to meet PEP8 compliance. Default is False.
     """
-    _logger: Logger = logging.getLogger()
+    _logger: Logger = logging.getLogger(__name__)
 
     data: APISpec = await instance.get_api_spec(sanitize_json=sanitize_json)
     diag_info: Diagnostics = await instance.get_diagnostics_info()
@@ -338,7 +338,7 @@ def _settings_node_parse(
         file.write("\n" + _wildcard_nodes)
         file.write(f"\n{example_note}\n")
 
-    for key in sorted(vars(data)):
+    for key in sorted(field.name for field in fields(data)):
         # Our second headers.
         header: str = "Settings " + key.title() + " Nodes"
         # file.write("\n:raw-html:`<hr>`\n")
@@ -430,6 +430,8 @@ async def amp_api_update(instance: AMPControllerInstance, sanitize_json: bool) -
     sanitize_json : bool
         Sanitize the JSON responses to meet PEP8 compliance.
     """
+    from .instance import AMPMinecraftInstance
+
     # We call get_instances() to force a current listing of instances to be populated.
     await instance.get_instances()
     for entry in instance.instances:
@@ -467,7 +469,13 @@ def dict_merge(dict1: ScheduleDataData, dict2: ScheduleDataData) -> ScheduleData
     return dict1  # type: ignore
 
 
-def dump_to_file(data: Iterable, file_name: str = "", path: Union[Path, None] = None, no_format: bool = True) -> None:
+def dump_to_file(
+    data: Iterable,
+    file_name: str = "",
+    path: Union[Path, None] = None,
+    no_format: bool = True,
+    codec: Union[JSONCodec, None] = None,
+) -> None:
     """
     Dump's a list or dict to a file.
 
@@ -478,8 +486,13 @@ def dump_to_file(data: Iterable, file_name: str = "", path: Union[Path, None] =
     path : Union[Path, None], optional
         The Path to store the dump file, by default None
         - If ``None`` will use the ``../docs/dumps/`` path.
+    codec : Union[JSONCodec, None], optional
+        The codec used to encode the data, by default None
+        - If ``None`` will use :func:`get_default_codec`.
     """
-    _logger = logging.getLogger()
+    _logger = logging.getLogger(__name__)
+    if codec is None:
+        codec = get_default_codec()
 
     if file_name == "":
         file_name = str(object=datetime.today().date())
@@ -488,9 +501,8 @@ def dump_to_file(data: Iterable, file_name: str = "", path: Union[Path, None] =
     else:
         _cwd = path.joinpath(f"{file_name}.dump")
     _logger.info("Dumping to %s", _cwd.resolve())
-    with _cwd.open(mode="w+") as file:
-        res: str = json.dumps(data, indent=4, skipkeys=True, separators=(",", ": "), sort_keys=True)
-        file.write(res)
+    with _cwd.open(mode="wb+") as file:
+        file.write(codec.dumps(data, pretty=True))
 
 
 async def generate_docs_rst(instance: AMPControllerInstance) -> None:
@@ -507,7 +519,7 @@ async def generate_docs_rst(instance: AMPControllerInstance) -> None:
     instance: AMPControllerInstance | AMPADSInstance
         Must be of these types as the API endpoint :meth:`get_settingspec` is not available to all.
     """
-    logger: Logger = logging.getLogger()
+    logger: Logger = logging.getLogger(__name__)
     spec: SettingsSpecParent = await instance.get_setting_spec()
 
     _path: Path = Path(__file__).parent.joinpath("../docs/nodes")
@@ -550,6 +562,8 @@ async def generate_docs_rst(instance: AMPControllerInstance) -> None:
             data = dict_merge(data, srcds_data)
             src_ = True
 
+    from dataclass_wizard import fromdict
+
     _temp: ScheduleData = fromdict(ScheduleData, data)  # type: ignore
     _trigger_event_parse(
         data=_temp.available_triggers,
@@ -0,0 +1,59 @@
+"""
+Compares the JSON codecs on the bundled ``ADSModule/GetInstances`` sample.
+
+Run it with ``python tests/bench_codec.py``; the :class:`OrjsonCodec` is skipped when ``orjson`` is not installed.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ampapi.codec import JSONCodec, OrjsonCodec, StdlibJSONCodec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SAMPLE: Path = ROOT / "docs" / "samples" / "GetInstances.json"
+
+
+def _codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except RuntimeError:
+        print("orjson is not installed; only the stdlib codec is measured.")
+    return codecs
+
+
+def _best(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    # The best run is the least disturbed by whatever else the machine is doing.
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(number: int = 2000) -> None:
+    body: bytes = SAMPLE.read_bytes()
+    data: Any = StdlibJSONCodec().loads(body)
+    print(f"{SAMPLE.name}: {len(body):,} bytes, {number} calls per run")
+    print(f"{'codec':<8} {'loads':>12} {'dumps':>12} {'pretty':>12}")
+    baseline: dict[str, float] = {}
+    for codec in _codecs():
+        results: dict[str, float] = {
+            "loads": _best(lambda codec=codec: codec.loads(body), number=number),
+            "dumps": _best(lambda codec=codec: codec.dumps(data), number=number),
+            "pretty": _best(lambda codec=codec: codec.dumps(data, pretty=True), number=number),
+        }
+        baseline = baseline or results
+        print(
+            f"{codec.name:<8} "
+            + " ".join(f"{value * 1e6:>7.1f}us {baseline[key] / value:>3.1f}x" for key, value in results.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
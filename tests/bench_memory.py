@@ -0,0 +1,121 @@
+"""
+Measures with :mod:`tracemalloc` how much memory decoded responses keep alive, for our slotted dataclasses with
+interned strings versus the same dataclasses with a ``__dict__`` and no interning.
+
+Run it with ``python tests/bench_memory.py``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ampapi.base import Base
+from ampapi.dataclass import AuditLogEntry, ConsoleEntries, Directory, MetricsData
+from ampapi.decoder import DecoderRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+COUNT: int = 20_000
+
+
+def _timestamp(index: int) -> str:
+    return f"/Date({1722527400266 + index * 1000})/"
+
+
+PAYLOADS: dict[type, Callable[[int], dict[str, Any]]] = {
+    ConsoleEntries: lambda index: {
+        "Contents": f"[Server thread/INFO]: Player{index % 50} joined the game",
+        "Source": ("Console", "Server", "System")[index % 3],
+        "Type": ("Console", "Chat", "Event")[index % 3],
+        "Timestamp": _timestamp(index),
+    },
+    MetricsData: lambda index: {
+        "RawValue": index % 100,
+        "MaxValue": 100,
+        "Percent": index % 100,
+        "Units": ("%", "MB", "")[index % 3],
+        "Color": "#0B1118",
+        "Color2": "#222",
+        "Color3": "#fff",
+    },
+    AuditLogEntry: lambda index: {
+        "Acknowledged": False,
+        "Category": ("Login", "Settings", "Instance")[index % 3],
+        "EventType": index % 7,
+        "Id": index,
+        "Message": f"User admin changed setting {index}",
+        "Source": "127.0.0.1",
+        "User": ("admin", "moderator")[index % 2],
+        "Timestamp": _timestamp(index),
+    },
+    Directory: lambda index: {
+        "IsDirectory": False,
+        "IsVirtualDirectory": False,
+        "Filename": f"r.{index % 100}.{index // 100}.mca",
+        "SizeBytes": index * 4096,
+        "IsDownloadable": True,
+        "IsEditable": False,
+        "IsArchive": False,
+        "IsExcludedFromBackups": False,
+        "Created": _timestamp(index),
+        "Modified": _timestamp(index),
+    },
+}
+
+
+def _unslotted(cls: type) -> type:
+    # The same fields and `__post_init__` as before the dataclasses were slotted.
+    namespace: dict[str, Any] = {
+        key: vars(cls)[key] for key in ("__post_init__", "_post_init_fields", "__module__") if key in vars(cls)
+    }
+    return dataclasses.make_dataclass(
+        cls.__name__, [(field.name, field.type, field) for field in dataclasses.fields(cls)], namespace=namespace
+    )
+
+
+def _retained(decode: Callable[[dict[str, Any]], Any], body: bytes) -> int:
+    # What is still allocated once the JSON response itself is gone; ie what holding on to the results costs.
+    gc.collect()
+    tracemalloc.start()
+    data: list[dict[str, Any]] = Base.sanitize_json(json.loads(body))
+    results: list[Any] = [decode(entry) for entry in data]
+    del data
+    gc.collect()
+    retained: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return retained
+
+
+def main(count: int = COUNT) -> None:
+    slotted: DecoderRegistry = DecoderRegistry()
+    plain: DecoderRegistry = DecoderRegistry()
+    plain.intern_fields = frozenset()
+    print(f"{count:,} objects per type, memory kept after decoding")
+    print(f"{'dataclass':<16} {'__dict__':>10} {'slots':>10} {'saved':>7}")
+    for cls, build in PAYLOADS.items():
+        body: bytes = json.dumps([build(index) for index in range(count)]).encode()
+        before: type = _unslotted(cls)
+        decoders: list[Callable[[dict[str, Any]], Any]] = [
+            lambda data, before=before: plain.decode(cls=before, data=data),
+            lambda data, cls=cls: slotted.decode(cls=cls, data=data),
+        ]
+        # Compiles the decoders and fills the shared timestamp memo outside of the measurement.
+        for decode in decoders:
+            _retained(decode=decode, body=body)
+        old, new = (_retained(decode=decode, body=body) for decode in decoders)
+        print(f"{cls.__name__:<16} {old / 2**20:>7.2f}MiB {new / 2**20:>7.2f}MiB {1 - new / old:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
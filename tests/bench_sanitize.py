@@ -0,0 +1,82 @@
+"""
+Times :meth:`Base.sanitize_json` and :meth:`Base._sanitize_key` on an ``Core/GetUpdates`` payload and the bundled
+``ADSModule/GetInstances`` sample, next to the recursive version it replaced.
+
+Run it with ``python tests/bench_sanitize.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from test_sanitize import UPDATES, _Recursive
+
+from ampapi.base import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SAMPLE: Path = ROOT / "docs" / "samples" / "GetInstances.json"
+
+
+def _best(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    # The best run is the least disturbed by whatever else the machine is doing.
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _keys(data: Any) -> list[str]:
+    keys: list[str] = []
+    stack: list[Any] = [data]
+    while stack:
+        value: Any = stack.pop()
+        if isinstance(value, dict):
+            keys.extend(value)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return keys
+
+
+def main(number: int = 500) -> None:
+    # A busy Instance; the console and tasks are what makes `Core/GetUpdates` large.
+    updates: dict[str, Any] = dict(
+        UPDATES,
+        ConsoleEntries=UPDATES["ConsoleEntries"] * 100,
+        Tasks=UPDATES["Tasks"] * 10,
+        Ports=UPDATES["Ports"] * 10,
+    )
+    payloads: dict[str, Any] = {"Updates": updates, "Controller": json.loads(SAMPLE.read_text())}
+    print(f"{'payload':<12} {'keys':>6} {'recursive':>12} {'cold':>14} {'warm':>14} {'per key':>10}")
+    for name, data in payloads.items():
+        keys: list[str] = _keys(data=data)
+
+        def cold(data: Any = data) -> Any:
+            Base.clear_key_cache()
+            return Base.sanitize_json(json=data)
+
+        def per_key(keys: list[str] = keys) -> None:
+            for key in keys:
+                Base._sanitize_key(key)
+
+        recursive: float = _best(lambda data=data: _Recursive.sanitize_json(json=data), number=number)
+        results: list[float] = [
+            _best(cold, number=number),
+            _best(lambda data=data: Base.sanitize_json(json=data), number=number),
+        ]
+        key: float = _best(per_key, number=number) / len(keys)
+        print(
+            f"{name:<12} {len(keys):>6} {recursive * 1e6:>10.1f}us "
+            + " ".join(f"{value * 1e6:>7.1f}us {recursive / value:>3.1f}x" for value in results)
+            + f" {key * 1e9:>8.1f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
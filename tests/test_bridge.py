@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from ampapi.bridge import Bridge
+from ampapi.codec import StdlibJSONCodec
+from ampapi.dataclass import APIParams, ConnectionSettings, RetryPolicy, TimeoutSettings
+
+PARAMS: APIParams = APIParams(url="http://127.0.0.1:8080", user="user", password="password")
+
+
+def test_reinit_keeps_settings() -> None:
+    settings: dict[str, object] = {
+        "connection_settings": ConnectionSettings(limit_per_host=3),
+        "retry_policy": RetryPolicy(max_retries=7),
+        "timeout_settings": TimeoutSettings(default=5.0),
+        "json_codec": StdlibJSONCodec(),
+    }
+    bridge: Bridge = Bridge(api_params=PARAMS, **settings)
+    # The Bridge is a singleton; a re-init only replaces what is passed in.
+    assert Bridge(api_params=PARAMS) is bridge
+    assert {name: getattr(bridge, name) for name in settings} == settings
+    assert all(getattr(bridge, name) is value for name, value in settings.items())
+
+    retry_policy: RetryPolicy = RetryPolicy(max_retries=1)
+    Bridge(api_params=PARAMS, retry_policy=retry_policy)
+    assert bridge.retry_policy is retry_policy
+    assert bridge.connection_settings is settings["connection_settings"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ampapi.capability import FileSpecCache, SpecCache
+from ampapi.dataclass import VersionInfo
+
+SPEC: dict[str, Any] = {"Core": {"GetStatus": {"Description": "Gets the status", "Parameters": []}}}
+
+
+def _key() -> str:
+    return SpecCache.make_key(
+        module="Minecraft",
+        version=VersionInfo(major=2, minor=6, revision=0, minor_revision=4),
+        api="Core/GetAPISpec",
+        sanitize_json=False,
+    )
+
+
+def test_file_spec_cache_roundtrip(tmp_path: Path) -> None:
+    async def main() -> Any:
+        await FileSpecCache(path=tmp_path).write(key=_key(), value=SPEC)
+        # A restarted worker only has the file.
+        return await FileSpecCache(path=tmp_path).read(key=_key())
+
+    assert asyncio.run(main()) == SPEC
+    assert FileSpecCache(path=tmp_path).get(key=_key()) == SPEC
+    assert len(list(tmp_path.glob("*.json.gz"))) == 1
+
+
+def test_file_spec_cache_io_off_the_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: FileSpecCache = FileSpecCache(path=tmp_path)
+    threads: list[int] = []
+    for name in ("_read_file", "_write_file"):
+        method = getattr(cache, name)
+
+        def record(*args: Any, method: Any = method, **kwargs: Any) -> Any:
+            threads.append(threading.get_ident())
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, record)
+
+    async def main() -> Any:
+        await cache.write(key=_key(), value=SPEC)
+        cache._entries.clear()
+        return await cache.read(key=_key())
+
+    assert asyncio.run(main()) == SPEC
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
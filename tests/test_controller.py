@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import pytest
+
+from ampapi.base import Base
+from ampapi.bridge import Bridge
+from ampapi.controller import AMPControllerInstance
+from ampapi.dataclass import APIParams
+from ampapi.enums import AMPInstanceState
+from ampapi.instance import AMPADSInstance, AMPInstance, AMPMinecraftInstance
+
+SAMPLE: Path = Path(__file__).resolve().parent.parent / "docs" / "samples" / "GetInstances.json"
+
+LOGIN: dict[str, Any] = {
+    "success": True,
+    "result": 0,
+    "sessionID": "session",
+    "permissions": [],
+    "resultReason": "",
+    "rememberMeToken": "",
+}
+
+
+class StubADS:
+    """Answers ``ADSModule/GetInstances`` with :attr:`payload` in place of :meth:`Base._post`."""
+
+    def __init__(self) -> None:
+        self.payload: list[dict[str, Any]] = json.loads(SAMPLE.read_text())
+
+    def instance(self, name: str) -> dict[str, Any]:
+        return next(
+            entry
+            for controller in self.payload
+            for entry in controller["AvailableInstances"]
+            if entry["InstanceName"] == name
+        )
+
+    async def post(self, url: str) -> tuple[int, Any]:
+        if url.endswith("/Core/Login"):
+            return 200, dict(LOGIN)
+        if url.endswith("/ADSModule/GetInstances"):
+            # A fresh copy like a real response; decoding must not depend on the previous one.
+            return 200, copy.deepcopy(self.payload)
+        return 200, {}
+
+
+@pytest.fixture
+def ads(monkeypatch: pytest.MonkeyPatch) -> StubADS:
+    stub: StubADS = StubADS()
+
+    async def _post(
+        self: Base, url: str, data: bytes, timeout: Union[float, None] = None, raw: bool = False
+    ) -> tuple[int, Any]:
+        return await stub.post(url=url)
+
+    monkeypatch.setattr(Base, "_post", _post)
+    Bridge(api_params=APIParams(url="http://127.0.0.1:8080", user="user", password="password"))
+    return stub
+
+
+def _refresh(controller: AMPControllerInstance) -> dict[str, Union[AMPADSInstance, AMPInstance, AMPMinecraftInstance]]:
+    instances: Any = asyncio.run(controller.get_instances(format_data=True))
+    return {instance.instance_id: instance for instance in instances}
+
+
+def test_identity_is_stable(ads: StubADS) -> None:
+    controller: AMPControllerInstance = AMPControllerInstance()
+    first = _refresh(controller=controller)
+    assert len(first) == sum(len(entry["AvailableInstances"]) for entry in ads.payload)
+    assert len(controller.instances_delta.added) == len(first)
+    assert isinstance(first[ads.instance("ADS01")["InstanceID"]], AMPADSInstance)
+    assert isinstance(first[ads.instance("Hub01")["InstanceID"]], AMPMinecraftInstance)
+
+    hub = first[ads.instance("Hub01")["InstanceID"]]
+    hub.note = "attached by a caller"  # type: ignore[attr-defined]
+    second = _refresh(controller=controller)
+    assert not controller.instances_delta
+    assert all(second[instance_id] is instance for instance_id, instance in first.items())
+    assert hub.note == "attached by a caller"  # type: ignore[attr-defined]
+
+
+def test_delta(ads: StubADS) -> None:
+    controller: AMPControllerInstance = AMPControllerInstance()
+    before = _refresh(controller=controller)
+
+    proxy: dict[str, Any] = ads.instance("Proxy02")
+    proxy["AppState"] = AMPInstanceState.ready.value
+    proxy["Running"] = False
+    skyrim: dict[str, Any] = ads.instance("Skyrim01")
+    ads.payload[1]["AvailableInstances"].remove(skyrim)
+    new: dict[str, Any] = dict(
+        ads.instance("Hub01"), InstanceID="00000000-0000-0000-0000-000000000001", InstanceName="Hub02"
+    )
+    ads.payload[0]["AvailableInstances"].append(new)
+
+    after = _refresh(controller=controller)
+    delta = controller.instances_delta
+    assert [instance.instance_id for instance in delta.added] == [new["InstanceID"]]
+    assert delta.removed == [before[skyrim["InstanceID"]]]
+    assert delta.changed == {proxy["InstanceID"]: frozenset({"app_state", "running"})}
+    assert after[proxy["InstanceID"]] is before[proxy["InstanceID"]]
+    assert after[proxy["InstanceID"]].app_state is AMPInstanceState.ready
+    assert skyrim["InstanceID"] not in after
+
+
+def test_index_follows_changes(ads: StubADS) -> None:
+    controller: AMPControllerInstance = AMPControllerInstance()
+    instances = _refresh(controller=controller)
+    index = controller.instance_index
+    hub = instances[ads.instance("Hub01")["InstanceID"]]
+    assert index.get_by_name(name="Hub01") is hub
+    assert hub in index.find(app_state=AMPInstanceState.ready)
+
+    entry: dict[str, Any] = ads.instance("Hub01")
+    entry.update(InstanceName="Lobby01", AppState=AMPInstanceState.stopped.value, Tags=["Lobby"])
+    _refresh(controller=controller)
+    assert controller.instances_delta.changed[hub.instance_id] >= {"instance_name", "app_state", "tags"}
+    assert index.get(instance_id=hub.instance_id) is hub
+    assert index.get_by_name(name="Hub01") is None
+    assert index.get_by_name(name="Lobby01") is hub
+    assert hub not in index.find(app_state=AMPInstanceState.ready)
+    assert hub in index.find(app_state=AMPInstanceState.stopped)
+    assert index.find(tag="Lobby") == {hub}
+
+    # A different module needs a different class; so the Instance is replaced.
+    entry["Module"] = "GenericModule"
+    after = _refresh(controller=controller)
+    replaced = after[hub.instance_id]
+    assert replaced is not hub and type(replaced) is AMPInstance
+    assert controller.instances_delta.removed == [hub]
+    assert index.find(tag="Lobby") == {replaced}
+    assert hub not in index.find(module="Minecraft")
+
+
+def test_find_intersects(ads: StubADS) -> None:
+    controller: AMPControllerInstance = AMPControllerInstance()
+    instances = _refresh(controller=controller)
+    index = controller.instance_index
+    target: str = ads.instance("Hub01")["TargetID"]
+
+    def scan(**values: Any) -> frozenset[Any]:
+        return frozenset(
+            instance
+            for instance in instances.values()
+            if all(getattr(instance, name) == value for name, value in values.items())
+        )
+
+    for values in (
+        {"module": "Minecraft"},
+        {"module": "Minecraft", "app_state": AMPInstanceState.ready},
+        {"module": "GenericModule", "app_state": AMPInstanceState.stopped},
+        {"module": "Minecraft", "app_state": AMPInstanceState.ready, "target_id": target},
+    ):
+        found = index.find(**values)
+        assert found and found == scan(**values)
+    assert index.find(module="Minecraft", target_id="not a target") == frozenset()
+    assert index.find(module="ADS", app_state=AMPInstanceState.ready) == frozenset()
+    assert index.find() == frozenset(instances.values())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import ampapi.dataclass
+from ampapi.base import Base
+from ampapi.dataclass import ConsoleEntries, Controller, Instance, Updates
+from ampapi.decoder import DecoderRegistry
+
+SAMPLE: Path = Path(__file__).resolve().parent.parent / "docs" / "samples" / "GetInstances.json"
+
+UPDATES: dict[str, Any] = {
+    "Status": {"State": 20, "Uptime": "1.02:03:04", "Metrics": None},
+    "ConsoleEntries": [
+        {"Timestamp": "/Date(1722527400266)/", "Source": "Console", "Type": "Console", "Contents": f"line {index}"}
+        for index in range(3)
+    ],
+    "Messages": [{"AgeMinutes": 1, "Expired": False, "Id": "m", "Message": "Hello", "Source": "Core"}],
+    "Ports": [{"Listening": True, "Name": "Minecraft Server Address", "Port": 25565, "Protocol": 0}],
+    "Tasks": [
+        {
+            "IsPrimaryTask": True,
+            "StartTime": "/Date(1722527400266)/",
+            "Id": "t",
+            "Name": "Backup",
+            "Description": "Taking a backup",
+            "HideFromUI": False,
+            "FastDismiss": False,
+            "LastUpdatePushed": "/Date(1722527400266)/",
+            "ProgressPercent": 50.0,
+            "IsCancellable": True,
+            "Origin": "Local",
+            "IsIndeterminate": False,
+            "State": 1,
+            "Status": "Running",
+        }
+    ],
+}
+
+_NO_CODE: Any = (lambda: None).__code__
+
+
+def _slotted() -> list[type]:
+    return [
+        cls
+        for cls in vars(ampapi.dataclass).values()
+        if isinstance(cls, type)
+        and cls.__module__ == ampapi.dataclass.__name__
+        and dataclasses.is_dataclass(cls)
+        and "__slots__" in vars(cls)
+        # The ones with their own `__repr__` built from the fields, instead of the dataclass one.
+        and "_field_values" in getattr(vars(cls).get("__repr__"), "__code__", _NO_CODE).co_names
+    ]
+
+
+def _updates() -> Updates:
+    # Parsed again each time; the strings of two payloads are different objects until they are interned.
+    return DecoderRegistry().decode(cls=Updates, data=Base.sanitize_json(json.loads(json.dumps(UPDATES))))
+
+
+@pytest.mark.parametrize("cls", _slotted(), ids=lambda cls: cls.__name__)
+def test_slotted_repr(cls: type) -> None:
+    # The `__repr__` of our slotted dataclasses can't use `vars()`; every field must still show up.
+    data: Any = object.__new__(cls)
+    for field in dataclasses.fields(cls):
+        object.__setattr__(data, field.name, f"<{field.name}>")
+    assert not hasattr(data, "__dict__")
+    text: str = repr(data)
+    assert all(f"<{field.name}>" in text for field in dataclasses.fields(cls))
+
+
+def test_decode_updates() -> None:
+    updates: Updates = _updates()
+    assert [entry.contents for entry in updates.console_entries] == ["line 0", "line 1", "line 2"]
+    assert updates.tasks[0].progress_percent == 50.0
+    assert updates.ports[0].port == 25565
+    assert "line 2" in repr(updates)
+    assert "Taking a backup" in repr(updates.tasks[0])
+    assert not hasattr(updates.console_entries[0], "__dict__")
+
+
+def test_interned_strings() -> None:
+    first, second = _updates(), _updates()
+    assert first.console_entries[0].source is second.console_entries[0].source
+    assert first.messages[0].source is second.messages[0].source
+    # Free text is left alone.
+    assert first.console_entries[0].contents is not second.console_entries[0].contents
+
+
+def test_decode_sample_instances() -> None:
+    data: list[dict[str, Any]] = Base.sanitize_json(json.loads(SAMPLE.read_text()))
+    controller: Controller = DecoderRegistry().decode(cls=Controller, data=data[0])
+    instance: Instance = controller.available_instances[0]
+    assert not hasattr(instance, "__dict__")
+    assert instance.instance_name in repr(instance)
+    modules: dict[str, str] = {}
+    for instance in controller.available_instances:
+        assert modules.setdefault(instance.module, instance.module) is instance.module
+
+
+def test_view_of_slotted_class() -> None:
+    registry: DecoderRegistry = DecoderRegistry()
+    data: dict[str, Any] = Base.sanitize_json(UPDATES["ConsoleEntries"][0])
+    view: ConsoleEntries = registry.view(cls=ConsoleEntries, data=data)
+    decoded: ConsoleEntries = registry.decode(cls=ConsoleEntries, data=data)
+    assert view == decoded
+    assert repr(view) == repr(decoded)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Union
+
+import pytest
+
+from ampapi.base import Base
+from ampapi.bridge import Bridge
+from ampapi.core import Core
+from ampapi.dataclass import APIParams, TimeoutSettings
+from ampapi.transport import Deadline
+
+TIMEOUTS: TimeoutSettings = TimeoutSettings(fast=1.0, default=2.0, heavy=3.0, long_running=4.0)
+
+
+class StubPost:
+    """Stands in for :meth:`Base._post`; answers after the delay given by the ``delay`` parameter of the request."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Union[float, None]]] = []
+
+    async def __call__(self, url: str, data: bytes, timeout: Union[float, None] = None) -> tuple[int, Any]:
+        api: str = url.split("/API/", 1)[1]
+        self.calls.append((api, timeout))
+        delay: float = json.loads(data).get("delay", 0.0)
+        # aiohttp gives up on its own once the request timeout passes.
+        if timeout is not None and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError
+        await asyncio.sleep(delay)
+        return 200, {"delay": delay}
+
+
+@pytest.fixture
+def stub(monkeypatch: pytest.MonkeyPatch) -> StubPost:
+    post: StubPost = StubPost()
+
+    async def _post(
+        self: Base, url: str, data: bytes, timeout: Union[float, None] = None, raw: bool = False
+    ) -> tuple[int, Any]:
+        return await post(url=url, data=data, timeout=timeout)
+
+    monkeypatch.setattr(Base, "_post", _post)
+    Bridge(api_params=APIParams(url="http://127.0.0.1:8080", user="user", password="password"), timeout_settings=TIMEOUTS)
+    return post
+
+
+async def _call(core: Core, api: str, delay: float = 0.0) -> Any:
+    return await core._call_api(api=api, parameters={"delay": delay}, format_data=False)
+
+
+def test_deadline_times_out(stub: StubPost) -> None:
+    async def main() -> tuple[float, Union[float, None]]:
+        core: Core = Core()
+        start: float = time.monotonic()
+        async with Deadline(seconds=0.1):
+            with pytest.raises(asyncio.TimeoutError):
+                await _call(core=core, api="Core/Sleep", delay=1.0)
+        return time.monotonic() - start, Deadline.remaining()
+
+    elapsed, remaining = asyncio.run(main())
+    assert elapsed < 0.5
+    assert remaining is None
+
+
+def test_nested_deadline_only_shortens() -> None:
+    async def main() -> list[Union[float, None]]:
+        async with Deadline(seconds=0.5):
+            async with Deadline(seconds=10.0):
+                inner: Union[float, None] = Deadline.remaining()
+            outer: Union[float, None] = Deadline.remaining()
+        return [inner, outer]
+
+    inner, outer = asyncio.run(main())
+    assert inner is not None and inner <= 0.5
+    assert outer is not None and outer <= 0.5
+
+
+def test_timeout_classes(stub: StubPost) -> None:
+    async def main() -> None:
+        core: Core = Core()
+        for api in ("Core/GetStatus", "Core/Sleep", "ADSModule/GetInstances"):
+            await _call(core=core, api=api)
+        # Not an idempotent endpoint; coalesced requests run outside of the caller's deadline.
+        async with Deadline(seconds=0.5):
+            await _call(core=core, api="Core/Sleep")
+
+    asyncio.run(main())
+    assert [timeout for _, timeout in stub.calls[:3]] == [TIMEOUTS.fast, TIMEOUTS.default, TIMEOUTS.heavy]
+    # A deadline can only shorten the timeout of the endpoint class.
+    deadline_timeout: Union[float, None] = stub.calls[3][1]
+    assert deadline_timeout is not None and deadline_timeout <= 0.5
+
+
+def test_gather(stub: StubPost) -> None:
+    async def main() -> list[Any]:
+        core: Core = Core()
+        async with Deadline(seconds=0.2) as deadline:
+            return await deadline.gather(*(_call(core=core, api="Core/Sleep", delay=delay) for delay in (0.0, 1.0, 0.05)))
+
+    results: list[Any] = asyncio.run(main())
+    assert results[0] == {"delay": 0.0}
+    assert isinstance(results[1], asyncio.TimeoutError)
+    assert results[2] == {"delay": 0.05}
+
+
+def test_gather_outside_deadline() -> None:
+    async def main() -> None:
+        await Deadline(seconds=1.0).gather()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+
+
+def test_coalesced_request_keeps_each_deadline(stub: StubPost) -> None:
+    # The shared request must not time out with the caller that happened to send it.
+    async def main() -> list[Any]:
+        core: Core = Core()
+
+        async def short() -> Any:
+            async with Deadline(seconds=0.05):
+                return await _call(core=core, api="Core/GetStatus", delay=0.2)
+
+        async def later() -> Any:
+            await asyncio.sleep(0.01)
+            return await _call(core=core, api="Core/GetStatus", delay=0.2)
+
+        return await asyncio.gather(short(), later(), return_exceptions=True)
+
+    results: list[Any] = asyncio.run(main())
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == {"delay": 0.2}
+    assert [api for api, _ in stub.calls] == ["Core/GetStatus"]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ampapi.base import Base
+from ampapi.dataclass import Controller, Instance
+from ampapi.decoder import DecoderRegistry, _Fallback
+
+SAMPLE: Path = Path(__file__).resolve().parent.parent / "docs" / "samples" / "GetInstances.json"
+
+
+@pytest.fixture
+def controllers() -> list[dict[str, Any]]:
+    return Base.sanitize_json(json.loads(SAMPLE.read_text()))
+
+
+def test_decode_sample(controllers: list[dict[str, Any]]) -> None:
+    # The compiled decoder has to handle the real payload itself; `fromdict` is only the fallback.
+    decode = DecoderRegistry().get(cls=Controller)
+    assert decode is not None
+    for data in controllers:
+        controller: Controller = decode(data)
+        assert controller.instance_id == data["instance_id"]
+        assert [instance.instance_id for instance in controller.available_instances] == [
+            instance["instance_id"] for instance in data["available_instances"]
+        ]
+        assert all(isinstance(instance, Instance) for instance in controller.available_instances)
+
+
+def test_json_to_dataclass_sample(controllers: list[dict[str, Any]]) -> None:
+    result: list[Controller] = Base.json_to_dataclass(
+        json=controllers, format_=Controller, _use_from_dict=True, _auto_unpack=True
+    )
+    assert [controller.friendly_name for controller in result] == [data["friendly_name"] for data in controllers]
+
+
+def test_unknown_keys_are_ignored(controllers: list[dict[str, Any]]) -> None:
+    decode = DecoderRegistry().get(cls=Instance)
+    assert decode is not None
+    data: dict[str, Any] = dict(controllers[0]["available_instances"][0], not_a_field=1)
+    assert decode(data).instance_id == data["instance_id"]
+
+
+def test_near_miss_falls_back(controllers: list[dict[str, Any]]) -> None:
+    # A differently cased field name is left to `fromdict`, which knows how to match it up.
+    decode = DecoderRegistry().get(cls=Instance)
+    assert decode is not None
+    data: dict[str, Any] = dict(controllers[0]["available_instances"][0])
+    data["FriendlyName"] = data.pop("friendly_name")
+    with pytest.raises(_Fallback):
+        decode(data)
+
+
+def test_view_sample(controllers: list[dict[str, Any]]) -> None:
+    registry: DecoderRegistry = DecoderRegistry()
+    data: dict[str, Any] = controllers[0]
+    view: Controller = registry.view(cls=Controller, data=data)
+    assert isinstance(view, Controller) and type(view) is not Controller
+    # Nothing is decoded until a field is read, and then only that field.
+    assert vars(view) == {}
+    assert view.friendly_name == data["friendly_name"]
+    assert set(vars(view)) == {"friendly_name"}
+
+    instances: list[Instance] = view.available_instances
+    assert all(isinstance(instance, Instance) and type(instance) is not Instance for instance in instances)
+    assert all(vars(instance) == {} for instance in instances)
+    assert instances[0].instance_name == data["available_instances"][0]["instance_name"]
+    assert set(vars(instances[0])) == {"instance_name"}
+    assert view == registry.decode(cls=Controller, data=data)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import importlib
+import json
+import pkgutil
+import subprocess
+import sys
+from pathlib import Path
+
+import ampapi
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+# Heavy imports that `import ampapi` must not pay for; they are loaded on first use of a public name.
+DEFERRED_MODULES: tuple[str, ...] = ("aiohttp", "dataclass_wizard", "pyotp", "ampapi.dataclass", "ampapi.util")
+
+# Generous on purpose, the lazy package imports in a few milliseconds; the eager one took over half a second.
+IMPORT_BUDGET_US: int = 250_000
+
+
+def _submodules() -> list[str]:
+    return [info.name for info in pkgutil.iter_modules(ampapi.__path__)]
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+
+
+def test_import_is_lazy() -> None:
+    result: str = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, ampapi; print(json.dumps(sorted(sys.modules)))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    loaded: list[str] = json.loads(result)
+    assert [name for name in DEFERRED_MODULES if name in loaded] == []
+
+
+def test_import_time() -> None:
+    # `-X importtime` lines are `import time: self [us] | cumulative | imported package`.
+    for line in _run(code="import ampapi").splitlines():
+        parts: list[str] = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "ampapi":
+            assert int(parts[1]) < IMPORT_BUDGET_US
+            return
+    raise AssertionError("`ampapi` not found in the -X importtime output.")
+
+
+def test_submodules_are_attributes() -> None:
+    # In a fresh interpreter; importing the submodules here would set them on the package for us.
+    code: str = (
+        "import json, types, ampapi; "
+        f"print(json.dumps([name for name in {_submodules()!r} if not isinstance(getattr(ampapi, name, None), types.ModuleType)]))"
+    )
+    result: str = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    assert json.loads(result) == []
+    assert ampapi.types is ampapi.types_
+
+
+def test_public_names() -> None:
+    for name in _submodules():
+        module = importlib.import_module(f"ampapi.{name}")
+        for public in getattr(module, "__all__", ()):
+            assert public in ampapi.__all__, f"{name}.{public} is missing from ampapi.__all__"
+            assert getattr(ampapi, public) is getattr(module, public)
+
+
+def test_star_import() -> None:
+    namespace: dict[str, object] = {}
+    exec("from ampapi import *", namespace)
+    expected: set[str] = {*_submodules(), "types", "version_info", "Bridge", "Core", "AMPControllerInstance"}
+    assert expected - set(namespace) == set()
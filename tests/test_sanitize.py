@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import copy
+import json
+import random
+import re
+from pathlib import Path
+from typing import Any
+
+from ampapi.base import Base
+
+SAMPLE: Path = Path(__file__).resolve().parent.parent / "docs" / "samples" / "GetInstances.json"
+
+UPDATES: dict[str, Any] = {
+    "Status": {
+        "State": 20,
+        "Uptime": "1.02:03:04",
+        "Metrics": {"CPU Usage": {"RawValue": 3, "MaxValue": 100, "Percent": 3, "Units": "%", "Color": "#fff"}},
+    },
+    "ConsoleEntries": [
+        {"Timestamp": "/Date(1722527400266)/", "Source": "Console", "Type": "Console", "Contents": "Done (4.2s)!"}
+    ],
+    "Messages": [],
+    "Ports": [{"Port": 25565, "Protocol": 0, "Name": "Minecraft Server Address", "Listening": True}],
+    "Tasks": [{"Id": "x", "IsPrimary": True, "Name": "Backup", "HideFromUI": False, "Progress": 50.0}],
+}
+
+
+class _Recursive:
+    """``Base.sanitize_json`` as it was before the single pass rewrite; the reference the rewrite must match."""
+
+    json_key_mapping: dict[str, str] = Base.json_key_mapping
+
+    @staticmethod
+    def camel_to_snake_re(data: str) -> str:
+        data = re.sub(pattern="(.)([A-Z][a-z]+)", repl=r"\1_\2", string=data)
+        return re.sub(pattern="([a-z0-9])([A-Z])", repl=r"\1_\2", string=data).lower()
+
+    @classmethod
+    def sanitize_json(cls, json: Any) -> Any:
+        if isinstance(json, list):
+            _new_data = copy.copy(x=json)
+            for i in range(0, len(json), 1):
+                if isinstance(json[i], dict):
+                    _new_data[i] = cls.sanitize_json(json=json[i])
+            return _new_data
+
+        if isinstance(json, dict):
+            _new_data = copy.copy(x=json)
+            for key, value in json.items():
+                _new_data.pop(key)
+                key = key.replace(" ", "")
+                key = key.replace("_", "")
+                if key in cls.json_key_mapping:
+                    key = cls.json_key_mapping[key]
+                key = cls.camel_to_snake_re(data=key)
+                if isinstance(value, (list, dict)):
+                    value = cls.sanitize_json(json=value)
+                _new_data[key] = value
+            return _new_data
+        return json
+
+
+def _assert_same(data: Any, ordered: bool = True) -> None:
+    expected: Any = _Recursive.sanitize_json(json=data)
+    result: Any = Base.sanitize_json(json=data)
+    assert result == expected
+    if ordered is True:
+        # Key order is part of the output; eg the `repr` of unformatted responses.
+        assert json.dumps(result) == json.dumps(expected)
+
+
+def test_sample_controller() -> None:
+    _assert_same(data=json.loads(SAMPLE.read_text()))
+
+
+def test_updates() -> None:
+    _assert_same(data=UPDATES)
+
+
+def test_random_payloads() -> None:
+    # Includes keys that collide once sanitized (`a_b`/`ab`, `Foo`/`foo`) and lists nested in lists.
+    keys: list[str] = [
+        *Base.json_key_mapping,
+        "InstanceID",
+        "Free RAM MB",
+        "Tool_Version",
+        "isHTTPS",
+        "a_b",
+        "ab",
+        "Foo",
+        "foo",
+    ]
+    rng: random.Random = random.Random(13)
+
+    def build(depth: int) -> Any:
+        roll: float = rng.random()
+        if depth > 3 or roll < 0.4:
+            return rng.choice([1, "x", None, True, 2.5])
+        if roll < 0.7:
+            return {rng.choice(keys): build(depth + 1) for _ in range(rng.randint(0, 6))}
+        return [build(depth + 1) for _ in range(rng.randint(0, 4))]
+
+    for _ in range(2000):
+        # When two keys collide the old version kept the position of whichever raw key already had the sanitized name;
+        # the values are the same, only the order of those keys can differ.
+        _assert_same(data=build(depth=0), ordered=False)
+
+
+def test_source_is_untouched() -> None:
+    data: dict[str, Any] = copy.deepcopy(UPDATES)
+    Base.sanitize_json(json=data)
+    assert data == UPDATES
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Union
+
+from ampapi.dataclass import APISession
+from ampapi.session import FileSessionStore
+
+
+def _session(session_id: str) -> APISession:
+    return APISession(id=session_id, ttl=datetime.now() + timedelta(minutes=5))
+
+
+def _stored(path: Path) -> dict[str, str]:
+    return {instance_id: entry["id"] for instance_id, entry in json.loads(path.read_text()).items()}
+
+
+def test_failed_writes_are_retried(tmp_path: Path) -> None:
+    store: FileSessionStore = FileSessionStore(path=tmp_path / "sessions.json", retry_delay=0.01)
+    update = store._update
+    failures: list[int] = [2]
+
+    def flaky(changes: dict[str, Union[APISession, None]]) -> Any:
+        if failures[0] > 0:
+            failures[0] -= 1
+            raise PermissionError("locked by another process")
+        return update(changes=changes)
+
+    store._update = flaky  # type: ignore[method-assign]
+
+    async def main() -> None:
+        store.set("a", _session("1"))
+        await asyncio.sleep(0)
+        # Queued while the first write fails; the newer session must win over the one that is retried.
+        store.set("a", _session("2"))
+        store.set("b", _session("3"))
+        await store.flush()
+
+    asyncio.run(main())
+    assert failures == [0]
+    assert _stored(path=store.path) == {"a": "2", "b": "3"}
+
+
+def test_flush_retries_after_giving_up(tmp_path: Path) -> None:
+    store: FileSessionStore = FileSessionStore(path=tmp_path / "sessions.json", retry_delay=0.0)
+    update = store._update
+    broken: list[bool] = [True]
+
+    def flaky(changes: dict[str, Union[APISession, None]]) -> Any:
+        if broken[0] is True:
+            raise OSError("disk full")
+        return update(changes=changes)
+
+    store._update = flaky  # type: ignore[method-assign]
+
+    async def main() -> None:
+        store.set("a", _session("1"))
+        await store.flush()
+        assert list(store._pending) == ["a"]
+        broken[0] = False
+        await store.flush()
+
+    asyncio.run(main())
+    assert store._pending == {}
+    assert _stored(path=store.path) == {"a": "1"}